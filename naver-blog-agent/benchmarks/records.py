@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""
+레코드 타입 벤치마크
+
+검색/수집 경로에서 게시글마다 만드는 객체를 Pydantic 모델(BlogPostMeta, BlogContent)과
+경량 레코드(PostMetaRecord, ContentRecord)로 각각 만들어 생성 속도와 건당 메모리를 비교한다.
+메모리는 tracemalloc으로 잰 객체 자체의 크기이며, 필드 값(문자열)은 미리 만들어 두고 공유한다.
+
+사용법:
+    python -m benchmarks.records
+    python -m benchmarks.records --count 100000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from src.models import BlogContent, BlogPostMeta, ContentRecord, PostMetaRecord
+
+
+def _search_items(count: int) -> List[Dict[str, str]]:
+    return [
+        {
+            "title": f"<b>연희동</b> 카페 후기 {i}",
+            "link": f"https://blog.naver.com/user{i % 500}/{220000000000 + i}",
+            "description": f"연희동 카페 방문 후기입니다 {i}",
+            "bloggername": f"블로거{i % 500}",
+            "bloggerlink": f"https://blog.naver.com/user{i % 500}",
+            "postdate": "20240101",
+        }
+        for i in range(count)
+    ]
+
+
+def _crawl_items(count: int) -> List[Dict]:
+    body = "본문 " * 500
+    return [
+        {"url": f"https://blog.naver.com/user{i % 500}/{220000000000 + i}", "title": f"제목 {i}", "content": body}
+        for i in range(count)
+    ]
+
+
+def _measure(build: Callable, items: List[Dict]) -> Dict[str, float]:
+    """생성 시간과 건당 메모리 (바이트)"""
+    gc.collect()
+    started = time.perf_counter()
+    built = [build(item) for item in items]
+    elapsed = time.perf_counter() - started
+    del built
+
+    gc.collect()
+    tracemalloc.start()
+    built = [build(item) for item in items]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built
+
+    return {"seconds": elapsed, "bytes_per_item": current / max(len(items), 1)}
+
+
+def compare(count: int = 20000) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """{"search": {"pydantic": ..., "record": ...}, "crawl": {...}}"""
+    search = _search_items(count)
+    crawl = _crawl_items(count)
+    return {
+        "search": {
+            "pydantic": _measure(lambda item: BlogPostMeta(**item), search),
+            "record": _measure(lambda item: PostMetaRecord(**item), search),
+        },
+        "crawl": {
+            "pydantic": _measure(lambda item: BlogContent(**item), crawl),
+            "record": _measure(lambda item: ContentRecord(**item), crawl),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="레코드 타입 벤치마크")
+    parser.add_argument("--count", type=int, default=50000, help="경로별 생성 객체 수")
+    args = parser.parse_args()
+
+    for path, kinds in compare(args.count).items():
+        pydantic, record = kinds["pydantic"], kinds["record"]
+        for name, m in kinds.items():
+            print(f"{path:6} {name:8} {m['seconds'] * 1e6 / args.count:7.2f}us/건 {m['bytes_per_item']:8.0f}B/건")
+        print(f"{path:6} 속도 {pydantic['seconds'] / record['seconds']:.1f}배, "
+              f"메모리 {record['bytes_per_item'] / pydantic['bytes_per_item']:.0%}")
+
+
+if __name__ == "__main__":
+    main()
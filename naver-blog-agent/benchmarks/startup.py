@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""
+기동 시간 벤치마크
+
+새 인터프리터에서 다음 두 경로의 소요 시간을 측정하고 예산 초과 시 실패한다.
+
+- `nbas search` 콜드 스타트: CLI import → 인자 파싱 → 검색 에이전트 생성까지
+- API 준비 시간: `src.api.main` import → lifespan 시작(DB 스키마 생성)까지
+
+사용법:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --repeat 5
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 예산 (초). 인터프리터 기동 시간을 포함한 값
+CLI_SEARCH_BUDGET = 1.5
+API_READY_BUDGET = 3.0
+
+# 검색 / 헬스 체크 경로에서 로드되면 안 되는 모듈
+HEAVY_MODULES = [
+    "google.generativeai",
+    "curl_cffi",
+    "playwright",
+    "bs4",
+    "feedparser",
+]
+
+_CLI_SEARCH_SNIPPET = """
+import json, sys, time
+t0 = time.perf_counter()
+from src.cli import main
+from src.services.orchestrator import get_orchestrator
+orchestrator = get_orchestrator({"client_id": "bench", "client_secret": "bench"})
+orchestrator.search_agent
+elapsed = time.perf_counter() - t0
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+_API_READY_SNIPPET = """
+import asyncio, json, sys, time
+t0 = time.perf_counter()
+from src.api.main import app, lifespan
+
+async def ready():
+    async with lifespan(app):
+        return time.perf_counter() - t0
+
+elapsed = asyncio.run(ready())
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def _run_snippet(snippet: str, env: Dict[str, str] = None) -> Dict:
+    """새 프로세스에서 코드 실행 후 결과(JSON 마지막 줄) 반환"""
+    import time
+
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", snippet],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, **(env or {})},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall = time.perf_counter() - started
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["wall"] = wall
+    return result
+
+
+def measure_cli_search() -> Dict:
+    """`nbas search` 콜드 스타트 측정"""
+    return _run_snippet(_CLI_SEARCH_SNIPPET)
+
+
+def measure_api_ready() -> Dict:
+    """API 준비 시간 측정 (임시 SQLite DB 사용)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_url = f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}"
+        return _run_snippet(_API_READY_SNIPPET, env={"DATABASE_URL": db_url})
+
+
+def heavy_modules_loaded(modules: List[str]) -> List[str]:
+    """로드된 무거운 모듈 목록"""
+    loaded = set(modules)
+    return [name for name in HEAVY_MODULES if name in loaded]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기동 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    failed = False
+    for name, measure, budget in [
+        ("nbas search", measure_cli_search, CLI_SEARCH_BUDGET),
+        ("api ready", measure_api_ready, API_READY_BUDGET),
+    ]:
+        runs = [measure() for _ in range(args.repeat)]
+        best = min(runs, key=lambda r: r["wall"])
+        heavy = heavy_modules_loaded(best["modules"])
+        ok = best["wall"] <= budget and not heavy
+        failed = failed or not ok
+
+        print(f"{name:12} wall={best['wall']:.3f}s import={best['elapsed']:.3f}s "
+              f"budget={budget:.1f}s {'OK' if ok else 'FAIL'}")
+        if heavy:
+            print(f"  불필요하게 로드된 모듈: {', '.join(heavy)}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
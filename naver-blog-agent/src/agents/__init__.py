@@ -1,7 +1,30 @@
+from typing import TYPE_CHECKING
+
 from .base import BaseAgent, AgentResult
-from .search_agent import SearchAgent
-from .crawler_agent import HybridCrawlerAgent
-from .analysis_agent import AnalysisAgent
-from .rss_agent import RSSCrawlerAgent
 
-__all__ = ["BaseAgent", "AgentResult", "SearchAgent", "HybridCrawlerAgent", "AnalysisAgent", "RSSCrawlerAgent"]
+if TYPE_CHECKING:
+    from .search_agent import SearchAgent
+    from .crawler_agent import HybridCrawlerAgent
+    from .analysis_agent import AnalysisAgent
+    from .rss_agent import RSSCrawlerAgent
+    from .local_analyzer import LocalAnalyzerAgent
+
+# 에이전트 모듈은 httpx, bs4 등 무거운 의존성을 가지므로 처음 접근할 때 import
+_LAZY_AGENTS = {
+    "SearchAgent": ".search_agent",
+    "HybridCrawlerAgent": ".crawler_agent",
+    "AnalysisAgent": ".analysis_agent",
+    "RSSCrawlerAgent": ".rss_agent",
+    "LocalAnalyzerAgent": ".local_analyzer",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_AGENTS:
+        import importlib
+        module = importlib.import_module(_LAZY_AGENTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["BaseAgent", "AgentResult", "SearchAgent", "HybridCrawlerAgent", "AnalysisAgent", "RSSCrawlerAgent", "LocalAnalyzerAgent"]
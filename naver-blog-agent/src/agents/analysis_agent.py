@@ -1,16 +1,30 @@
 import asyncio
 import json
-import re
-from typing import Dict, Any, List, Optional
+import time
+from typing import Dict, Any, List, Optional, Callable, Awaitable
 from datetime import datetime
 from loguru import logger
 
 from .base import BaseAgent, AgentResult
 from ..models import AnalysisInput, AnalysisResult, BlogContent, SentimentLabel, ContentType
 from ..core.config import get_settings
+from ..core.concurrency import get_limiter
+from ..core.llm_usage import get_llm_usage
+from ..core.metrics import REGISTRY
 
 
-ANALYSIS_PROMPT = """다음 블로그 게시글을 분석해주세요. 반드시 JSON 형식으로만 응답하세요.
+ANALYSIS_CRITERIA = """## 분석 기준
+- sentiment_score: -1.0(매우 부정) ~ 1.0(매우 긍정)
+- keywords: 주요 키워드 최대 10개와 각 키워드의 예상 언급 횟수
+- summary: 핵심 내용 3문장 이내 요약
+- is_ad: 협찬/광고 여부
+- quality_score: 1(매우 낮음) ~ 10(매우 높음)"""
+
+
+# 응답 형식은 response_schema로 강제하므로 프롬프트에는 예시를 넣지 않음
+ANALYSIS_PROMPT = """다음 블로그 게시글을 분석해주세요.
+
+""" + ANALYSIS_CRITERIA + """
 
 ## 블로그 게시글
 
@@ -19,50 +33,70 @@ ANALYSIS_PROMPT = """다음 블로그 게시글을 분석해주세요. 반드시
 URL: {url}
 
 본문:
-{content}
-
----
-
-## 응답 형식 (JSON만 출력, 다른 텍스트 없이)
-
-```json
-{{
-    "sentiment_score": 0.5,
-    "sentiment_label": "긍정",
-    "keywords": [
-        {{"keyword": "키워드1", "count": 5}},
-        {{"keyword": "키워드2", "count": 3}}
-    ],
-    "summary": "3문장 이내 요약",
-    "content_type": "후기",
-    "is_ad": false,
-    "quality_score": 7
-}}
-```
+{content}"""
 
-## 분석 기준
 
-1. **감성 분석**
-   - sentiment_score: -1.0(매우 부정) ~ 1.0(매우 긍정)
-   - sentiment_label: "매우 긍정", "긍정", "중립", "부정", "매우 부정" 중 하나
+# 여러 게시글을 한 번에 분석하는 프롬프트 (분석 기준은 요청당 한 번만 포함)
+BATCH_ANALYSIS_PROMPT = """다음 {count}개의 블로그 게시글을 각각 분석해주세요. 게시글마다 결과를 하나씩 만들고 index에는 게시글 번호를 그대로 넣으세요.
 
-2. **키워드 추출**
-   - 주요 키워드 최대 10개
-   - 각 키워드별 예상 언급 횟수
+""" + ANALYSIS_CRITERIA + """
 
-3. **콘텐츠 요약**
-   - 3문장 이내로 핵심 내용 요약
-
-4. **콘텐츠 분류**
-   - content_type: "정보 제공", "후기", "광고", "뉴스", "기타" 중 하나
-
-5. **광고성 판단**
-   - is_ad: 협찬/광고 여부 (true/false)
+## 블로그 게시글
 
-6. **품질 점수**
-   - quality_score: 1(매우 낮음) ~ 10(매우 높음)
+{posts}
+
+모든 게시글 번호({indices})의 결과를 포함하세요."""
+
+
+# Gemini 구조화 출력 스키마 (AnalysisResult에서 url, analyzed_at을 뺀 필드)
+_RESULT_PROPERTIES = {
+    "sentiment_score": {"type": "number"},
+    "sentiment_label": {"type": "string", "format": "enum", "enum": [label.value for label in SentimentLabel]},
+    "keywords": {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "properties": {"keyword": {"type": "string"}, "count": {"type": "integer"}},
+            "required": ["keyword", "count"]
+        }
+    },
+    "summary": {"type": "string"},
+    "content_type": {"type": "string", "format": "enum", "enum": [kind.value for kind in ContentType]},
+    "is_ad": {"type": "boolean"},
+    "quality_score": {"type": "integer"},
+}
+
+ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": _RESULT_PROPERTIES,
+    "required": list(_RESULT_PROPERTIES),
+}
+
+BATCH_ANALYSIS_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {"index": {"type": "integer"}, **_RESULT_PROPERTIES},
+        "required": ["index", *_RESULT_PROPERTIES],
+    },
+}
+
+LLM_RESPONSES = REGISTRY.counter(
+    "analysis_llm_responses_total",
+    "분석 LLM 응답 수 (mode: single/batch, outcome: valid/invalid/error)",
+    ["model", "mode", "outcome"]
+)
+LLM_RETRIES = REGISTRY.counter(
+    "analysis_llm_retries_total", "형식이 잘못된 응답으로 인한 분석 재요청 수", ["model", "mode"]
+)
+
+
+BATCH_POST_BLOCK = """### [{index}] {title}
+작성자: {author}
+URL: {url}
 
-JSON 형식으로만 응답하세요. 추가 설명은 넣지 마세요."""
+{content}
+"""
 
 
 class AnalysisAgent(BaseAgent):
@@ -76,7 +110,14 @@ class AnalysisAgent(BaseAgent):
             self.api_key = settings.google_api_key
 
         self.model = config.get("model", settings.gemini_model) if config else settings.gemini_model
+        self.batch_token_budget = settings.analysis_batch_token_budget
+        self.batch_max_posts = settings.analysis_batch_max_posts
+        self.batch_retries = settings.analysis_batch_retries
+        self.retries = settings.analysis_retries
         self._client = None
+        # 프로세스 내 모든 작업이 공정하게 나눠 쓰는 동시 LLM 호출 한도
+        self._llm_slots = get_limiter("llm", settings.analysis_concurrency)
+        self.usage = get_llm_usage()
 
     async def initialize(self) -> None:
         """Google Generative AI 클라이언트 초기화"""
@@ -88,6 +129,11 @@ class AnalysisAgent(BaseAgent):
         except ImportError:
             raise ImportError("google-generativeai 패키지가 필요합니다: pip install google-generativeai")
 
+    async def cleanup(self) -> None:
+        """남은 토큰 사용량 반영"""
+        await self.usage.close()
+        await super().cleanup()
+
     async def validate_input(self, input_data: AnalysisInput) -> bool:
         """입력 검증"""
         if not input_data.content:
@@ -105,29 +151,45 @@ class AnalysisAgent(BaseAgent):
         # 프롬프트 생성
         prompt = self._build_prompt(content)
 
-        # LLM 호출
-        try:
-            response = await self._call_llm(prompt)
-
-            # 응답 파싱
-            analysis = self._parse_response(response, content.url)
-
+        # LLM 호출 (형식이 잘못된 응답만 재요청, API 오류는 바로 실패)
+        for attempt in range(self.retries + 1):
+            if attempt:
+                LLM_RETRIES.inc(model=self.model, mode="single")
+            try:
+                response = await self._call_llm(prompt, ANALYSIS_SCHEMA)
+            except Exception as e:
+                LLM_RESPONSES.inc(model=self.model, mode="single", outcome="error")
+                logger.error(f"분석 실패 ({content.url}): {str(e)}")
+                return AgentResult(
+                    success=False,
+                    error=str(e),
+                    metadata={"url": content.url}
+                )
+
+            try:
+                analysis = self._parse_response(response, content.url)
+            except (json.JSONDecodeError, KeyError, ValueError, TypeError) as e:
+                LLM_RESPONSES.inc(model=self.model, mode="single", outcome="invalid")
+                logger.warning(f"응답 형식 오류 ({content.url}, 시도 {attempt + 1}): {str(e)}")
+                continue
+
+            LLM_RESPONSES.inc(model=self.model, mode="single", outcome="valid")
             return AgentResult(
                 success=True,
                 data=analysis,
                 metadata={
                     "model": self.model,
-                    "url": content.url
+                    "url": content.url,
+                    "attempts": attempt + 1
                 }
             )
 
-        except Exception as e:
-            logger.error(f"분석 실패 ({content.url}): {str(e)}")
-            return AgentResult(
-                success=False,
-                error=str(e),
-                metadata={"url": content.url}
-            )
+        # 기본값을 저장하지 않아 다음 작업에서 다시 분석됨
+        return AgentResult(
+            success=False,
+            error="분석 응답이 스키마에 맞지 않음",
+            metadata={"url": content.url, "attempts": self.retries + 1}
+        )
 
     def _build_prompt(self, content: BlogContent) -> str:
         """분석 프롬프트 생성"""
@@ -141,76 +203,51 @@ class AnalysisAgent(BaseAgent):
             content=truncated_content
         )
 
-    async def _call_llm(self, prompt: str) -> str:
-        """Google Gemini API 호출"""
-        response = await asyncio.to_thread(
-            self._client.generate_content,
-            prompt
+    async def _call_llm(self, prompt: str, schema: Dict[str, Any] = None) -> str:
+        """Google Gemini API 호출 (schema가 있으면 그 형식의 JSON으로만 응답받음)"""
+        generation_config = None
+        if schema is not None:
+            generation_config = {"response_mime_type": "application/json", "response_schema": schema}
+
+        async with self._llm_slots:
+            started = time.monotonic()
+            response = await asyncio.to_thread(
+                self._client.generate_content,
+                prompt,
+                generation_config=generation_config
+            )
+            latency = time.monotonic() - started
+
+        # 토큰 사용량은 현재 작업(흐름)에 귀속해 기록
+        usage = getattr(response, "usage_metadata", None)
+        await self.usage.record(
+            self.model,
+            prompt_tokens=getattr(usage, "prompt_token_count", 0) or 0,
+            output_tokens=getattr(usage, "candidates_token_count", 0) or 0,
+            latency=latency
         )
-
         return response.text
 
     def _parse_response(self, response: str, url: str) -> AnalysisResult:
-        """LLM 응답 파싱"""
-        try:
-            # JSON 추출 (코드 블록 제거)
-            json_match = re.search(r'```json\s*(.*?)\s*```', response, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                # 직접 JSON 파싱 시도
-                json_str = response.strip()
-                # JSON 객체만 추출
-                json_match = re.search(r'\{.*\}', json_str, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(0)
-
-            data = json.loads(json_str)
-
-            # 감성 레이블 매핑
-            sentiment_map = {
-                "매우 긍정": SentimentLabel.VERY_POSITIVE,
-                "긍정": SentimentLabel.POSITIVE,
-                "중립": SentimentLabel.NEUTRAL,
-                "부정": SentimentLabel.NEGATIVE,
-                "매우 부정": SentimentLabel.VERY_NEGATIVE,
-            }
-
-            # 콘텐츠 타입 매핑
-            content_type_map = {
-                "정보 제공": ContentType.INFO,
-                "후기": ContentType.REVIEW,
-                "광고": ContentType.AD,
-                "뉴스": ContentType.NEWS,
-                "기타": ContentType.OTHER,
-            }
-
-            return AnalysisResult(
-                url=url,
-                sentiment_score=float(data.get("sentiment_score", 0)),
-                sentiment_label=sentiment_map.get(data.get("sentiment_label", "중립"), SentimentLabel.NEUTRAL),
-                keywords=data.get("keywords", []),
-                summary=data.get("summary", ""),
-                content_type=content_type_map.get(data.get("content_type", "기타"), ContentType.OTHER),
-                is_ad=bool(data.get("is_ad", False)),
-                quality_score=int(data.get("quality_score", 5)),
-                analyzed_at=datetime.now()
-            )
-
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
-            logger.warning(f"응답 파싱 실패: {str(e)}")
-            # 기본값 반환
-            return AnalysisResult(
-                url=url,
-                sentiment_score=0.0,
-                sentiment_label=SentimentLabel.NEUTRAL,
-                keywords=[],
-                summary="분석 실패",
-                content_type=ContentType.OTHER,
-                is_ad=False,
-                quality_score=5,
-                analyzed_at=datetime.now()
-            )
+        """LLM 응답 파싱 (스키마에 맞지 않으면 예외)"""
+        data = json.loads(response)
+        if not isinstance(data, dict):
+            raise ValueError("응답이 JSON 객체가 아님")
+        return self._to_result(data, url)
+
+    def _to_result(self, data: Dict[str, Any], url: str) -> AnalysisResult:
+        """JSON 객체를 AnalysisResult로 변환 (알 수 없는 레이블이나 범위 밖 값은 ValueError)"""
+        return AnalysisResult(
+            url=url,
+            sentiment_score=float(data["sentiment_score"]),
+            sentiment_label=SentimentLabel(data["sentiment_label"]),
+            keywords=data.get("keywords", []),
+            summary=data["summary"],
+            content_type=ContentType(data["content_type"]),
+            is_ad=bool(data.get("is_ad", False)),
+            quality_score=int(data["quality_score"]),
+            analyzed_at=datetime.now()
+        )
 
     async def analyze(self, content: BlogContent) -> AgentResult[AnalysisResult]:
         """편의 메서드: 직접 분석 실행"""
@@ -233,3 +270,190 @@ class AnalysisAgent(BaseAgent):
 
         tasks = [analyze_one(c) for c in contents]
         return await asyncio.gather(*tasks)
+
+
+    # ------------------------------------------------------------------
+    # 다중 게시글 배치 분석
+    # ------------------------------------------------------------------
+
+    def _estimate_tokens(self, text: str) -> int:
+        """토큰 수 근사치 (한국어는 대략 글자당 1토큰으로 보수적으로 계산)"""
+        return len(text)
+
+    def _truncate(self, content: BlogContent) -> str:
+        """본문 길이 제한 (단건 분석과 동일한 기준)"""
+        return content.content[:8000] if content.content else ""
+
+    def _pack_batches(self, contents: List[BlogContent], indices: List[int]) -> List[List[int]]:
+        """토큰 예산과 최대 게시글 수에 맞춰 게시글 인덱스를 묶음으로 분할"""
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = self._estimate_tokens(BATCH_ANALYSIS_PROMPT)
+
+        for i in indices:
+            content = contents[i]
+            tokens = self._estimate_tokens(self._truncate(content)) + self._estimate_tokens(content.title or "") + 50
+
+            if current and (
+                current_tokens + tokens > self.batch_token_budget
+                or len(current) >= self.batch_max_posts
+            ):
+                batches.append(current)
+                current = []
+                current_tokens = self._estimate_tokens(BATCH_ANALYSIS_PROMPT)
+
+            current.append(i)
+            current_tokens += tokens
+
+        if current:
+            batches.append(current)
+
+        return batches
+
+    def _build_batch_prompt(self, contents: List[BlogContent]) -> str:
+        """배치 분석 프롬프트 생성 (게시글 번호는 묶음 내 0부터 시작)"""
+        posts = "\n".join(
+            BATCH_POST_BLOCK.format(
+                index=i,
+                title=content.title or "제목 없음",
+                author=content.author or "작성자 불명",
+                url=content.url,
+                content=self._truncate(content)
+            )
+            for i, content in enumerate(contents)
+        )
+
+        return BATCH_ANALYSIS_PROMPT.format(
+            count=len(contents),
+            posts=posts,
+            indices=", ".join(str(i) for i in range(len(contents)))
+        )
+
+    def _parse_batch_response(self, response: str, urls: List[str]) -> Dict[int, AnalysisResult]:
+        """배치 응답 파싱 - 누락되거나 형식이 잘못된 항목은 결과에서 제외"""
+        try:
+            data = json.loads(response)
+        except json.JSONDecodeError as e:
+            logger.warning(f"배치 응답 파싱 실패: {str(e)}")
+            return {}
+
+        if isinstance(data, dict):
+            data = data.get("results", [])
+        if not isinstance(data, list):
+            return {}
+
+        parsed: Dict[int, AnalysisResult] = {}
+        for item in data:
+            if not isinstance(item, dict):
+                continue
+            try:
+                index = int(item["index"])
+                if not 0 <= index < len(urls) or index in parsed:
+                    continue
+                parsed[index] = self._to_result(item, urls[index])
+            except (KeyError, ValueError, TypeError) as e:
+                logger.debug(f"배치 응답 항목 무시: {str(e)}")
+
+        return parsed
+
+    async def analyze_batched(
+        self,
+        contents: List[BlogContent],
+        concurrency: int = 5,
+        on_result: Callable[[int, AnalysisResult], None] = None,
+        on_progress: Callable[[int, int], Awaitable[None]] = None
+    ) -> List[AgentResult[AnalysisResult]]:
+        """여러 게시글을 묶어 한 요청으로 분석
+
+        누락되거나 형식이 잘못된 게시글만 다시 묶어 재시도한다.
+        반환 목록은 입력 순서와 같다. on_result(입력 위치, 결과)는 요청 하나가
+        끝날 때마다 호출된다 (작업이 중간에 취소돼도 끝난 분석을 저장하기 위함).
+        on_progress(분석된 게시글 수, 전체 게시글 수)도 요청 하나가 끝날 때마다 호출된다.
+        """
+        if not self._is_initialized:
+            await self.initialize()
+
+        results: List[Optional[AgentResult[AnalysisResult]]] = [None] * len(contents)
+        pending: List[int] = []
+
+        for i, content in enumerate(contents):
+            if not content.content:
+                results[i] = AgentResult(
+                    success=False,
+                    error="블로그 본문이 비어있습니다.",
+                    metadata={"url": content.url}
+                )
+            else:
+                pending.append(i)
+
+        if pending and not self.api_key:
+            raise ValueError("Google API 키가 필요합니다.")
+
+        semaphore = asyncio.Semaphore(concurrency)
+        request_count = 0
+
+        errors: Dict[int, str] = {}
+        analyzed: set = set()
+
+        async def report_progress() -> None:
+            if on_progress:
+                await on_progress(len(analyzed), len(contents))
+
+        async def analyze_group(group: List[int]) -> Dict[int, AnalysisResult]:
+            batch = [contents[i] for i in group]
+            async with semaphore:
+                try:
+                    response = await self._call_llm(self._build_batch_prompt(batch), BATCH_ANALYSIS_SCHEMA)
+                except Exception as e:
+                    # API 오류는 재시도하지 않음 (형식이 잘못된 응답만 재요청)
+                    LLM_RESPONSES.inc(model=self.model, mode="batch", outcome="error")
+                    logger.error(f"배치 분석 실패 ({len(batch)}개): {str(e)}")
+                    errors.update({i: str(e) for i in group})
+                    await report_progress()
+                    return {}
+                await asyncio.sleep(0.5)  # Rate limiting
+
+            parsed = self._parse_batch_response(response, [c.url for c in batch])
+            LLM_RESPONSES.inc(
+                model=self.model, mode="batch", outcome="valid" if len(parsed) == len(batch) else "invalid"
+            )
+            analyses = {group[local]: analysis for local, analysis in parsed.items()}
+            analyzed.update(analyses)
+            if on_result:
+                for i, analysis in analyses.items():
+                    on_result(i, analysis)
+            await report_progress()
+            return analyses
+
+        for attempt in range(self.batch_retries + 1):
+            if not pending:
+                break
+
+            groups = self._pack_batches(contents, pending)
+            request_count += len(groups)
+            if attempt:
+                LLM_RETRIES.inc(len(groups), model=self.model, mode="batch")
+            group_results = await asyncio.gather(*[analyze_group(g) for g in groups])
+
+            for parsed in group_results:
+                for i, analysis in parsed.items():
+                    results[i] = AgentResult(
+                        success=True,
+                        data=analysis,
+                        metadata={"model": self.model, "url": contents[i].url, "batched": True}
+                    )
+
+            pending = [i for i in pending if results[i] is None and i not in errors]
+            if pending:
+                logger.info(f"배치 분석 재시도 대상: {len(pending)}개 (시도 {attempt + 1})")
+
+        for i, result in enumerate(results):
+            if result is None:
+                results[i] = AgentResult(
+                    success=False,
+                    error=errors.get(i, "배치 응답에 결과가 없거나 형식이 잘못됨"),
+                    metadata={"url": contents[i].url}
+                )
+
+        logger.info(f"배치 분석 완료: {len(contents)}개 게시글, {request_count}회 요청")
+        return results
@@ -1,13 +1,331 @@
 import httpx
 import asyncio
-from typing import List, Tuple, Optional, Dict, Any
+import math
+import random
+import time
+from collections import OrderedDict, deque
+from html.parser import HTMLParser
+from typing import List, Tuple, Optional, Dict, Any, Set, Callable
 from datetime import datetime
 from bs4 import BeautifulSoup
 from loguru import logger
 
 from .base import BaseAgent, AgentResult
-from ..models import CrawlerInput, BlogContent
+from ..models import CrawlerInput, ContentRecord
 from ..core.config import get_settings
+from ..core.concurrency import get_limiter
+from ..core.metrics import REGISTRY
+from ..utils.helpers import extract_blog_id
+
+FETCH_METHODS = ("httpx", "curl_cffi", "playwright")
+
+CRAWL_STREAMS = REGISTRY.counter(
+    "crawler_stream_total",
+    "스트리밍 수집 종료 방식 (end: early=필요한 부분 수신 후 중단, eof=끝까지 수신, capped=최대 크기 도달)",
+    ["end"]
+)
+CRAWL_STREAM_BYTES = REGISTRY.counter("crawler_stream_bytes_total", "스트리밍 수집으로 받은 바이트 수")
+
+CRAWL_FETCHES = REGISTRY.counter(
+    "crawler_fetch_total",
+    "수집 시도 수 (method: 수집 방식, route: default/routed/probe, outcome: success/failure)",
+    ["method", "route", "outcome"]
+)
+
+
+def parse_blog_html(html: str, url: str) -> Optional[ContentRecord]:
+    """HTML에서 블로그 콘텐츠 추출
+
+    에이전트 상태를 쓰지 않는 모듈 함수라서 재파싱 작업의 프로세스 풀에서도 호출할 수 있다.
+    """
+    try:
+        soup = BeautifulSoup(html, "lxml")
+
+        # 제목 추출
+        title = None
+        og_title = soup.find("meta", property="og:title")
+        if og_title:
+            title = og_title.get("content", "")
+        elif soup.title:
+            title = soup.title.string
+
+        # 본문 추출 (네이버 블로그 구조)
+        content_text = ""
+
+        # 스마트에디터 3.0 구조
+        content_div = soup.find("div", class_="se-main-container")
+        if content_div:
+            content_text = content_div.get_text(separator="\n", strip=True)
+
+        # 구버전 에디터 구조
+        if not content_text:
+            content_div = soup.find("div", id="postViewArea")
+            if content_div:
+                content_text = content_div.get_text(separator="\n", strip=True)
+
+        # 모바일 뷰 구조
+        if not content_text:
+            content_div = soup.find("div", class_="post_ct")
+            if content_div:
+                content_text = content_div.get_text(separator="\n", strip=True)
+
+        # 이미지 URL 추출 (네이버 블로그 이미지 도메인 전체 지원)
+        images = []
+        naver_image_domains = [
+            "blogfiles.pstatic.net",
+            "postfiles.pstatic.net",
+            "mblogthumb-phinf.pstatic.net",
+            "storep-phinf.pstatic.net",
+            "dthumb.phinf.naver.net",
+            "blogfiles",  # 레거시 호환
+            "postfiles",
+            "phinf.naver.net"
+        ]
+
+        # 스마트에디터 3.0 이미지 컨테이너 우선 처리
+        se_images = soup.find_all("img", class_=lambda x: x and "se-image" in str(x))
+        for img in se_images:
+            # 여러 lazy loading 속성 순서대로 확인
+            src = (
+                img.get("data-lazy-src") or
+                img.get("data-original") or
+                img.get("data-src") or
+                img.get("src")
+            )
+            if src:
+                # 프로토콜 없는 URL 처리
+                if src.startswith("//"):
+                    src = "https:" + src
+                if any(domain in src for domain in naver_image_domains):
+                    if src not in images:
+                        images.append(src)
+
+        # 일반 이미지 태그 처리
+        for img in soup.find_all("img"):
+            # 여러 lazy loading 속성 순서대로 확인
+            src = (
+                img.get("data-lazy-src") or
+                img.get("data-original") or
+                img.get("data-src") or
+                img.get("src")
+            )
+            if src:
+                # 프로토콜 없는 URL 처리
+                if src.startswith("//"):
+                    src = "https:" + src
+                # 네이버 이미지 도메인 확인
+                if any(domain in src for domain in naver_image_domains):
+                    if src not in images:
+                        images.append(src)
+
+        # 작성자 추출
+        author = None
+        author_tag = soup.find("span", class_="nick")
+        if author_tag:
+            author = author_tag.get_text(strip=True)
+
+        if content_text:
+            return ContentRecord(
+                url=url,
+                title=title,
+                author=author,
+                content=content_text,
+                images=images[:10],  # 최대 10개
+                crawled_at=datetime.now()
+            )
+
+        return None
+
+    except Exception as e:
+        logger.debug(f"파싱 오류 ({url}): {str(e)}")
+        return None
+
+
+class MainContentScanner(HTMLParser):
+    """페이지를 받는 대로 조각 단위로 읽어 파싱에 필요한 부분이 끝났는지 판단
+
+    <head>, 본문 컨테이너(parse_blog_html과 같은 선택자), 작성자 노드(span.nick)가 모두
+    닫히면 done이 된다. 본문이 끝난 뒤 author_window 글자 안에 작성자 노드가 없으면
+    작성자 없이 done으로 본다. html은 지금까지 받은 부분이다.
+    """
+
+    CONTAINERS = (("class", "se-main-container"), ("id", "postViewArea"), ("class", "post_ct"))
+
+    def __init__(self, author_window: int = 64 * 1024):
+        super().__init__(convert_charrefs=False)
+        self.author_window = author_window
+        self.head_done = False
+        self.content_done = False
+        self.author_done = False
+        self._chunks: List[str] = []
+        self._length = 0
+        self._content_depth = 0
+        self._author_depth = 0
+        self._content_end = 0
+
+    @staticmethod
+    def _has(attrs, name: str, value: str) -> bool:
+        for key, attr in attrs:
+            if key == name and attr and (attr == value if name == "id" else value in attr.split()):
+                return True
+        return False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "body":
+            self.head_done = True
+
+        if tag == "div":
+            if self._content_depth:
+                self._content_depth += 1
+            elif not self.content_done and any(self._has(attrs, name, value) for name, value in self.CONTAINERS):
+                self._content_depth = 1
+
+        if tag == "span":
+            if self._author_depth:
+                self._author_depth += 1
+            elif not self.author_done and self._has(attrs, "class", "nick"):
+                self._author_depth = 1
+
+    def handle_endtag(self, tag):
+        if tag == "head":
+            self.head_done = True
+
+        if tag == "div" and self._content_depth:
+            self._content_depth -= 1
+            if not self._content_depth:
+                self.content_done = True
+                self._content_end = self._length
+
+        if tag == "span" and self._author_depth:
+            self._author_depth -= 1
+            if not self._author_depth:
+                self.author_done = True
+
+    def feed(self, data: str) -> None:
+        self._chunks.append(data)
+        self._length += len(data)
+        super().feed(data)
+
+    @property
+    def done(self) -> bool:
+        if not (self.head_done and self.content_done):
+            return False
+        return self.author_done or self._length - self._content_end >= self.author_window
+
+    @property
+    def html(self) -> str:
+        return "".join(self._chunks)
+
+
+class LatencyTracker:
+    """최근 성공 요청 지연시간의 백분위수 (헤징 기준 시간)"""
+
+    def __init__(self, percentile: float, initial: float, minimum: float, window: int = 200, min_samples: int = 20):
+        self.percentile = percentile
+        self.initial = initial
+        self.minimum = minimum
+        self.min_samples = min_samples
+        self._samples = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def threshold(self) -> float:
+        if len(self._samples) < self.min_samples:
+            return self.initial
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile))
+        return max(self.minimum, ordered[index])
+
+
+class HedgeBudget:
+    """헤지 요청 예산 (토큰 버킷)
+
+    1차 요청마다 ratio만큼 토큰이 쌓이고 헤지 1회에 1개를 쓴다.
+    장애로 대부분의 요청이 느려져도 추가 부하는 1차 요청의 ratio 비율로 제한된다.
+    """
+
+    def __init__(self, ratio: float, burst: float = 5.0):
+        self.ratio = ratio
+        self.burst = burst
+        self._tokens = burst
+
+    def on_request(self) -> None:
+        self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+
+class FetchRouter:
+    """블로그별로 성공한 수집 방식을 기억해 시작 단계를 고름
+
+    방식별 성공/시도 횟수를 반감기(half_life)로 감쇠시켜 오래된 기록의 영향을 줄이고,
+    httpx가 계속 실패한 블로그는 성공했던 단계에서 바로 시작한다.
+    그런 블로그도 probe_rate 확률로 httpx를 다시 시도해 회복 여부를 확인한다.
+    """
+
+    def __init__(self, half_life: float, probe_rate: float, max_blogs: int = 50000, min_attempts: float = 1.5):
+        self.half_life = half_life
+        self.probe_rate = probe_rate
+        self.max_blogs = max_blogs
+        self.min_attempts = min_attempts  # 감쇠된 시도 횟수 기준 (최근 실패 2회 ≈ 2.0)
+        # blog_id → (갱신 시각, {방식: [성공, 시도]})
+        self._stats: "OrderedDict[str, Tuple[float, Dict[str, List[float]]]]" = OrderedDict()
+
+    def _decayed(self, blog_id: str, now: float) -> Optional[Dict[str, List[float]]]:
+        entry = self._stats.get(blog_id)
+        if entry is None:
+            return None
+        updated_at, stats = entry
+        factor = math.pow(0.5, (now - updated_at) / self.half_life) if self.half_life > 0 else 1.0
+        for counts in stats.values():
+            counts[0] *= factor
+            counts[1] *= factor
+        self._stats[blog_id] = (now, stats)
+        self._stats.move_to_end(blog_id)
+        return stats
+
+    def _success_rate(self, stats: Dict[str, List[float]], method: str) -> Optional[float]:
+        successes, attempts = stats.get(method, [0.0, 0.0])
+        if attempts < 1.0:
+            return None
+        return successes / attempts
+
+    def route(self, blog_id: str) -> Tuple[str, str]:
+        """(시작 방식, 경로 종류: default/routed/probe)"""
+        stats = self._decayed(blog_id, time.monotonic()) if blog_id else None
+        if not stats:
+            return "httpx", "default"
+
+        successes, attempts = stats.get("httpx", [0.0, 0.0])
+        if attempts < self.min_attempts or successes / attempts >= 0.2:
+            return "httpx", "default"
+
+        if random.random() < self.probe_rate:
+            return "httpx", "probe"
+
+        curl_rate = self._success_rate(stats, "curl_cffi")
+        if curl_rate is None or curl_rate >= 0.5:
+            return "curl_cffi", "routed"
+        return "playwright", "routed"
+
+    def record(self, blog_id: str, method: str, success: bool) -> None:
+        if not blog_id:
+            return
+        now = time.monotonic()
+        stats = self._decayed(blog_id, now)
+        if stats is None:
+            stats = {}
+            self._stats[blog_id] = (now, stats)
+            while len(self._stats) > self.max_blogs:
+                self._stats.popitem(last=False)
+        counts = stats.setdefault(method, [0.0, 0.0])
+        counts[0] += 1.0 if success else 0.0
+        counts[1] += 1.0
 
 
 class HybridCrawlerAgent(BaseAgent):
@@ -26,6 +344,61 @@ class HybridCrawlerAgent(BaseAgent):
             "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
         }
 
+        # 같은 에이전트로 여러 작업을 동시에 실행해도 연결 풀을 공유하고,
+        # 동시 요청 한도는 프로세스 전역 슬롯을 작업별로 공정하게 나눠 씀
+        self._client: Optional[httpx.AsyncClient] = None
+        self._curl_session = None
+        self._fetch_slots = get_limiter("crawler", self.concurrency)
+
+        # 헤징: httpx 요청이 최근 지연시간 백분위수를 넘기면 curl_cffi 요청을 병렬로 시작
+        self.hedge_enabled = settings.crawler_hedge_enabled
+        self._latency = LatencyTracker(
+            percentile=settings.crawler_hedge_percentile,
+            initial=settings.crawler_hedge_initial_delay,
+            minimum=settings.crawler_hedge_min_delay
+        )
+        self._hedge_budget = HedgeBudget(settings.crawler_hedge_budget)
+
+        # 스트리밍 수집: 본문/작성자 노드를 받으면 연결을 닫아 전송량과 파싱량을 줄임
+        self.stream_enabled = settings.crawler_stream_enabled
+        self.stream_max_bytes = settings.crawler_stream_max_kb * 1024
+
+        # 원본 HTML 보관 (선택)
+        self.archive = None
+        if settings.html_archive_enabled:
+            from ..core.archive import get_html_archive
+            self.archive = get_html_archive()
+
+        # 블로그별 수집 방식 학습 (httpx가 안 되는 블로그는 바로 curl_cffi/Playwright로)
+        self.router = FetchRouter(
+            half_life=settings.crawler_route_half_life_hours * 3600,
+            probe_rate=settings.crawler_route_probe_rate
+        )
+
+    async def initialize(self) -> None:
+        """공유 HTTP 클라이언트 생성 (keep-alive 연결 재사용)"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                headers=self.headers,
+                limits=httpx.Limits(
+                    max_connections=self.concurrency,
+                    max_keepalive_connections=self.concurrency
+                )
+            )
+        await super().initialize()
+
+    async def cleanup(self) -> None:
+        """HTTP 클라이언트 정리"""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+        if self._curl_session:
+            await self._curl_session.close()
+            self._curl_session = None
+        await super().cleanup()
+
     def _to_mobile_url(self, url: str) -> str:
         """데스크톱 URL → 모바일 URL 변환"""
         return url.replace("blog.naver.com", "m.blog.naver.com")
@@ -36,9 +409,9 @@ class HybridCrawlerAgent(BaseAgent):
             raise ValueError("수집할 URL 목록이 비어있습니다.")
         return True
 
-    async def execute(self, input_data: CrawlerInput) -> AgentResult[List[BlogContent]]:
+    async def execute(self, input_data: CrawlerInput) -> AgentResult[List[ContentRecord]]:
         """하이브리드 수집 실행"""
-        results: List[BlogContent] = []
+        results: List[ContentRecord] = []
         stats = {
             "httpx_success": 0,
             "curl_success": 0,
@@ -46,32 +419,62 @@ class HybridCrawlerAgent(BaseAgent):
             "failed": 0
         }
 
+        # 블로그별 학습된 시작 단계로 분류
+        stage_urls: Dict[str, List[str]] = {method: [] for method in FETCH_METHODS}
+        routes: Dict[str, str] = {}
+        for url in input_data.urls:
+            method, route = self.router.route(extract_blog_id(url))
+            stage_urls[method].append(url)
+            routes[url] = route
+        stats["routed"] = sum(1 for route in routes.values() if route == "routed")
+
         # 1단계: HTTPX로 빠른 수집 (90% 이상 성공 예상)
-        logger.info(f"1단계: HTTPX로 {len(input_data.urls)}개 URL 수집 시작")
-        httpx_results, httpx_failed = await self._batch_fetch_httpx(input_data.urls)
+        logger.info(f"1단계: HTTPX로 {len(stage_urls['httpx'])}개 URL 수집 시작 (학습된 경로로 건너뜀 {stats['routed']}개)")
+        on_result = input_data.on_result
+        httpx_results, httpx_failed, hedged = await self._batch_fetch_httpx(stage_urls["httpx"], on_result)
         results.extend(httpx_results)
-        stats["httpx_success"] = len(httpx_results)
-        logger.info(f"HTTPX 성공: {len(httpx_results)}, 실패: {len(httpx_failed)}")
-
-        # 2단계: 실패한 URL은 curl_cffi로 재시도
-        if httpx_failed:
-            logger.info(f"2단계: curl_cffi로 {len(httpx_failed)}개 URL 재시도")
-            curl_results, curl_failed = await self._batch_fetch_curl(httpx_failed)
+        stats["hedged"] = len(hedged)
+        stats["hedge_wins"] = sum(1 for c in httpx_results if c.method == "curl_cffi")
+        stats["httpx_success"] = len(httpx_results) - stats["hedge_wins"]
+        stats["curl_success"] = stats["hedge_wins"]
+        logger.info(f"HTTPX 성공: {len(httpx_results)} (헤지 {len(hedged)}개, curl_cffi 선착 {stats['hedge_wins']}개), 실패: {len(httpx_failed)}")
+
+        for content in httpx_results:
+            self._record(content.url, content.method, True, routes)
+        for url in httpx_failed:
+            self._record(url, "httpx", False, routes)
+            if url in hedged:
+                self._record(url, "curl_cffi", False, routes)
+
+        # 2단계: 실패한 URL은 curl_cffi로 재시도 (헤지에서 이미 curl_cffi가 실패한 URL은 제외)
+        curl_failed = [url for url in httpx_failed if url in hedged] + stage_urls["playwright"]
+        retry_urls = [url for url in httpx_failed if url not in hedged] + stage_urls["curl_cffi"]
+        if retry_urls:
+            logger.info(f"2단계: curl_cffi로 {len(retry_urls)}개 URL 재시도")
+            curl_results, retry_failed = await self._batch_fetch_curl(retry_urls, on_result)
             results.extend(curl_results)
-            stats["curl_success"] = len(curl_results)
-            logger.info(f"curl_cffi 성공: {len(curl_results)}, 실패: {len(curl_failed)}")
-        else:
-            curl_failed = []
+            curl_failed.extend(retry_failed)
+            stats["curl_success"] += len(curl_results)
+            logger.info(f"curl_cffi 성공: {len(curl_results)}, 실패: {len(retry_failed)}")
+
+            for content in curl_results:
+                self._record(content.url, "curl_cffi", True, routes)
+            for url in retry_failed:
+                self._record(url, "curl_cffi", False, routes)
 
         # 3단계: 여전히 실패한 URL은 Playwright로 최종 시도
         if curl_failed:
             logger.info(f"3단계: Playwright로 {len(curl_failed)}개 URL 최종 시도")
-            pw_results = await self._batch_fetch_playwright(curl_failed)
+            pw_results = await self._batch_fetch_playwright(curl_failed, on_result)
             results.extend(pw_results)
             stats["playwright_success"] = len(pw_results)
             stats["failed"] = len(curl_failed) - len(pw_results)
             logger.info(f"Playwright 성공: {len(pw_results)}")
 
+            succeeded = {content.url for content in pw_results}
+            for url in curl_failed:
+                self._record(url, "playwright", url in succeeded, routes)
+
         success_rate = len(results) / len(input_data.urls) * 100 if input_data.urls else 0
         logger.info(f"수집 완료: {len(results)}/{len(input_data.urls)} ({success_rate:.1f}%)")
 
@@ -86,28 +489,154 @@ class HybridCrawlerAgent(BaseAgent):
             }
         )
 
-    async def _batch_fetch_httpx(self, urls: List[str]) -> Tuple[List[BlogContent], List[str]]:
-        """HTTPX로 고속 병렬 수집 (1순위)"""
-        successful: List[BlogContent] = []
+    def _record(self, url: str, method: str, success: bool, routes: Dict[str, str]) -> None:
+        """수집 결과를 블로그별 경로 학습과 지표에 반영"""
+        self.router.record(extract_blog_id(url), method, success)
+        CRAWL_FETCHES.inc(
+            method=method,
+            route=routes.get(url, "default"),
+            outcome="success" if success else "failure"
+        )
+
+    async def _archive(self, url: str, html: str, method: str) -> None:
+        """원본 HTML 보관 (파싱 실패한 응답도 보관해 나중에 재파싱)"""
+        if self.archive is None:
+            return
+        try:
+            await asyncio.to_thread(self.archive.append, url, html, method)
+        except Exception as e:
+            logger.warning(f"HTML 보관 실패 ({url}): {str(e)}")
+
+    async def _fetch_httpx_one(self, url: str) -> Optional[ContentRecord]:
+        """HTTPX로 게시글 하나 수집 (성공 시 지연시간 기록)"""
+        started = time.monotonic()
+        try:
+            end = "eof"
+            if self.stream_enabled:
+                html, end = await self._stream_page(self._to_mobile_url(url))
+            else:
+                response = await self._client.get(self._to_mobile_url(url))
+                html = response.text if response.status_code == 200 else None
+
+            if html:
+                # 재파싱에 쓸 수 있도록 끝까지 받은 페이지만 보관
+                if end == "eof":
+                    await self._archive(url, html, "httpx")
+                content = self._parse_content(html, url)
+                if content and content.content and len(content.content) > 100:
+                    self._latency.record(time.monotonic() - started)
+                    content.method = "httpx"
+                    return content
+        except Exception as e:
+            logger.debug(f"HTTPX 실패 ({url}): {str(e)}")
+        return None
+
+    async def _stream_page(self, url: str) -> Tuple[Optional[str], str]:
+        """페이지를 스트리밍으로 받아 필요한 부분까지만 반환 → (HTML, 종료 사유)
+
+        응답 조각을 MainContentScanner에 넣으며 읽고, 필요한 부분이 끝나거나 최대 크기에
+        도달하면 나머지를 받지 않고 연결을 닫는다. 원본 HTML을 보관하는 중이면 보관본이
+        잘리지 않도록 끝까지 받는다. 종료 사유는 eof/early/capped (200이 아니면 HTML은 None).
+        """
+        async with self._client.stream("GET", url) as response:
+            if response.status_code != 200:
+                return None, "eof"
+
+            scanner = MainContentScanner()
+            end = "eof"
+            async for text in response.aiter_text():
+                scanner.feed(text)
+                if scanner.done and self.archive is None:
+                    end = "early"
+                    break
+                if response.num_bytes_downloaded >= self.stream_max_bytes:
+                    end = "capped"
+                    break
+
+            CRAWL_STREAMS.inc(end=end)
+            CRAWL_STREAM_BYTES.inc(response.num_bytes_downloaded)
+            return scanner.html, end
+
+    async def _get_curl_session(self):
+        if self._curl_session is None:
+            from curl_cffi.requests import AsyncSession
+            self._curl_session = AsyncSession(impersonate="chrome120", timeout=self.timeout, headers=self.headers)
+        return self._curl_session
+
+    async def _fetch_curl_one(self, url: str) -> Optional[ContentRecord]:
+        """curl_cffi로 게시글 하나 수집"""
+        try:
+            session = await self._get_curl_session()
+            response = await session.get(self._to_mobile_url(url))
+            if response.status_code == 200:
+                await self._archive(url, response.text, "curl_cffi")
+                content = self._parse_content(response.text, url)
+                if content and content.content:
+                    content.method = "curl_cffi"
+                    return content
+        except ImportError:
+            logger.warning("curl_cffi 패키지가 설치되지 않음, 건너뜀")
+        except Exception as e:
+            logger.debug(f"curl_cffi 실패 ({url}): {str(e)}")
+        return None
+
+    async def _first_success(self, attempts: List[asyncio.Future]) -> Optional[ContentRecord]:
+        """먼저 성공한 결과를 반환하고 나머지는 취소"""
+        pending = set(attempts)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    if not attempt.cancelled() and attempt.result():
+                        return attempt.result()
+            return None
+        finally:
+            for attempt in pending:
+                attempt.cancel()
+
+    async def _fetch_hedged(self, url: str, hedged: Set[str]) -> Optional[ContentRecord]:
+        """httpx 요청이 기준 시간을 넘기면 curl_cffi 요청을 병렬로 시작해 먼저 성공한 쪽 사용"""
+        primary = asyncio.ensure_future(self._fetch_httpx_one(url))
+        if not self.hedge_enabled:
+            return await primary
+
+        self._hedge_budget.on_request()
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=self._latency.threshold())
+        except asyncio.CancelledError:
+            # asyncio.wait는 취소돼도 기다리던 요청을 취소하지 않음
+            primary.cancel()
+            raise
+        if done or not self._hedge_budget.try_spend():
+            return await primary
+
+        hedged.add(url)
+        hedge = asyncio.ensure_future(self._fetch_curl_one(url))
+        return await self._first_success([primary, hedge])
+
+    async def _batch_fetch_httpx(
+        self,
+        urls: List[str],
+        on_result: Callable[[ContentRecord], None] = None
+    ) -> Tuple[List[ContentRecord], List[str], Set[str]]:
+        """HTTPX로 고속 병렬 수집 (1순위, 느린 요청은 curl_cffi로 헤징)
+
+        Returns:
+            (성공, 실패 URL, 헤지 요청을 보낸 URL)
+        """
+        successful: List[ContentRecord] = []
         failed: List[str] = []
-        semaphore = asyncio.Semaphore(self.concurrency)
+        hedged: Set[str] = set()
 
-        async def fetch_one(url: str) -> Tuple[Optional[BlogContent], str]:
-            async with semaphore:
-                try:
-                    mobile_url = self._to_mobile_url(url)
-                    async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-                        response = await client.get(mobile_url, headers=self.headers)
-
-                        if response.status_code == 200:
-                            content = self._parse_content(response.text, url)
-                            if content and content.content and len(content.content) > 100:
-                                content.method = "httpx"
-                                return content, url
-                    return None, url
-                except Exception as e:
-                    logger.debug(f"HTTPX 실패 ({url}): {str(e)}")
-                    return None, url
+        if self._client is None:
+            await self.initialize()
+
+        async def fetch_one(url: str) -> Tuple[Optional[ContentRecord], str]:
+            async with self._fetch_slots:
+                content = await self._fetch_hedged(url, hedged)
+            if content and on_result:
+                on_result(content)
+            return content, url
 
         tasks = [fetch_one(url) for url in urls]
         results = await asyncio.gather(*tasks)
@@ -118,49 +647,43 @@ class HybridCrawlerAgent(BaseAgent):
             else:
                 failed.append(url)
 
-        return successful, failed
+        return successful, failed, hedged
 
-    async def _batch_fetch_curl(self, urls: List[str]) -> Tuple[List[BlogContent], List[str]]:
+    async def _batch_fetch_curl(
+        self,
+        urls: List[str],
+        on_result: Callable[[ContentRecord], None] = None
+    ) -> Tuple[List[ContentRecord], List[str]]:
         """curl_cffi로 봇 탐지 우회 수집 (2순위)"""
-        successful: List[BlogContent] = []
+        successful: List[ContentRecord] = []
         failed: List[str] = []
 
         try:
-            from curl_cffi import requests as curl_requests
+            import curl_cffi  # noqa: F401
         except ImportError:
             logger.warning("curl_cffi 패키지가 설치되지 않음, 건너뜀")
             return [], urls
 
         for url in urls:
-            try:
-                mobile_url = self._to_mobile_url(url)
-                response = curl_requests.get(
-                    mobile_url,
-                    impersonate="chrome120",
-                    timeout=self.timeout,
-                    headers=self.headers
-                )
-
-                if response.status_code == 200:
-                    content = self._parse_content(response.text, url)
-                    if content and content.content:
-                        content.method = "curl_cffi"
-                        successful.append(content)
-                        continue
-
-                failed.append(url)
-
-            except Exception as e:
-                logger.debug(f"curl_cffi 실패 ({url}): {str(e)}")
+            content = await self._fetch_curl_one(url)
+            if content:
+                successful.append(content)
+                if on_result:
+                    on_result(content)
+            else:
                 failed.append(url)
 
             await asyncio.sleep(0.3)  # Rate limiting
 
         return successful, failed
 
-    async def _batch_fetch_playwright(self, urls: List[str]) -> List[BlogContent]:
+    async def _batch_fetch_playwright(
+        self,
+        urls: List[str],
+        on_result: Callable[[ContentRecord], None] = None
+    ) -> List[ContentRecord]:
         """Playwright로 JS 렌더링 수집 (3순위 - 최후 수단)"""
-        results: List[BlogContent] = []
+        results: List[ContentRecord] = []
 
         try:
             from playwright.async_api import async_playwright
@@ -171,142 +694,55 @@ class HybridCrawlerAgent(BaseAgent):
         try:
             async with async_playwright() as p:
                 browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(
-                    user_agent=self.headers["User-Agent"]
-                )
-
-                for url in urls:
-                    try:
-                        page = await context.new_page()
-                        await page.goto(url, wait_until="networkidle", timeout=30000)
-
-                        html = await page.content()
-                        content = self._parse_content(html, url)
-
-                        if content and content.content:
-                            content.method = "playwright"
-                            results.append(content)
-
-                        await page.close()
-
-                    except Exception as e:
-                        logger.debug(f"Playwright 실패 ({url}): {str(e)}")
-
-                await browser.close()
+                try:
+                    context = await browser.new_context(
+                        user_agent=self.headers["User-Agent"]
+                    )
+
+                    for url in urls:
+                        page = None
+                        try:
+                            page = await context.new_page()
+                            await page.goto(url, wait_until="networkidle", timeout=30000)
+
+                            html = await page.content()
+                            await self._archive(url, html, "playwright")
+                            content = self._parse_content(html, url)
+
+                            if content and content.content:
+                                content.method = "playwright"
+                                results.append(content)
+                                if on_result:
+                                    on_result(content)
+
+                        except Exception as e:
+                            logger.debug(f"Playwright 실패 ({url}): {str(e)}")
+                        finally:
+                            if page is not None:
+                                await page.close()
+                finally:
+                    # 작업 취소 시에도 브라우저를 바로 닫아 자원 반환
+                    await browser.close()
 
         except Exception as e:
             logger.error(f"Playwright 브라우저 오류: {str(e)}")
 
         return results
 
-    def _parse_content(self, html: str, url: str) -> Optional[BlogContent]:
+    def _parse_content(self, html: str, url: str) -> Optional[ContentRecord]:
         """HTML에서 블로그 콘텐츠 추출"""
-        try:
-            soup = BeautifulSoup(html, "lxml")
-
-            # 제목 추출
-            title = None
-            og_title = soup.find("meta", property="og:title")
-            if og_title:
-                title = og_title.get("content", "")
-            elif soup.title:
-                title = soup.title.string
-
-            # 본문 추출 (네이버 블로그 구조)
-            content_text = ""
-
-            # 스마트에디터 3.0 구조
-            content_div = soup.find("div", class_="se-main-container")
-            if content_div:
-                content_text = content_div.get_text(separator="\n", strip=True)
-
-            # 구버전 에디터 구조
-            if not content_text:
-                content_div = soup.find("div", id="postViewArea")
-                if content_div:
-                    content_text = content_div.get_text(separator="\n", strip=True)
-
-            # 모바일 뷰 구조
-            if not content_text:
-                content_div = soup.find("div", class_="post_ct")
-                if content_div:
-                    content_text = content_div.get_text(separator="\n", strip=True)
-
-            # 이미지 URL 추출 (네이버 블로그 이미지 도메인 전체 지원)
-            images = []
-            naver_image_domains = [
-                "blogfiles.pstatic.net",
-                "postfiles.pstatic.net",
-                "mblogthumb-phinf.pstatic.net",
-                "storep-phinf.pstatic.net",
-                "dthumb.phinf.naver.net",
-                "blogfiles",  # 레거시 호환
-                "postfiles",
-                "phinf.naver.net"
-            ]
-
-            # 스마트에디터 3.0 이미지 컨테이너 우선 처리
-            se_images = soup.find_all("img", class_=lambda x: x and "se-image" in str(x))
-            for img in se_images:
-                # 여러 lazy loading 속성 순서대로 확인
-                src = (
-                    img.get("data-lazy-src") or
-                    img.get("data-original") or
-                    img.get("data-src") or
-                    img.get("src")
-                )
-                if src:
-                    # 프로토콜 없는 URL 처리
-                    if src.startswith("//"):
-                        src = "https:" + src
-                    if any(domain in src for domain in naver_image_domains):
-                        if src not in images:
-                            images.append(src)
-
-            # 일반 이미지 태그 처리
-            for img in soup.find_all("img"):
-                # 여러 lazy loading 속성 순서대로 확인
-                src = (
-                    img.get("data-lazy-src") or
-                    img.get("data-original") or
-                    img.get("data-src") or
-                    img.get("src")
-                )
-                if src:
-                    # 프로토콜 없는 URL 처리
-                    if src.startswith("//"):
-                        src = "https:" + src
-                    # 네이버 이미지 도메인 확인
-                    if any(domain in src for domain in naver_image_domains):
-                        if src not in images:
-                            images.append(src)
-
-            # 작성자 추출
-            author = None
-            author_tag = soup.find("span", class_="nick")
-            if author_tag:
-                author = author_tag.get_text(strip=True)
-
-            if content_text:
-                return BlogContent(
-                    url=url,
-                    title=title,
-                    author=author,
-                    content=content_text,
-                    images=images[:10],  # 최대 10개
-                    crawled_at=datetime.now()
-                )
-
-            return None
-
-        except Exception as e:
-            logger.debug(f"파싱 오류 ({url}): {str(e)}")
-            return None
-
-    async def crawl(self, urls: List[str], concurrency: int = None) -> AgentResult[List[BlogContent]]:
+        return parse_blog_html(html, url)
+
+    async def crawl(
+        self,
+        urls: List[str],
+        concurrency: int = None,
+        on_result: Callable[[ContentRecord], None] = None
+    ) -> AgentResult[List[ContentRecord]]:
         """편의 메서드: 직접 수집 실행"""
         input_data = CrawlerInput(
             urls=urls,
-            concurrency=concurrency or self.concurrency
+            concurrency=concurrency or self.concurrency,
+            on_result=on_result
         )
         return await self.run(input_data)
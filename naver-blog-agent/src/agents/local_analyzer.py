@@ -0,0 +1,289 @@
+import math
+import re
+from collections import Counter
+from typing import Dict, Any, List, Tuple
+from datetime import datetime
+from loguru import logger
+
+from .base import BaseAgent, AgentResult
+from ..models import BlogContent, AnalysisResult, PreAnalysisResult, SentimentLabel, ContentType
+from ..utils.matcher import AhoCorasick
+
+
+# 네이버 블로그 협찬/광고 고지 문구
+AD_DISCLOSURE_PHRASES = [
+    "소정의 원고료",
+    "원고료를 받아",
+    "원고료를 지원",
+    "협찬을 받아",
+    "협찬받아",
+    "협찬 받아",
+    "제품을 제공받",
+    "제품을 무상으로",
+    "무상으로 제공",
+    "서비스를 제공받",
+    "업체로부터 제공",
+    "업체로부터 지원",
+    "체험단",
+    "유료광고",
+    "유료 광고",
+    "광고를 포함",
+    "대가를 받고",
+    "수수료를 제공받",
+    "파트너스 활동",
+]
+
+POSITIVE_TERMS = [
+    "좋았", "좋아요", "좋네요", "좋습니다", "만족", "추천", "최고", "맛있", "친절", "깔끔",
+    "훌륭", "편리", "편하", "행복", "감동", "예쁘", "이쁘", "대박", "재방문", "강추",
+    "쾌적", "넓어", "저렴", "가성비", "괜찮", "기대 이상", "마음에 들",
+]
+
+NEGATIVE_TERMS = [
+    "별로", "실망", "불친절", "최악", "비싸", "불편", "아쉽", "아쉬웠", "후회", "더럽",
+    "좁아", "짜증", "불만", "비추", "비추천", "환불", "불쾌", "시끄럽", "느려", "엉망", "다시는",
+]
+
+# 뒤에 부정어가 와도 뜻이 뒤집히지 않는 표현 ("별로 안 좋다", "다시는 안 간다")
+NEGATION_IMMUNE_TERMS = {"별로", "다시는", "환불"}
+
+# 감성 표현 뒤의 부정: "맛있지 않았", "추천 안 합니다", "친절함이 없", "최고는 아니"
+_NEGATION_AFTER = re.compile(
+    r"[가-힣]{0,3}\s?(?:지|진|지는|지도)\s?(?:않|안\s|못)"
+    r"|[가-힣]{0,2}\s+(?:안|못)\s?(?:하|해|했|함|합|돼|되|가|갈)"
+    r"|[가-힣]{0,2}\s?(?:없|아니)"
+)
+# 감성 표현 앞의 짧은 부정: "안 좋았", "못 느꼈"
+_NEGATION_BEFORE = re.compile(r"(?:^|\s)(?:안|못)\s$")
+
+CONTENT_TYPE_MARKERS = {
+    ContentType.REVIEW: ["후기", "다녀왔", "방문했", "먹어봤", "써봤", "사용해", "구매했", "내돈내산", "솔직", "직접"],
+    ContentType.NEWS: ["기자", "보도", "발표했", "밝혔다", "전했다", "뉴스", "속보"],
+    ContentType.INFO: ["정보", "방법", "정리", "안내", "알아보", "총정리", "가이드", "일정", "신청"],
+}
+
+# 한국어 조사/어미 (긴 것부터 제거)
+_SUFFIXES = sorted([
+    "에서는", "으로는", "에게서", "입니다", "습니다", "했어요", "였어요", "이에요", "예요",
+    "에서", "으로", "에게", "까지", "부터", "처럼", "보다", "이나", "이랑", "하고", "이다",
+    "은", "는", "이", "가", "을", "를", "에", "로", "의", "와", "과", "도", "만", "랑",
+], key=len, reverse=True)
+
+_STOPWORDS = {
+    "그리고", "그래서", "하지만", "그런데", "정말", "너무", "진짜", "이번", "오늘", "있는",
+    "있습", "있어", "없는", "합니다", "했는데", "하는", "있다", "없다", "이런", "저런",
+    "그런", "우리", "저는", "제가", "여기", "거기", "때문", "같은", "많이", "조금",
+}
+
+_TOKEN_PATTERN = re.compile(r"[가-힣]{2,}|[A-Za-z][A-Za-z0-9]+")
+_SENTENCE_PATTERN = re.compile(r"(?<=[.!?。])\s+|\n+")
+
+
+class LocalAnalyzerAgent(BaseAgent):
+    """규칙 기반 로컬 사전 분석 에이전트
+
+    키워드 빈도, 광고 고지 문구, 감성 사전으로 LLM 없이 분석 결과를 추정하고
+    확신도를 함께 반환한다. 확신도가 낮은 게시글만 AnalysisAgent로 보낸다.
+    """
+
+    def __init__(self, config: Dict[str, Any] = None):
+        super().__init__(config)
+        self.max_keywords = config.get("max_keywords", 10) if config else 10
+        self._ad_matcher = AhoCorasick(AD_DISCLOSURE_PHRASES)
+        self._sentiment_matcher = AhoCorasick(POSITIVE_TERMS + NEGATIVE_TERMS)
+        self._positive = set(POSITIVE_TERMS)
+        self._type_matchers = {
+            content_type: AhoCorasick(markers)
+            for content_type, markers in CONTENT_TYPE_MARKERS.items()
+        }
+
+    async def validate_input(self, input_data: List[BlogContent]) -> bool:
+        """입력 검증"""
+        if not input_data:
+            raise ValueError("분석할 콘텐츠 목록이 비어있습니다.")
+        return True
+
+    async def execute(self, input_data: List[BlogContent]) -> AgentResult[List[PreAnalysisResult]]:
+        """작업의 전체 게시글을 한 번에 사전 분석"""
+        keywords = self.extract_keywords([c.content or "" for c in input_data])
+
+        results = [
+            self._analyze_one(content, post_keywords)
+            for content, post_keywords in zip(input_data, keywords)
+        ]
+
+        logger.debug(f"로컬 사전 분석 완료: {len(results)}개")
+        return AgentResult(
+            success=True,
+            data=results,
+            metadata={"total": len(results), "ads": sum(1 for r in results if r.result.is_ad)}
+        )
+
+    def _tokenize(self, text: str) -> List[str]:
+        """한국어 토큰화 (조사/어미 제거, 불용어 제외)"""
+        tokens = []
+        for token in _TOKEN_PATTERN.findall(text):
+            token = token.lower()
+            for suffix in _SUFFIXES:
+                if token.endswith(suffix) and len(token) - len(suffix) >= 2:
+                    token = token[:-len(suffix)]
+                    break
+            if token not in _STOPWORDS:
+                tokens.append(token)
+        return tokens
+
+    def extract_keywords(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """전체 게시글 대상 키워드 빈도 계산
+
+        공통 어휘 사전을 만들어 게시글별 단어 빈도(tf)와 문서 빈도(df)를
+        한 번에 구하고, tf-idf 순으로 상위 키워드를 고른다. count는 실제 출현 횟수.
+        """
+        vocabulary: Dict[str, int] = {}
+        term_counts: List[Counter] = []
+
+        for text in texts:
+            counts = Counter()
+            for token in self._tokenize(text):
+                term_id = vocabulary.setdefault(token, len(vocabulary))
+                counts[term_id] += 1
+            term_counts.append(counts)
+
+        doc_freq = [0] * len(vocabulary)
+        for counts in term_counts:
+            for term_id in counts:
+                doc_freq[term_id] += 1
+
+        terms = [None] * len(vocabulary)
+        for term, term_id in vocabulary.items():
+            terms[term_id] = term
+
+        total_docs = len(texts)
+        idf = [math.log((1 + total_docs) / (1 + df)) + 1.0 for df in doc_freq]
+
+        keywords = []
+        for counts in term_counts:
+            ranked = sorted(counts.items(), key=lambda item: (-item[1] * idf[item[0]], -item[1]))
+            keywords.append([
+                {"keyword": terms[term_id], "count": count}
+                for term_id, count in ranked[:self.max_keywords]
+            ])
+        return keywords
+
+    def _score_sentiment(self, text: str) -> Tuple[float, float]:
+        """감성 사전 기반 점수와 확신도
+
+        겹치는 표현은 가장 긴 것만 세고("불친절"의 "친절"은 제외), 부정어가 붙은
+        표현은 극성을 뒤집되 근거는 절반만 인정한다.
+        """
+        positive = negative = 0.0
+        evidence = 0.0
+        for start, term in self._sentiment_matcher.find_longest(text):
+            polarity = 1 if term in self._positive else -1
+            weight = 1.0
+            if term not in NEGATION_IMMUNE_TERMS and self._is_negated(text, start, start + len(term)):
+                polarity, weight = -polarity, 0.5
+            if polarity > 0:
+                positive += 1
+            else:
+                negative += 1
+            evidence += weight
+
+        hits = positive + negative
+        if hits == 0:
+            return 0.0, 0.3
+
+        score = (positive - negative) / hits
+        polarity = abs(score)
+        # 근거가 많고 한쪽으로 치우칠수록 확신도가 높음
+        confidence = min(1.0, evidence / 8) * (0.5 + 0.5 * polarity)
+        return score, confidence
+
+    def _is_negated(self, text: str, start: int, end: int) -> bool:
+        """감성 표현 바로 앞뒤에 부정어가 있는지"""
+        return bool(
+            _NEGATION_AFTER.match(text, end, end + 8)
+            or _NEGATION_BEFORE.search(text, max(0, start - 3), start)
+        )
+
+    def _classify(self, text: str, ad_phrases: List[str]) -> Tuple[ContentType, float]:
+        """콘텐츠 유형과 확신도"""
+        if ad_phrases:
+            return ContentType.AD, 0.95
+
+        hits = {
+            content_type: sum(matcher.count(text).values())
+            for content_type, matcher in self._type_matchers.items()
+        }
+        total = sum(hits.values())
+        if total == 0:
+            return ContentType.OTHER, 0.3
+
+        content_type, top = max(hits.items(), key=lambda item: item[1])
+        confidence = (top / total) * min(1.0, total / 3)
+        return content_type, confidence
+
+    def _label(self, score: float) -> SentimentLabel:
+        """점수 → 감성 레이블"""
+        if score >= 0.6:
+            return SentimentLabel.VERY_POSITIVE
+        if score >= 0.2:
+            return SentimentLabel.POSITIVE
+        if score > -0.2:
+            return SentimentLabel.NEUTRAL
+        if score > -0.6:
+            return SentimentLabel.NEGATIVE
+        return SentimentLabel.VERY_NEGATIVE
+
+    def _quality(self, content: BlogContent) -> int:
+        """본문 길이와 이미지 수 기반 품질 점수"""
+        length = len(content.content or "")
+        if length < 300:
+            score = 3
+        elif length < 1000:
+            score = 5
+        elif length < 3000:
+            score = 7
+        else:
+            score = 8
+        if len(content.images) >= 3:
+            score += 1
+        return min(score, 10)
+
+    def _summarize(self, text: str, max_sentences: int = 3, max_length: int = 200) -> Tuple[str, bool]:
+        """앞부분 문장을 잘라 만든 추출 요약과 요약이 본문 전체를 담는지 여부"""
+        sentences = [s.strip() for s in _SENTENCE_PATTERN.split(text) if s.strip()]
+        summary = " ".join(sentences[:max_sentences])
+        complete = len(sentences) <= max_sentences
+        if len(summary) > max_length:
+            summary = summary[:max_length - 3] + "..."
+            complete = False
+        return summary, complete
+
+    def _analyze_one(self, content: BlogContent, keywords: List[Dict[str, Any]]) -> PreAnalysisResult:
+        """게시글 하나 사전 분석"""
+        text = content.content or ""
+        ad_phrases = sorted(self._ad_matcher.count(text))
+        score, sentiment_confidence = self._score_sentiment(text)
+        content_type, type_confidence = self._classify(text, ad_phrases)
+        summary, summary_complete = self._summarize(text)
+
+        return PreAnalysisResult(
+            result=AnalysisResult(
+                url=content.url,
+                sentiment_score=round(score, 3),
+                sentiment_label=self._label(score),
+                keywords=keywords,
+                summary=summary,
+                content_type=content_type,
+                is_ad=bool(ad_phrases),
+                quality_score=self._quality(content),
+                analyzed_at=datetime.now()
+            ),
+            confidence=round(min(sentiment_confidence, type_confidence), 3),
+            ad_phrases=ad_phrases,
+            needs_summary=not summary_complete
+        )
+
+    async def pre_analyze(self, contents: List[BlogContent]) -> AgentResult[List[PreAnalysisResult]]:
+        """편의 메서드: 직접 사전 분석 실행"""
+        return await self.run(contents)
@@ -1,12 +1,14 @@
 import httpx
 import asyncio
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Set, Tuple
 from datetime import datetime, date
 from loguru import logger
 
 from .base import BaseAgent, AgentResult
-from ..models import SearchInput, BlogPostMeta
+from ..models import SearchInput, PostMetaRecord
 from ..core.config import get_settings
+from ..core.credentials import API_CALLS, NaverCredentialPool, get_credential_pool, settings_credentials
+from ..utils.helpers import canonical_post_id
 
 
 class SearchAgent(BaseAgent):
@@ -17,52 +19,55 @@ class SearchAgent(BaseAgent):
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__(config)
         settings = get_settings()
-        self.client_id = config.get("client_id") if config else None
-        self.client_secret = config.get("client_secret") if config else None
+        client_id = config.get("client_id") if config else None
+        client_secret = config.get("client_secret") if config else None
 
-        # config에 없으면 settings에서 가져오기
-        if not self.client_id:
-            self.client_id = settings.naver_client_id
-        if not self.client_secret:
-            self.client_secret = settings.naver_client_secret
+        # 설정에 없는 인증 정보를 직접 지정하면 그것만 사용, 아니면 설정의 인증 정보 풀 공유
+        if client_id and client_secret and (client_id, client_secret) not in settings_credentials():
+            self.pool = NaverCredentialPool([(client_id, client_secret)], daily_quota=settings.naver_daily_quota)
+        else:
+            self.pool = get_credential_pool()
 
         self.rate_limit = config.get("rate_limit", 10) if config else 10
         self._client: httpx.AsyncClient = None
 
     async def initialize(self) -> None:
         """HTTP 클라이언트 초기화"""
-        self._client = httpx.AsyncClient(
-            headers={
-                "X-Naver-Client-Id": self.client_id,
-                "X-Naver-Client-Secret": self.client_secret,
-            },
-            timeout=30.0
-        )
+        if self._client is None:
+            # 인증 헤더는 요청마다 풀에서 고른 인증 정보로 붙임
+            self._client = httpx.AsyncClient(timeout=30.0)
         await super().initialize()
 
     async def cleanup(self) -> None:
         """HTTP 클라이언트 정리"""
         if self._client:
             await self._client.aclose()
+            self._client = None
+        await self.pool.close()
         await super().cleanup()
 
     async def validate_input(self, input_data: SearchInput) -> bool:
         """입력 검증"""
         if not input_data.keyword:
             raise ValueError("키워드는 필수입니다.")
-        if not self.client_id or not self.client_secret:
+        if not len(self.pool):
             raise ValueError("네이버 API 인증 정보가 필요합니다.")
         return True
 
-    async def execute(self, input_data: SearchInput) -> AgentResult[List[BlogPostMeta]]:
+    async def execute(self, input_data: SearchInput) -> AgentResult[List[PostMetaRecord]]:
         """검색 실행"""
-        all_results: List[BlogPostMeta] = []
+        all_results: List[PostMetaRecord] = []
         start = 1
         display = 100  # 한 번에 최대 100개
 
         total_api_results = 0
+        pages = 0
+
+        # 모니터링 모드: 이미 본 게시글에 도달하면 페이징 중단 (sort=date 전제)
+        known_ids = set(input_data.known_ids)
+        reached_seen = False
 
-        while len(all_results) < input_data.max_results:
+        while len(all_results) < input_data.max_results and not reached_seen:
             try:
                 response = await self._call_api(
                     query=input_data.keyword,
@@ -70,22 +75,29 @@ class SearchAgent(BaseAgent):
                     display=min(display, input_data.max_results - len(all_results)),
                     sort=input_data.sort
                 )
+                pages += 1
 
                 if not response.get("items"):
                     break
 
                 total_api_results = response.get("total", 0)
 
+                items = response["items"]
+                if known_ids or input_data.since_postdate:
+                    items, reached_seen = self._take_unseen(
+                        items, known_ids, input_data.since_postdate
+                    )
+
                 # 날짜 필터링
                 filtered = self._filter_by_date(
-                    response["items"],
+                    items,
                     input_data.start_date,
                     input_data.end_date
                 )
 
-                # BlogPostMeta 객체로 변환
+                # 경량 레코드로 변환 (API 응답 시에만 BlogPostMeta로 검증)
                 for item in filtered:
-                    all_results.append(BlogPostMeta(
+                    all_results.append(PostMetaRecord(
                         title=item["title"],
                         link=item["link"],
                         description=item["description"],
@@ -114,7 +126,9 @@ class SearchAgent(BaseAgent):
             metadata={
                 "total_api_results": total_api_results,
                 "collected_count": len(all_results),
-                "keyword": input_data.keyword
+                "keyword": input_data.keyword,
+                "pages": pages,
+                "reached_seen": reached_seen
             }
         )
 
@@ -125,7 +139,7 @@ class SearchAgent(BaseAgent):
         display: int = 100,
         sort: str = "sim"
     ) -> Dict[str, Any]:
-        """네이버 검색 API 호출"""
+        """네이버 검색 API 호출 (429 응답이면 다음 인증 정보로 재시도)"""
         params = {
             "query": query,
             "start": start,
@@ -133,10 +147,52 @@ class SearchAgent(BaseAgent):
             "sort": sort
         }
 
-        response = await self._client.get(self.BASE_URL, params=params)
-        response.raise_for_status()
-
-        return response.json()
+        tried: List[str] = []
+        while True:
+            credential = await self.pool.acquire(exclude=tried)
+            if credential is None:
+                raise RuntimeError("사용 가능한 네이버 API 인증 정보가 없습니다 (일일 한도 소진 또는 대기 중)")
+
+            response = await self._client.get(self.BASE_URL, params=params, headers=credential.headers)
+            if response.status_code == 429:
+                API_CALLS.inc(credential=credential.label, outcome="rate_limited")
+                self.pool.report_rate_limited(credential, self._is_quota_exceeded(response))
+                tried.append(credential.client_id)
+                continue
+
+            API_CALLS.inc(credential=credential.label, outcome="success" if response.is_success else "error")
+            response.raise_for_status()
+            return response.json()
+
+    @staticmethod
+    def _is_quota_exceeded(response: httpx.Response) -> bool:
+        """429 응답이 일일 한도 초과(010)인지, 초당 한도 초과(012)인지"""
+        try:
+            body = response.json()
+        except ValueError:
+            return False
+        return body.get("errorCode") == "010" or "Query limit" in body.get("errorMessage", "")
+
+    def _take_unseen(
+        self,
+        items: List[Dict],
+        known_ids: Set[str],
+        since_postdate: str = None
+    ) -> Tuple[List[Dict], bool]:
+        """최신순 결과에서 이미 본 게시글 이전까지만 반환
+
+        Returns:
+            (새 게시글 목록, 기준점 도달 여부)
+        """
+        unseen = []
+        for item in items:
+            if canonical_post_id(item.get("link", "")) in known_ids:
+                return unseen, True
+            # 같은 날짜는 새 글일 수 있으므로 기준일보다 이전일 때만 중단
+            if since_postdate and item.get("postdate", "") < since_postdate:
+                return unseen, True
+            unseen.append(item)
+        return unseen, False
 
     def _filter_by_date(
         self,
@@ -171,14 +227,18 @@ class SearchAgent(BaseAgent):
         start_date: date = None,
         end_date: date = None,
         max_results: int = 100,
-        sort: str = "sim"
-    ) -> AgentResult[List[BlogPostMeta]]:
+        sort: str = "sim",
+        known_ids: List[str] = None,
+        since_postdate: str = None
+    ) -> AgentResult[List[PostMetaRecord]]:
         """편의 메서드: 직접 검색 실행"""
         input_data = SearchInput(
             keyword=keyword,
             start_date=start_date,
             end_date=end_date,
             max_results=max_results,
-            sort=sort
+            sort=sort,
+            known_ids=known_ids or [],
+            since_postdate=since_postdate
         )
         return await self.run(input_data)
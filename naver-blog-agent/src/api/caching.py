@@ -0,0 +1,67 @@
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+from ..core.config import get_settings
+from ..models import TaskResponse, TaskStatus
+from .responses import ORJSONResponse
+
+# 압축 미들웨어가 붙이는 ETag 인코딩 접미사
+_ENCODING_SUFFIXES = ("-br", "-gzip")
+
+
+def task_etag(task: Optional[TaskResponse], request: Request) -> Optional[str]:
+    """완료된 작업 결과의 strong ETag
+
+    완료된 작업의 결과는 일괄 분석/재파싱 같은 갱신이 있을 때만 바뀌고 그때마다
+    result_version이 올라가므로, 본문을 만들지 않고도 작업 ID, 완료 시각, 결과 버전,
+    요청 경로/쿼리만으로 ETag를 계산해 재검증에 바로 응답할 수 있다.
+    """
+    if task is None or task.status != TaskStatus.COMPLETED or not task.completed_at:
+        return None
+
+    query = "&".join(sorted(f"{k}={v}" for k, v in request.query_params.multi_items()))
+    key = f"{task.id}|{task.completed_at.isoformat()}|{task.result_version}|{request.url.path}|{query}"
+    return '"' + hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest() + '"'
+
+
+def _matching_tag(request: Request, etag: str) -> Optional[str]:
+    """If-None-Match 중 ETag와 일치하는 값 (압축 접미사 무시)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return etag
+        tag = candidate[2:] if candidate.startswith("W/") else candidate
+        for suffix in _ENCODING_SUFFIXES:
+            if tag.endswith(f'{suffix}"'):
+                tag = tag[:-len(suffix) - 1] + '"'
+                break
+        if tag == etag:
+            return candidate
+    return None
+
+
+def etag_matches(request: Request, etag: Optional[str]) -> bool:
+    return etag is not None and _matching_tag(request, etag) is not None
+
+
+def _cache_headers(etag: Optional[str]) -> dict:
+    if etag is None:
+        return {"Cache-Control": "no-cache"}
+    max_age = get_settings().api_cache_max_age
+    return {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+
+
+def not_modified(request: Request, etag: str) -> Response:
+    """304 응답 (클라이언트가 가진 표현의 ETag를 그대로 돌려줌)"""
+    return Response(status_code=304, headers=_cache_headers(_matching_tag(request, etag) or etag))
+
+
+def cached_json(content: Any, etag: Optional[str]) -> ORJSONResponse:
+    """ETag/Cache-Control 헤더를 붙인 JSON 응답 (ETag가 없으면 매번 재검증)"""
+    return ORJSONResponse(content, headers=_cache_headers(etag))
@@ -6,7 +6,8 @@ from loguru import logger
 from ..core.config import get_settings
 from ..services.orchestrator import get_orchestrator
 from ..utils.logger import setup_logger
-from .routes import tasks, search, analysis
+from .responses import ORJSONResponse, CompressionMiddleware
+from .routes import tasks, search, analysis, posts
 
 
 @asynccontextmanager
@@ -17,6 +18,7 @@ async def lifespan(app: FastAPI):
     setup_logger(log_level="DEBUG" if settings.debug else "INFO")
     logger.info("Starting Naver Blog Agent API...")
 
+    # DB 스키마만 준비하고 에이전트(Gemini SDK, HTTP 클라이언트)는 첫 요청 시 생성
     orchestrator = get_orchestrator()
     await orchestrator.initialize()
 
@@ -38,6 +40,15 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=ORJSONResponse,
+    )
+
+    # 응답 압축 (brotli 패키지가 있으면 br 우선)
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.api_compression_min_size,
+        gzip_level=settings.api_gzip_level,
+        brotli_quality=settings.api_brotli_quality,
     )
 
     # CORS 설정
@@ -53,6 +64,7 @@ def create_app() -> FastAPI:
     app.include_router(tasks.router, prefix="/api/v1/tasks", tags=["Tasks"])
     app.include_router(search.router, prefix="/api/v1/search", tags=["Search"])
     app.include_router(analysis.router, prefix="/api/v1/analysis", tags=["Analysis"])
+    app.include_router(posts.router, prefix="/api/v1/posts", tags=["Posts"])
 
     @app.get("/")
     async def root():
@@ -66,6 +78,14 @@ def create_app() -> FastAPI:
     async def health():
         return {"status": "healthy"}
 
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus 지표 (프로세스별)"""
+        from fastapi.responses import PlainTextResponse
+        from ..core.metrics import REGISTRY
+
+        return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
     return app
 
 
@@ -1,3 +1,3 @@
-from . import tasks, search, analysis
+from . import tasks, search, analysis, posts
 
-__all__ = ["tasks", "search", "analysis"]
+__all__ = ["tasks", "search", "analysis", "posts"]
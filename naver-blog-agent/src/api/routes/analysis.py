@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Query, HTTPException
+from fastapi.responses import StreamingResponse
 from typing import Optional
 
+from ...models import AnalysisBatchRequest
 from ...services.orchestrator import get_orchestrator
 
 router = APIRouter()
@@ -29,3 +31,24 @@ async def quick_analyze(
         "is_ad": result.is_ad,
         "quality_score": result.quality_score
     }
+
+
+@router.post("/batch")
+async def analyze_batch(request: AnalysisBatchRequest):
+    """여러 URL 일괄 분석 (NDJSON 스트리밍, 끝나는 순서대로 한 줄씩)
+
+    각 줄: {"url", "success", "result" | "error"}
+    """
+    import orjson
+
+    orchestrator = get_orchestrator()
+
+    async def lines():
+        async for item in orchestrator.analyze_urls_stream(request.urls):
+            if item["result"] is not None:
+                line = {"url": item["url"], "success": True, "result": item["result"].model_dump(mode="json")}
+            else:
+                line = {"url": item["url"], "success": False, "error": item["error"]}
+            yield orjson.dumps(line) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
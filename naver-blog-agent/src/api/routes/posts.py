@@ -0,0 +1,64 @@
+from fastapi import APIRouter, Query
+from typing import Optional
+
+router = APIRouter()
+
+
+def _normalize_date(value: Optional[str]) -> Optional[str]:
+    """YYYY-MM-DD / YYYYMMDD → YYYYMMDD (BlogPost.post_date 형식)"""
+    if not value:
+        return None
+    return value.replace("-", "")
+
+
+@router.get("/search")
+async def search_posts(
+    q: str = Query(..., min_length=1, description="검색어"),
+    task_id: Optional[str] = Query(None, description="작업 ID 필터"),
+    date_from: Optional[str] = Query(None, description="게시일 시작 (YYYY-MM-DD)"),
+    date_to: Optional[str] = Query(None, description="게시일 끝 (YYYY-MM-DD)"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0)
+):
+    """수집된 게시글 전문 검색 (네이버 API 호출 없음)"""
+    from sqlalchemy import select
+    from ...core.database import get_database, BlogPost
+    from ...core.search_index import get_search_index
+
+    db = get_database()
+    async with db.async_session() as session:
+        found = await get_search_index().search(
+            session,
+            q,
+            task_id=task_id,
+            date_from=_normalize_date(date_from),
+            date_to=_normalize_date(date_to),
+            limit=limit,
+            offset=offset
+        )
+
+        scores = dict(found["items"])
+        posts = {}
+        if scores:
+            result = await session.execute(
+                select(BlogPost)
+                .where(BlogPost.id.in_(list(scores)))
+            )
+            posts = {p.id: p for p in result.scalars().all()}
+
+        return {
+            "query": q,
+            "total": found["total"],
+            "results": [
+                {
+                    "id": post_id,
+                    "url": posts[post_id].url,
+                    "title": posts[post_id].title,
+                    "author": posts[post_id].author,
+                    "post_date": posts[post_id].post_date,
+                    "task_id": posts[post_id].task_id,
+                    "score": score
+                }
+                for post_id, score in found["items"] if post_id in posts
+            ]
+        }
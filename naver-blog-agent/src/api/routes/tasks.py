@@ -1,9 +1,11 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Request
 from typing import List, Optional
 from loguru import logger
 
+from ...core.config import get_settings
 from ...models import TaskCreate, TaskResponse, TaskStatus
 from ...services.orchestrator import get_orchestrator
+from ..caching import task_etag, etag_matches, not_modified, cached_json
 
 router = APIRouter()
 
@@ -19,6 +21,10 @@ async def create_task(
     # 작업 생성
     task = await orchestrator.create_task(task_input)
 
+    # queue 모드: DB 큐에 남겨두고 `nbas worker` 프로세스가 실행
+    if get_settings().task_execution_mode == "queue":
+        return task
+
     # 백그라운드에서 작업 실행
     background_tasks.add_task(
         orchestrator.run_task,
@@ -31,7 +37,7 @@ async def create_task(
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
-async def get_task(task_id: str):
+async def get_task(task_id: str, request: Request):
     """작업 상태 조회"""
     orchestrator = get_orchestrator()
     task = await orchestrator.get_task_status(task_id)
@@ -39,26 +45,71 @@ async def get_task(task_id: str):
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    return task
+    etag = task_etag(task, request)
+    if etag_matches(request, etag):
+        return not_modified(request, etag)
+    return cached_json(task.model_dump(), etag)
+
+
+@router.delete("/{task_id}", response_model=TaskResponse, status_code=202)
+async def cancel_task(task_id: str):
+    """작업 취소 (실행 중이면 그때까지의 결과를 저장하고 중단)"""
+    orchestrator = get_orchestrator()
+    task = await orchestrator.get_task_status(task_id)
+
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if task.status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED, TaskStatus.TIMED_OUT):
+        raise HTTPException(status_code=409, detail=f"Task already finished: {task.status.value}")
+
+    return await orchestrator.cancel_task(task_id)
+
+
+@router.get("/{task_id}/summary")
+async def get_task_summary(task_id: str, request: Request, top_n: int = 20):
+    """작업 요약 (감성 분포, 광고 비율, 콘텐츠 유형, 평균 품질, 상위 키워드)"""
+    from ...core.database import get_database
+    from ...services.aggregates import get_task_summary as load_summary
+
+    orchestrator = get_orchestrator()
+    task = await orchestrator.get_task_status(task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    etag = task_etag(task, request)
+    if etag_matches(request, etag):
+        return not_modified(request, etag)
+
+    db = get_database()
+    async with db.async_session() as session:
+        summary = await load_summary(session, task_id, top_n=top_n)
+
+    return cached_json({"status": task.status.value, **summary}, etag)
 
 
 @router.get("/{task_id}/posts")
-async def get_task_posts(task_id: str, limit: int = 100, offset: int = 0):
+async def get_task_posts(task_id: str, request: Request, limit: int = 100, offset: int = 0):
     """작업의 게시글 목록 조회"""
     from sqlalchemy import select
-    from ...core.database import get_database, BlogPost
+    from ...core.database import get_database, BlogPost, TaskPost
+
+    etag = task_etag(await get_orchestrator().get_task_status(task_id), request)
+    if etag_matches(request, etag):
+        return not_modified(request, etag)
 
     db = get_database()
     async with db.async_session() as session:
         result = await session.execute(
             select(BlogPost)
-            .where(BlogPost.task_id == task_id)
+            .join(TaskPost, TaskPost.post_id == BlogPost.id)
+            .where(TaskPost.task_id == task_id)
+            .order_by(TaskPost.rank)
             .offset(offset)
             .limit(limit)
         )
         posts = result.scalars().all()
 
-        return {
+        return cached_json({
             "task_id": task_id,
             "posts": [
                 {
@@ -67,38 +118,36 @@ async def get_task_posts(task_id: str, limit: int = 100, offset: int = 0):
                     "title": p.title,
                     "author": p.author,
                     "post_date": p.post_date,
-                    "has_content": bool(p.content)
+                    "has_content": p.has_content
                 }
                 for p in posts
             ],
             "total": len(posts)
-        }
+        }, etag)
 
 
 @router.get("/{task_id}/analyses")
-async def get_task_analyses(task_id: str, limit: int = 100, offset: int = 0):
+async def get_task_analyses(task_id: str, request: Request, limit: int = 100, offset: int = 0):
     """작업의 분석 결과 조회"""
     from sqlalchemy import select
-    from ...core.database import get_database, BlogPost, Analysis
+    from ...core.database import get_database, Analysis
+
+    etag = task_etag(await get_orchestrator().get_task_status(task_id), request)
+    if etag_matches(request, etag):
+        return not_modified(request, etag)
 
     db = get_database()
     async with db.async_session() as session:
-        # task의 posts 가져오기
-        posts_result = await session.execute(
-            select(BlogPost.id).where(BlogPost.task_id == task_id)
-        )
-        post_ids = [p[0] for p in posts_result.all()]
-
-        # analyses 가져오기
+        # 게시글은 여러 작업이 공유하므로 이 작업에서 저장한 분석만
         result = await session.execute(
             select(Analysis)
-            .where(Analysis.post_id.in_(post_ids))
+            .where(Analysis.task_id == task_id)
             .offset(offset)
             .limit(limit)
         )
         analyses = result.scalars().all()
 
-        return {
+        return cached_json({
             "task_id": task_id,
             "analyses": [
                 {
@@ -115,4 +164,4 @@ async def get_task_analyses(task_id: str, limit: int = 100, offset: int = 0):
                 for a in analyses
             ],
             "total": len(analyses)
-        }
+        }, etag)
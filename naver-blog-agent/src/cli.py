@@ -5,18 +5,20 @@ from datetime import datetime
 from loguru import logger
 
 from .core.config import get_settings
-from .services.orchestrator import get_orchestrator
-from .models import TaskCreate
 from .utils.logger import setup_logger
 
+# 오케스트레이터/모델 모듈은 명령 실행 시점에 import (cron 단발 실행의 기동 시간 단축)
+
 
 async def search_command(args):
     """검색 명령 실행"""
+    from .services.orchestrator import get_orchestrator
+
+    # 검색은 DB를 사용하지 않으므로 initialize() 생략
     orchestrator = get_orchestrator({
         "client_id": args.client_id,
         "client_secret": args.client_secret,
     })
-    await orchestrator.initialize()
 
     try:
         results = await orchestrator.quick_search(args.keyword, args.max_results)
@@ -39,10 +41,11 @@ async def search_command(args):
 
 async def analyze_command(args):
     """분석 명령 실행"""
+    from .services.orchestrator import get_orchestrator
+
     orchestrator = get_orchestrator({
         "api_key": args.api_key,
     })
-    await orchestrator.initialize()
 
     try:
         print(f"\n분석 중: {args.url}")
@@ -67,15 +70,24 @@ async def analyze_command(args):
 
 async def run_command(args):
     """전체 작업 실행"""
-    from datetime import datetime
+    from datetime import timedelta
+    from .services.orchestrator import get_orchestrator
+    from .models import TaskCreate, TaskStatus
 
     settings = get_settings()
     config = {
         "client_id": args.client_id or settings.naver_client_id,
         "client_secret": args.client_secret or settings.naver_client_secret,
-        "api_key": args.api_key or settings.anthropic_api_key,
+        "api_key": args.api_key or settings.google_api_key,
     }
 
+    if args.keywords_file:
+        await batch_run_command(args, config)
+        return
+    if not args.keyword:
+        print("키워드 또는 --keywords-file 이 필요합니다.")
+        return
+
     orchestrator = get_orchestrator(config)
     await orchestrator.initialize()
 
@@ -85,7 +97,8 @@ async def run_command(args):
             keyword=args.keyword,
             max_results=args.max_results,
             crawl_content=not args.no_crawl,
-            analyze_content=not args.no_analyze
+            analyze_content=not args.no_analyze,
+            deadline=datetime.now() + timedelta(seconds=args.timeout) if args.timeout else None
         )
 
         task = await orchestrator.create_task(task_input)
@@ -106,7 +119,10 @@ async def run_command(args):
             progress_callback=progress_callback
         )
 
-        print(f"\n=== 작업 완료 ===")
+        if result.status == TaskStatus.COMPLETED:
+            print(f"\n=== 작업 완료 ===")
+        else:
+            print(f"\n=== 작업 중단 ({result.status.value}) ===")
         print(f"검색됨: {result.total_found}개")
         print(f"수집됨: {result.total_crawled}개")
         print(f"분석됨: {result.total_analyzed}개")
@@ -116,13 +132,248 @@ async def run_command(args):
         await orchestrator.cleanup()
 
 
-async def server_command(args):
+async def batch_run_command(args, config):
+    """키워드 파일의 여러 키워드를 한 프로세스에서 실행"""
+    from .services.orchestrator import get_orchestrator
+    from .services.batch import BatchManifest, read_keywords, run_batch
+
+    keywords = read_keywords(args.keywords_file)
+    manifest = BatchManifest(args.manifest)
+    orchestrator = get_orchestrator(config)
+
+    print(f"\n배치 실행: 키워드 {len(keywords)}개 (동시 {args.parallel}개)")
+    if args.manifest:
+        print(f"진행 파일: {args.manifest}")
+
+    def on_done(keyword, entry):
+        if entry["status"] == "completed":
+            print(f"[완료] {keyword} - 검색 {entry['total_found']} / 수집 {entry['total_crawled']} / 분석 {entry['total_analyzed']}")
+        else:
+            print(f"[실패] {keyword} - {entry['error']}")
+
+    try:
+        counts = await run_batch(
+            orchestrator,
+            keywords,
+            parallel=args.parallel,
+            manifest=manifest,
+            max_results=args.max_results,
+            crawl_content=not args.no_crawl,
+            analyze_content=not args.no_analyze,
+            on_done=on_done,
+            timeout=args.timeout
+        )
+        print(f"\n=== 배치 완료 ===")
+        print(f"완료: {counts['completed']}개, 실패: {counts['failed']}개, 건너뜀: {counts['skipped']}개")
+    finally:
+        await orchestrator.cleanup()
+
+
+async def compress_command(args):
+    """기존 본문 압축 저장 마이그레이션"""
+    from .core.database import get_database
+    from .core.compression import compress_existing_content
+
+    db = get_database()
+    await db.init_db()
+
+    try:
+        count = await compress_existing_content(
+            db,
+            batch_size=args.batch_size,
+            train_dictionary=not args.no_train
+        )
+        print(f"\n압축 완료: {count}개 게시글")
+    finally:
+        await db.close()
+
+
+async def reindex_command(args):
+    """저장된 게시글 전문 검색 색인 재구축"""
+    from sqlalchemy import select
+    from sqlalchemy.orm import selectinload
+    from .core.database import get_database, BlogPost
+    from .core.search_index import get_search_index
+
+    db = get_database()
+    await db.init_db()
+    index = get_search_index()
+
+    try:
+        indexed = 0
+        offset = 0
+        while True:
+            async with db.async_session() as session:
+                result = await session.execute(
+                    select(BlogPost)
+                    .options(selectinload(BlogPost.content_blob))
+                    .order_by(BlogPost.id).offset(offset).limit(args.batch_size)
+                )
+                posts = result.scalars().all()
+                if not posts:
+                    break
+
+                indexed += await index.index_posts(session, posts)
+                await session.commit()
+                offset += len(posts)
+
+        print(f"\n색인 완료: {indexed}개 게시글")
+    finally:
+        await db.close()
+
+
+async def reparse_command(args):
+    """보관된 원본 HTML 재파싱"""
+    from .core.database import get_database
+    from .core.archive import get_html_archive
+    from .services.reparse import reparse_archive
+
+    db = get_database()
+    await db.init_db()
+    since = datetime.strptime(args.since, "%Y-%m-%d") if args.since else None
+
+    try:
+        counts = await reparse_archive(db, get_html_archive(), workers=args.workers, since=since)
+        print(f"\n재파싱 완료: 레코드 {counts['records']}개, 파싱 성공 {counts['parsed']}개, "
+              f"실패 {counts['unparsed']}개, 본문 갱신 {counts['updated']}개")
+    finally:
+        await db.close()
+
+
+async def usage_command(args):
+    """날짜/모델별 LLM 토큰 사용량과 비용이 큰 작업"""
+    from sqlalchemy import select, func
+    from .core.database import get_database, LlmUsage, SearchTask
+    from .core.llm_usage import get_llm_usage
+
+    db = get_database()
+    await db.init_db()
+
+    try:
+        rows = await get_llm_usage().daily_totals(args.days)
+        print(f"\n=== LLM 사용량 (최근 {args.days}일) ===")
+        for row in rows:
+            print(f"{row['day']} {row['model']:24} 호출 {row['calls']:>6} "
+                  f"입력 {row['prompt_tokens']:>10,} 출력 {row['output_tokens']:>9,} ${row['cost_usd']:.4f}")
+
+        async with db.async_session() as session:
+            cost = func.sum(LlmUsage.cost_usd)
+            result = await session.execute(
+                select(LlmUsage.task_id, SearchTask.keyword, func.sum(LlmUsage.calls), cost)
+                .outerjoin(SearchTask, SearchTask.id == LlmUsage.task_id)
+                .group_by(LlmUsage.task_id, SearchTask.keyword)
+                .order_by(cost.desc())
+                .limit(args.top)
+            )
+            print("\n=== 비용 상위 작업 ===")
+            for task_id, keyword, calls, total in result.all():
+                print(f"{task_id[:8]:8} {keyword or '-':30} 호출 {calls:>6} ${total:.4f}")
+    finally:
+        await db.close()
+
+
+async def bulk_analyze_command(args):
+    """작업의 미분석 게시글을 Gemini 배치 작업으로 일괄 분석"""
+    from .core.database import get_database
+    from .agents.analysis_agent import AnalysisAgent
+    from .services.bulk_analysis import BulkAnalyzer, GeminiBatchBackend
+
+    settings = get_settings()
+    db = get_database()
+    await db.init_db()
+    agent = AnalysisAgent()
+
+    try:
+        analyzer = BulkAnalyzer(
+            db,
+            agent,
+            GeminiBatchBackend(agent.api_key),
+            work_dir=settings.analysis_bulk_dir,
+            poll_interval=args.poll_interval or settings.analysis_bulk_poll_interval,
+            price_factor=settings.analysis_bulk_price_factor
+        )
+        counts = await analyzer.run(args.task_id)
+        print(f"\n일괄 분석 완료: 요청 {counts['requests']}개, 저장 {counts['saved']}개, "
+              f"형식 오류 {counts['invalid']}개, 실패 {counts['failed']}개")
+    finally:
+        await agent.cleanup()
+        await db.close()
+
+
+async def worker_command(args):
+    """DB 작업 큐 워커 실행"""
+    import signal
+    from .services.orchestrator import get_orchestrator
+    from .services.task_queue import TaskWorker
+
+    orchestrator = get_orchestrator()
+    worker = TaskWorker(orchestrator, concurrency=args.concurrency, worker_id=args.worker_id)
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except NotImplementedError:
+            pass
+
+    try:
+        await worker.run()
+    finally:
+        await orchestrator.cleanup()
+
+
+async def monitor_command(args):
+    """키워드 모니터 관리/스케줄러 실행"""
+    import signal
+    from .services.orchestrator import get_orchestrator
+    from .services.monitor import MonitorScheduler, create_monitor, list_monitors, delete_monitor
+
+    orchestrator = get_orchestrator()
+    await orchestrator.initialize()
+
+    try:
+        if args.monitor_command == "add":
+            monitor = await create_monitor(orchestrator.db, args.keyword, args.cron, args.max_results)
+            print(f"\n모니터 등록: {monitor.id}")
+            print(f"키워드: {monitor.keyword} / 일정: {monitor.cron} / 다음 실행: {monitor.next_run_at}")
+
+        elif args.monitor_command == "list":
+            monitors = await list_monitors(orchestrator.db)
+            print(f"\n=== 모니터 {len(monitors)}개 ===")
+            for monitor in monitors:
+                state = "활성" if monitor.enabled else "중지"
+                print(f"{monitor.id}  [{state}] {monitor.keyword}  '{monitor.cron}'  다음: {monitor.next_run_at}")
+
+        elif args.monitor_command == "remove":
+            removed = await delete_monitor(orchestrator.db, args.monitor_id)
+            print("\n삭제 완료" if removed else f"\n모니터 없음: {args.monitor_id}")
+
+        elif args.monitor_command == "run":
+            scheduler = MonitorScheduler(orchestrator)
+            if args.once:
+                task_ids = await scheduler.run_due()
+                print(f"\n실행한 모니터 작업: {len(task_ids)}개")
+                return
+
+            loop = asyncio.get_running_loop()
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.add_signal_handler(sig, scheduler.stop)
+                except NotImplementedError:
+                    pass
+            await scheduler.run()
+    finally:
+        await orchestrator.cleanup()
+
+
+def server_command(args):
     """API 서버 시작"""
     import uvicorn
 
     print(f"\n=== Naver Blog Agent API Server ===")
     print(f"Host: {args.host}")
     print(f"Port: {args.port}")
+    print(f"Workers: {args.workers}")
     print(f"Docs: http://{args.host}:{args.port}/docs")
     print()
 
@@ -130,7 +381,8 @@ async def server_command(args):
         "src.api.main:app",
         host=args.host,
         port=args.port,
-        reload=args.reload
+        reload=args.reload,
+        workers=None if args.reload else args.workers
     )
 
 
@@ -153,23 +405,74 @@ def main():
     # analyze 명령
     analyze_parser = subparsers.add_parser("analyze", help="블로그 분석")
     analyze_parser.add_argument("url", help="분석할 블로그 URL")
-    analyze_parser.add_argument("--api-key", help="Anthropic API Key")
+    analyze_parser.add_argument("--api-key", help="Google API Key")
 
     # run 명령
     run_parser = subparsers.add_parser("run", help="전체 작업 실행")
-    run_parser.add_argument("keyword", help="검색 키워드")
+    run_parser.add_argument("keyword", nargs="?", help="검색 키워드")
+    run_parser.add_argument("--keywords-file", help="키워드 파일 (한 줄에 하나, '-'이면 표준 입력)")
+    run_parser.add_argument("--parallel", type=int, default=4, help="동시에 실행할 키워드 수 (--keywords-file)")
+    run_parser.add_argument("--manifest", help="진행 상황 파일, 중단 후 재실행 시 완료된 키워드 건너뜀 (--keywords-file)")
     run_parser.add_argument("-n", "--max-results", type=int, default=100, help="최대 결과 수")
     run_parser.add_argument("--no-crawl", action="store_true", help="콘텐츠 수집 건너뛰기")
     run_parser.add_argument("--no-analyze", action="store_true", help="분석 건너뛰기")
+    run_parser.add_argument("--timeout", type=float, help="제한 시간(초), 넘기면 그때까지의 결과만 저장하고 중단 (--keywords-file이면 키워드마다)")
     run_parser.add_argument("--client-id", help="네이버 API Client ID")
     run_parser.add_argument("--client-secret", help="네이버 API Client Secret")
-    run_parser.add_argument("--api-key", help="Anthropic API Key")
+    run_parser.add_argument("--api-key", help="Google API Key")
+
+    # compress-content 명령
+    compress_parser = subparsers.add_parser("compress-content", help="기존 본문을 압축 저장으로 이전")
+    compress_parser.add_argument("--batch-size", type=int, default=500, help="한 번에 처리할 게시글 수")
+    compress_parser.add_argument("--no-train", action="store_true", help="zstd 사전 학습 건너뛰기")
+
+    # reindex 명령
+    reindex_parser = subparsers.add_parser("reindex", help="전문 검색 색인 재구축")
+    reindex_parser.add_argument("--batch-size", type=int, default=500, help="한 번에 처리할 게시글 수")
+
+    # reparse 명령
+    reparse_parser = subparsers.add_parser("reparse", help="보관된 원본 HTML을 현재 추출기로 재파싱 (HTML_ARCHIVE_ENABLED)")
+    reparse_parser.add_argument("-w", "--workers", type=int, default=4, help="파싱 프로세스 수")
+    reparse_parser.add_argument("--since", help="이 날짜 이후 수집분만 (YYYY-MM-DD)")
+
+    # bulk-analyze 명령
+    bulk_parser = subparsers.add_parser("bulk-analyze", help="작업의 미분석 게시글을 배치 작업으로 일괄 분석 (대량 백필용)")
+    bulk_parser.add_argument("task_id", help="작업 ID (예: nbas run --no-analyze로 수집한 작업)")
+    bulk_parser.add_argument("--poll-interval", type=float, help="완료 확인 주기 (초, 기본: ANALYSIS_BULK_POLL_INTERVAL)")
+
+    # usage 명령
+    usage_parser = subparsers.add_parser("usage", help="LLM 토큰 사용량/비용 조회")
+    usage_parser.add_argument("--days", type=int, default=7, help="조회 기간 (일)")
+    usage_parser.add_argument("--top", type=int, default=10, help="비용 상위 작업 수")
 
     # server 명령
     server_parser = subparsers.add_parser("server", help="API 서버 시작")
     server_parser.add_argument("--host", default="0.0.0.0", help="호스트")
     server_parser.add_argument("--port", type=int, default=8000, help="포트")
     server_parser.add_argument("--reload", action="store_true", help="자동 리로드")
+    server_parser.add_argument("--workers", type=int, default=1, help="API 워커 프로세스 수")
+
+    # worker 명령
+    worker_parser = subparsers.add_parser("worker", help="작업 큐 워커 실행 (TASK_EXECUTION_MODE=queue)")
+    worker_parser.add_argument("-c", "--concurrency", type=int, default=2, help="동시 실행 작업 수")
+    worker_parser.add_argument("--worker-id", help="워커 식별자 (기본: 호스트명:PID)")
+
+    # monitor 명령
+    monitor_parser = subparsers.add_parser("monitor", help="키워드 모니터링 (새 게시글만 주기적으로 수집)")
+    monitor_subparsers = monitor_parser.add_subparsers(dest="monitor_command", required=True)
+
+    monitor_add_parser = monitor_subparsers.add_parser("add", help="모니터 등록")
+    monitor_add_parser.add_argument("keyword", help="검색 키워드")
+    monitor_add_parser.add_argument("--cron", default="0 * * * *", help="실행 일정 (cron 5필드, 기본: 매시 정각)")
+    monitor_add_parser.add_argument("-n", "--max-results", type=int, default=100, help="실행당 최대 결과 수")
+
+    monitor_subparsers.add_parser("list", help="모니터 목록")
+
+    monitor_remove_parser = monitor_subparsers.add_parser("remove", help="모니터 삭제")
+    monitor_remove_parser.add_argument("monitor_id", help="모니터 ID")
+
+    monitor_run_parser = monitor_subparsers.add_parser("run", help="모니터 스케줄러 실행")
+    monitor_run_parser.add_argument("--once", action="store_true", help="실행 시각이 된 모니터만 한 번 실행하고 종료")
 
     args = parser.parse_args()
 
@@ -186,6 +489,13 @@ def main():
             "search": search_command,
             "analyze": analyze_command,
             "run": run_command,
+            "compress-content": compress_command,
+            "reindex": reindex_command,
+            "reparse": reparse_command,
+            "bulk-analyze": bulk_analyze_command,
+            "usage": usage_command,
+            "worker": worker_command,
+            "monitor": monitor_command,
         }
 
         if args.command in command_map:
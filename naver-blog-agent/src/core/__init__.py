@@ -1,5 +1,22 @@
+from typing import TYPE_CHECKING
+
 from .config import Settings, get_settings
-from .database import Database, get_database, Base, Project, SearchTask, BlogPost, Analysis
+
+if TYPE_CHECKING:
+    from .database import (
+        Database, get_database, Base, Project, SearchTask, BlogPost, Analysis, PostSignatureBand,
+        BlogPostContent, AnalysisKeyword, TaskAggregate, TaskKeywordCount, KeywordWatermark, Monitor, TaskPost, NaverApiUsage,
+        LlmUsage,
+    )
+
+
+# database 모듈은 SQLAlchemy를 불러오므로 DB가 필요한 시점까지 import 지연
+def __getattr__(name: str):
+    if name in __all__ and name not in ("Settings", "get_settings"):
+        from . import database
+        return getattr(database, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "Settings",
@@ -11,4 +28,14 @@ __all__ = [
     "SearchTask",
     "BlogPost",
     "Analysis",
+    "PostSignatureBand",
+    "BlogPostContent",
+    "AnalysisKeyword",
+    "TaskAggregate",
+    "TaskKeywordCount",
+    "KeywordWatermark",
+    "Monitor",
+    "TaskPost",
+    "NaverApiUsage",
+    "LlmUsage",
 ]
@@ -0,0 +1,129 @@
+import gzip
+import json
+import os
+import threading
+import uuid
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+from loguru import logger
+
+from .config import get_settings
+from ..utils.helpers import canonical_post_id
+
+SEGMENT_SUFFIX = ".warc.gz"
+INDEX_SUFFIX = ".idx"
+
+
+def build_record(url: str, html: str, method: str, fetched_at: datetime) -> bytes:
+    """WARC response 형식 레코드 하나 (gzip member 단위로 압축)"""
+    payload = html.encode("utf-8")
+    headers = [
+        "WARC/1.1",
+        "WARC-Type: response",
+        f"WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>",
+        f"WARC-Date: {fetched_at.isoformat(timespec='seconds')}",
+        f"WARC-Target-URI: {url}",
+        f"X-Post-Id: {canonical_post_id(url)}",
+        f"X-Fetch-Method: {method}",
+        "Content-Type: text/html; charset=utf-8",
+        f"Content-Length: {len(payload)}",
+    ]
+    block = "\r\n".join(headers).encode("utf-8") + b"\r\n\r\n" + payload + b"\r\n\r\n"
+    return gzip.compress(block, compresslevel=6)
+
+
+def parse_record(data: bytes) -> Tuple[Dict[str, str], str]:
+    """압축된 레코드 → (헤더, HTML)"""
+    block = gzip.decompress(data)
+    head, _, rest = block.partition(b"\r\n\r\n")
+    headers = {}
+    for line in head.decode("utf-8").split("\r\n")[1:]:
+        name, _, value = line.partition(": ")
+        headers[name] = value
+    length = int(headers.get("Content-Length", len(rest)))
+    return headers, rest[:length].decode("utf-8", errors="replace")
+
+
+def read_record(path: str, offset: int, length: int) -> Tuple[Dict[str, str], str]:
+    with open(path, "rb") as f:
+        f.seek(offset)
+        return parse_record(f.read(length))
+
+
+class HtmlArchive:
+    """수집한 원본 HTML 보관소 (추가 전용)
+
+    레코드마다 별도 gzip member로 압축해 세그먼트 파일에 이어 쓰므로 파일 전체는
+    일반 .warc.gz로 읽을 수 있고, 색인(.idx, JSON lines)의 오프셋으로 레코드 하나만
+    바로 읽을 수도 있다. 세그먼트 이름에 PID가 들어가 여러 프로세스가 동시에 써도 된다.
+    """
+
+    def __init__(self, directory: str, segment_bytes: int = 256 * 1024 * 1024):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self._lock = threading.Lock()
+        self._segment_path: Optional[str] = None
+        self._segment_size = 0
+
+    def _rotate(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        name = f"pages-{datetime.now():%Y%m%d%H%M%S}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self._segment_path = os.path.join(self.directory, name + SEGMENT_SUFFIX)
+        self._segment_size = 0
+        logger.debug(f"HTML 보관 세그먼트 생성: {self._segment_path}")
+
+    def append(self, url: str, html: str, method: str, fetched_at: datetime = None) -> None:
+        """원본 HTML 레코드 추가 (블로킹, 이벤트 루프에서는 스레드로 호출)"""
+        fetched_at = fetched_at or datetime.now()
+        record = build_record(url, html, method, fetched_at)
+        entry = {
+            "post_id": canonical_post_id(url),
+            "url": url,
+            "fetched_at": fetched_at.isoformat(timespec="seconds"),
+            "method": method,
+            "length": len(record),
+        }
+
+        with self._lock:
+            if self._segment_path is None or self._segment_size >= self.segment_bytes:
+                self._rotate()
+            with open(self._segment_path, "ab") as f:
+                entry["offset"] = f.tell()
+                f.write(record)
+            with open(self._segment_path[:-len(SEGMENT_SUFFIX)] + INDEX_SUFFIX, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._segment_size = entry["offset"] + len(record)
+
+    def iter_index(self) -> Iterator[Dict]:
+        """모든 세그먼트의 색인 항목 (segment 경로 포함)"""
+        if not os.path.isdir(self.directory):
+            return
+        for name in sorted(os.listdir(self.directory)):
+            if not name.endswith(INDEX_SUFFIX):
+                continue
+            segment = os.path.join(self.directory, name[:-len(INDEX_SUFFIX)] + SEGMENT_SUFFIX)
+            with open(os.path.join(self.directory, name), encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        yield {**json.loads(line), "segment": segment}
+
+    def latest_records(self, since: datetime = None) -> List[Dict]:
+        """게시글별 가장 최근 레코드 (since 이후 수집분만)"""
+        latest: Dict[str, Dict] = {}
+        for entry in self.iter_index():
+            if since and entry["fetched_at"] < since.isoformat(timespec="seconds"):
+                continue
+            current = latest.get(entry["post_id"])
+            if current is None or entry["fetched_at"] >= current["fetched_at"]:
+                latest[entry["post_id"]] = entry
+        return list(latest.values())
+
+
+@lru_cache()
+def get_html_archive() -> HtmlArchive:
+    settings = get_settings()
+    return HtmlArchive(
+        settings.html_archive_dir,
+        segment_bytes=settings.html_archive_segment_mb * 1024 * 1024
+    )
@@ -0,0 +1,127 @@
+import os
+from functools import lru_cache
+from typing import List
+from loguru import logger
+
+from .config import get_settings
+
+CODEC_ZSTD = "zstd"
+
+
+def _import_zstd():
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        raise ImportError("zstandard 패키지가 필요합니다: pip install zstandard")
+
+
+class ContentCodec:
+    """블로그 본문 압축/해제 (zstd + 한국어 블로그 본문으로 학습한 사전)"""
+
+    def __init__(self, level: int = 10, dictionary_path: str = None):
+        self.level = level
+        self.dictionary_path = dictionary_path
+        self._zstd = _import_zstd()
+        self._dictionary = None
+        self.dict_id = 0
+
+        if dictionary_path and os.path.exists(dictionary_path):
+            with open(dictionary_path, "rb") as f:
+                self._dictionary = self._zstd.ZstdCompressionDict(f.read())
+            self.dict_id = self._dictionary.dict_id()
+            logger.debug(f"zstd 사전 로드: {dictionary_path} (id={self.dict_id})")
+
+    def compress(self, text: str) -> bytes:
+        compressor = self._zstd.ZstdCompressor(level=self.level, dict_data=self._dictionary)
+        return compressor.compress(text.encode("utf-8"))
+
+    def decompress(self, data: bytes, dict_id: int = 0) -> str:
+        if dict_id and dict_id != self.dict_id:
+            raise ValueError(f"zstd 사전이 일치하지 않습니다 (필요: {dict_id}, 로드됨: {self.dict_id})")
+        decompressor = self._zstd.ZstdDecompressor(dict_data=self._dictionary if dict_id else None)
+        return decompressor.decompress(data).decode("utf-8")
+
+    def train_dictionary(self, samples: List[str], dict_size: int = 112640) -> int:
+        """본문 샘플로 사전 학습 후 저장, 이후 압축에 사용"""
+        encoded = [s.encode("utf-8") for s in samples if s]
+        dictionary = self._zstd.train_dictionary(dict_size, encoded)
+
+        if self.dictionary_path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.dictionary_path)), exist_ok=True)
+            with open(self.dictionary_path, "wb") as f:
+                f.write(dictionary.as_bytes())
+
+        self._dictionary = dictionary
+        self.dict_id = dictionary.dict_id()
+        logger.info(f"zstd 사전 학습 완료: 샘플 {len(encoded)}개, id={self.dict_id}")
+        return self.dict_id
+
+
+@lru_cache()
+def get_content_codec() -> ContentCodec:
+    settings = get_settings()
+    return ContentCodec(
+        level=settings.content_compression_level,
+        dictionary_path=settings.content_dictionary_path
+    )
+
+
+async def compress_existing_content(
+    db,
+    batch_size: int = 500,
+    train_dictionary: bool = True,
+    sample_size: int = 2000
+) -> int:
+    """기존 평문 본문을 압축 테이블로 이전 (마이그레이션)
+
+    Returns:
+        압축한 게시글 수
+    """
+    from sqlalchemy import select, func
+    from .database import BlogPost
+
+    codec = get_content_codec()
+
+    async with db.async_session() as session:
+        # 이미 사전이 있으면 재학습하지 않음 (기존 압축 행의 dict_id가 무효화되므로)
+        if train_dictionary and not codec.dict_id:
+            result = await session.execute(
+                select(BlogPost._content)
+                .where(BlogPost._content.isnot(None))
+                .order_by(func.random())
+                .limit(sample_size)
+            )
+            samples = [row[0] for row in result.all()]
+            if len(samples) >= 10:
+                codec.train_dictionary(samples)
+            else:
+                logger.warning(f"사전 학습 샘플 부족 ({len(samples)}개), 사전 없이 압축")
+
+    compressed = 0
+    while True:
+        async with db.async_session() as session:
+            result = await session.execute(
+                select(BlogPost)
+                .where(BlogPost._content.isnot(None))
+                .limit(batch_size)
+            )
+            posts = result.scalars().all()
+            if not posts:
+                break
+
+            for post in posts:
+                post.set_content(post._content, compress=True)
+
+            await session.commit()
+            compressed += len(posts)
+            logger.info(f"본문 압축 진행: {compressed}개")
+
+    # SQLite는 VACUUM 해야 파일 크기가 줄어든다
+    if db.engine.dialect.name == "sqlite" and compressed:
+        async with db.engine.connect() as conn:
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.exec_driver_sql("VACUUM")
+
+    return compressed
+
@@ -0,0 +1,163 @@
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Deque, Dict, List, Optional, Tuple
+
+from .metrics import REGISTRY
+
+SLOTS_IN_USE = REGISTRY.gauge(
+    "concurrency_slots_in_use", "사용 중인 동시 실행 슬롯", ["limiter"]
+)
+SLOTS_WAITING = REGISTRY.gauge(
+    "concurrency_waiting", "슬롯을 기다리는 요청 수", ["limiter", "lane"]
+)
+SLOT_WAIT_SECONDS = REGISTRY.histogram(
+    "concurrency_wait_seconds", "슬롯 대기 시간 (초)", ["limiter", "lane"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+)
+
+DEFAULT_FLOW = "default"
+
+# 현재 실행 흐름 (작업 ID 등, 가중치)과 우선 레인 여부. 태스크를 만들 때 복사되므로
+# 작업 안에서 gather로 띄운 요청도 같은 흐름으로 계산된다.
+_flow: ContextVar[Tuple[str, float]] = ContextVar("concurrency_flow", default=(DEFAULT_FLOW, 1.0))
+_priority: ContextVar[bool] = ContextVar("concurrency_priority", default=False)
+
+
+@contextmanager
+def flow(flow_id: str, weight: float = 1.0, priority: bool = False):
+    """이 블록에서 요청하는 슬롯을 flow_id 몫으로 계산 (priority=True면 우선 레인)"""
+    flow_token = _flow.set((flow_id, weight))
+    priority_token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(priority_token)
+        _flow.reset(flow_token)
+
+
+def current_flow() -> str:
+    return _flow.get()[0]
+
+
+class FairShareLimiter:
+    """여러 작업이 나눠 쓰는 프로세스 전역 동시 실행 슬롯 (가중 공정 큐잉)
+
+    슬롯이 비면 우선 레인(빠른 분석 같은 대화형 요청)을 먼저 처리하고, 나머지는
+    흐름(작업)별 가상 완료 시각이 가장 이른 요청에 준다. 큰 작업이 요청을 많이 쌓아도
+    다른 작업은 가중치 비율만큼 차례를 받는다. 우선 레인은 priority_reserve개의 슬롯을
+    더 쓸 수 있어 일반 요청이 슬롯을 모두 잡고 있어도 기다리지 않는다.
+    """
+
+    def __init__(self, name: str, capacity: int, priority_reserve: int = 0):
+        self.name = name
+        self.capacity = capacity
+        self.priority_reserve = priority_reserve
+        self._in_use = 0
+        self._priority_waiters: Deque[asyncio.Future] = deque()
+        self._queue: List[Tuple[float, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._virtual_time = 0.0
+        self._last_finish: Dict[str, float] = {}
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    def _update_gauges(self) -> None:
+        SLOTS_IN_USE.set(self._in_use, limiter=self.name)
+        SLOTS_WAITING.set(sum(1 for f in self._priority_waiters if not f.done()), limiter=self.name, lane="priority")
+        SLOTS_WAITING.set(sum(1 for _, _, f in self._queue if not f.done()), limiter=self.name, lane="fair")
+
+    def _finish_tag(self, flow_id: str, weight: float) -> float:
+        tag = max(self._virtual_time, self._last_finish.get(flow_id, 0.0)) + 1.0 / max(weight, 1e-6)
+        self._last_finish[flow_id] = tag
+        return tag
+
+    def _grant(self, future: asyncio.Future) -> bool:
+        # 이미 취소됐거나 다른 이벤트 루프(종료된 루프)의 대기자는 건너뜀
+        if future.done() or future.get_loop().is_closed():
+            return False
+        future.set_result(None)
+        self._in_use += 1
+        return True
+
+    def _wake(self) -> None:
+        while self._priority_waiters and self._in_use < self.capacity + self.priority_reserve:
+            self._grant(self._priority_waiters.popleft())
+
+        while self._queue and self._in_use < self.capacity:
+            tag, _, future = heapq.heappop(self._queue)
+            if self._grant(future):
+                self._virtual_time = tag
+
+        # 가상 시각보다 앞선 흐름 기록은 없는 것과 같으므로 정리
+        if len(self._last_finish) > 1024:
+            self._last_finish = {k: v for k, v in self._last_finish.items() if v > self._virtual_time}
+
+    async def acquire(self) -> None:
+        priority = _priority.get()
+        lane = "priority" if priority else "fair"
+
+        if priority:
+            if not self._priority_waiters and self._in_use < self.capacity + self.priority_reserve:
+                self._in_use += 1
+                self._update_gauges()
+                return
+        elif not self._priority_waiters and not self._queue and self._in_use < self.capacity:
+            self._in_use += 1
+            self._update_gauges()
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        if priority:
+            self._priority_waiters.append(future)
+        else:
+            flow_id, weight = _flow.get()
+            heapq.heappush(self._queue, (self._finish_tag(flow_id, weight), next(self._sequence), future))
+        self._update_gauges()
+
+        started = time.monotonic()
+        try:
+            await future
+        except asyncio.CancelledError:
+            # 슬롯을 받은 직후 취소됐으면 반환
+            if future.done() and not future.cancelled():
+                self.release()
+            else:
+                future.cancel()
+                self._update_gauges()
+            raise
+        SLOT_WAIT_SECONDS.observe(time.monotonic() - started, limiter=self.name, lane=lane)
+        self._update_gauges()
+
+    def release(self) -> None:
+        self._in_use -= 1
+        self._wake()
+        self._update_gauges()
+
+    async def __aenter__(self) -> "FairShareLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+
+_limiters: Dict[str, FairShareLimiter] = {}
+
+
+def get_limiter(name: str, capacity: int, priority_reserve: Optional[int] = None) -> FairShareLimiter:
+    """이름별 프로세스 전역 슬롯 (처음 만들 때의 용량을 사용)"""
+    limiter = _limiters.get(name)
+    if limiter is None:
+        if priority_reserve is None:
+            from .config import get_settings
+            priority_reserve = get_settings().concurrency_priority_reserve
+        limiter = FairShareLimiter(name, capacity, priority_reserve)
+        _limiters[name] = limiter
+    return limiter
@@ -8,19 +8,102 @@ class Settings(BaseSettings):
     debug: bool = True
 
     # Database
-    database_url: str = "sqlite+aiosqlite:///./data/blog_agent.db"
+    database_url: str = "sqlite+aiosqlite:///./data/blog_agent.db"  # 또는 postgresql+asyncpg://...
+
+    # Connection pool (Postgres)
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_recycle: int = 1800
+    db_pool_timeout: int = 30
+    db_pool_pre_ping: bool = True
+    db_statement_cache_size: int = 500
+
+    # Keyword monitoring
+    monitor_seen_ids_limit: int = 2000  # 키워드별로 기억할 최근 게시글 ID 수
+    monitor_poll_interval: float = 30.0
+
+    # Task execution: "inline"은 API 프로세스에서 바로 실행, "queue"는 DB 큐에 넣고 `nbas worker`가 실행
+    task_execution_mode: str = "inline"
+    worker_poll_interval: float = 2.0
+    worker_heartbeat_interval: float = 15.0
+    worker_stale_timeout: int = 300
+    task_cancel_poll_interval: float = 2.0  # 실행 중 작업의 취소 요청 확인 주기 (초)
+
+    # 본문 압축 저장 (zstd, 선택 기능)
+    content_compression: bool = False
+    content_compression_level: int = 10
+    content_dictionary_path: str = "./data/content.zdict"
+
+    # API responses
+    api_compression_min_size: int = 1024  # 이 크기(bytes) 미만 응답은 압축하지 않음
+    api_gzip_level: int = 6
+    api_brotli_quality: int = 5
+    api_cache_max_age: int = 60  # 완료된 작업 결과의 Cache-Control max-age (이후 ETag로 재검증)
+    quick_result_ttl: float = 30.0  # 빠른 검색/분석 결과를 재사용하는 시간 (초, 0이면 동시 요청만 합침)
+
+    # 원본 HTML 보관 (WARC 형식, `nbas reparse`로 재파싱)
+    html_archive_enabled: bool = False
+    html_archive_dir: str = "./data/archive"
+    html_archive_segment_mb: int = 256
 
     # Naver API
     naver_client_id: str = ""
     naver_client_secret: str = ""
+    # 추가 애플리케이션 인증 정보 "id1:secret1,id2:secret2" (일일 호출 수가 적은 것부터 사용)
+    naver_credentials: str = ""
+    naver_daily_quota: int = 25000  # 애플리케이션별 검색 API 일일 호출 한도
+    naver_rate_limit_cooldown: float = 60.0  # 초당 호출 한도 초과(429) 시 해당 인증 정보를 쉬는 시간
+    naver_quota_sync_interval: float = 10.0  # 호출 수를 DB에 반영하고 다른 프로세스 사용량을 읽는 주기
 
     # Google Gemini API
     google_api_key: str = ""
     gemini_model: str = "gemini-2.0-flash"
+    # 모델별 100만 토큰당 가격 (USD, "모델=입력:출력,..."), 없는 모델은 비용 0으로 기록
+    llm_prices: str = "gemini-2.0-flash=0.10:0.40,gemini-2.0-flash-lite=0.075:0.30,gemini-1.5-flash=0.075:0.30,gemini-1.5-pro=1.25:5.00"
+    llm_usage_flush_interval: float = 30.0  # 토큰 사용량을 DB에 반영하는 주기 (초)
+
+    # Analysis
+    analysis_concurrency: int = 5
+    analysis_retries: int = 2  # 응답이 스키마에 맞지 않을 때 재요청 횟수 (단건 분석)
+    analysis_batch_mode: bool = False  # 여러 게시글을 한 요청으로 묶어 분석
+    analysis_batch_token_budget: int = 24000
+    analysis_batch_max_posts: int = 10
+    analysis_batch_retries: int = 2
+    # 오프라인 일괄 분석 (Gemini 배치 작업, nbas bulk-analyze)
+    analysis_bulk_dir: str = "./data/batches"  # 요청/결과 파일과 제출한 작업 기록
+    analysis_bulk_poll_interval: float = 60.0
+    analysis_bulk_price_factor: float = 0.5  # 배치 작업 단가 (온라인 요청 대비)
+
+    # Local pre-analysis (규칙 기반 사전 분석 후 확신도 낮은 게시글만 LLM으로)
+    local_analysis_enabled: bool = True
+    local_analysis_confidence_threshold: float = 0.7
+    local_analysis_summary_required: bool = True  # 추출 요약이 본문을 다 담지 못하는 게시글은 LLM으로 (False면 로컬 결과 저장)
+
+    # Full-text search ("ngram" 또는 register_tokenizer로 등록한 이름)
+    search_tokenizer: str = "ngram"
+
+    # Near-duplicate detection (SimHash 해밍 거리 기준)
+    dedup_enabled: bool = True
+    dedup_max_distance: int = 3
+
+    # 다른 작업이 이 기간 안에 수집한 본문은 다시 수집하지 않고 재사용 (0이면 항상 수집)
+    content_reuse_days: float = 7.0
+
+    # 크롤러/LLM 동시 실행 슬롯 중 빠른 검색/분석(우선 레인)만 추가로 쓸 수 있는 수
+    concurrency_priority_reserve: int = 2
 
     # Crawler
     crawler_concurrency: int = 50
     crawler_timeout: int = 30
+    crawler_hedge_enabled: bool = True
+    crawler_hedge_percentile: float = 0.95  # 최근 httpx 성공 지연시간의 이 백분위수를 넘기면 헤지
+    crawler_hedge_initial_delay: float = 3.0  # 표본이 적을 때의 헤지 기준 시간 (초)
+    crawler_hedge_min_delay: float = 0.5
+    crawler_hedge_budget: float = 0.1  # 1차 요청 대비 헤지 요청 비율 상한
+    crawler_route_half_life_hours: float = 72.0  # 블로그별 수집 방식 기록의 반감기
+    crawler_route_probe_rate: float = 0.1  # 학습된 경로가 있어도 httpx를 다시 시도하는 확률
+    crawler_stream_enabled: bool = True  # httpx 단계에서 <head>/본문/작성자 노드를 받으면 나머지는 받지 않음 (HTML 보관 중에는 끝까지 받음)
+    crawler_stream_max_kb: int = 2048  # 페이지당 최대 수신 크기, 넘으면 받은 만큼만 파싱
 
     class Config:
         env_file = ".env"
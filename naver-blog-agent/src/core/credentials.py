@@ -0,0 +1,231 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from loguru import logger
+
+from .config import get_settings
+from .metrics import REGISTRY
+
+# 네이버 API 일일 한도는 한국 시각 자정에 초기화
+KST = timezone(timedelta(hours=9))
+
+QUOTA_REMAINING = REGISTRY.gauge(
+    "naver_api_quota_remaining", "네이버 API 인증 정보별 오늘 남은 호출 수", ["credential"]
+)
+API_CALLS = REGISTRY.counter(
+    "naver_api_calls_total", "네이버 API 호출 수", ["credential", "outcome"]
+)
+
+
+def parse_credentials(value: str) -> List[Tuple[str, str]]:
+    """"id1:secret1,id2:secret2" → [(id, secret), ...]"""
+    credentials = []
+    for item in value.split(","):
+        client_id, _, client_secret = item.strip().partition(":")
+        if client_id and client_secret:
+            credentials.append((client_id.strip(), client_secret.strip()))
+    return credentials
+
+
+def _today() -> str:
+    return datetime.now(KST).date().isoformat()
+
+
+class NaverCredential:
+    def __init__(self, client_id: str, client_secret: str):
+        self.client_id = client_id
+        self.client_secret = client_secret
+
+    @property
+    def label(self) -> str:
+        """지표용 표시 이름 (Client ID 앞부분만)"""
+        return self.client_id[:6]
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"X-Naver-Client-Id": self.client_id, "X-Naver-Client-Secret": self.client_secret}
+
+
+class NaverCredentialPool:
+    """네이버 API 인증 정보 풀
+
+    오늘 호출 수가 가장 적은 인증 정보부터 쓰고, 429 응답을 받으면 그 인증 정보를
+    쉬게 하고(일일 한도 초과면 오늘은 제외) 다음 인증 정보로 넘어간다. 호출 수는
+    메모리에서 세고 sync_interval마다 DB에 증분으로 더한 뒤 다시 읽어, 같은 DB를 쓰는
+    다른 프로세스의 사용량도 반영한다. db가 없고 persist=False면 프로세스 안에서만 센다.
+    """
+
+    def __init__(
+        self,
+        credentials: List[Tuple[str, str]],
+        daily_quota: int = 25000,
+        db=None,
+        cooldown: float = 60.0,
+        sync_interval: float = 10.0,
+        persist: bool = False
+    ):
+        self.credentials = [NaverCredential(client_id, secret) for client_id, secret in credentials]
+        self.daily_quota = daily_quota
+        self._db = db
+        self.persist = persist or db is not None
+        self.cooldown = cooldown
+        self.sync_interval = sync_interval
+
+        self._day = _today()
+        self._calls: Dict[str, int] = {c.client_id: 0 for c in self.credentials}
+        self._pending: Dict[str, int] = {c.client_id: 0 for c in self.credentials}
+        self._cooling_until: Dict[str, float] = {}
+        self._synced_at = 0.0
+        self._schema_ready = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def db(self):
+        # 기본 DB는 첫 동기화 때 연결 (검색만 하는 CLI 기동 시 SQLAlchemy를 불러오지 않음)
+        if self._db is None and self.persist:
+            from .database import get_database
+            self._db = get_database()
+        return self._db
+
+    def __len__(self) -> int:
+        return len(self.credentials)
+
+    def calls(self, client_id: str) -> int:
+        return self._calls.get(client_id, 0)
+
+    def remaining(self, client_id: str) -> int:
+        return max(self.daily_quota - self._calls.get(client_id, 0), 0)
+
+    def _update_gauges(self) -> None:
+        for credential in self.credentials:
+            QUOTA_REMAINING.set(self.remaining(credential.client_id), credential=credential.label)
+
+    async def acquire(self, exclude: List[str] = ()) -> Optional[NaverCredential]:
+        """호출에 쓸 인증 정보 (오늘 호출 수가 가장 적은 것, 쓸 수 있는 것이 없으면 None)"""
+        if self._day != _today() or time.monotonic() - self._synced_at >= self.sync_interval:
+            await self.sync()
+
+        now = time.monotonic()
+        available = [
+            c for c in self.credentials
+            if c.client_id not in exclude
+            and self._calls[c.client_id] < self.daily_quota
+            and self._cooling_until.get(c.client_id, 0.0) <= now
+        ]
+        if not available:
+            return None
+
+        credential = min(available, key=lambda c: self._calls[c.client_id])
+        self._calls[credential.client_id] += 1
+        self._pending[credential.client_id] += 1
+        QUOTA_REMAINING.set(self.remaining(credential.client_id), credential=credential.label)
+        return credential
+
+    def report_rate_limited(self, credential: NaverCredential, quota_exceeded: bool) -> None:
+        """429 응답: 일일 한도 초과면 오늘은 제외, 초당 한도 초과면 잠시 쉼"""
+        if quota_exceeded:
+            logger.warning(f"네이버 API 일일 한도 초과: {credential.label}…")
+            self._pending[credential.client_id] += self.daily_quota - self._calls[credential.client_id]
+            self._calls[credential.client_id] = self.daily_quota
+        else:
+            logger.warning(f"네이버 API 초당 한도 초과, {self.cooldown:.0f}초 대기: {credential.label}…")
+            self._cooling_until[credential.client_id] = time.monotonic() + self.cooldown
+        QUOTA_REMAINING.set(self.remaining(credential.client_id), credential=credential.label)
+
+    async def sync(self) -> None:
+        """호출 수를 DB에 더하고 오늘 전체 사용량을 다시 읽음 (날짜가 바뀌면 초기화)"""
+        async with self._lock:
+            today = _today()
+            if self.persist:
+                try:
+                    await self._sync_db(self._day)
+                    if today != self._day:
+                        await self._sync_db(today)
+                except Exception as e:
+                    logger.warning(f"네이버 API 사용량 동기화 실패: {str(e)}")
+            elif today != self._day:
+                self._calls = {c.client_id: 0 for c in self.credentials}
+
+            if today != self._day:
+                self._day = today
+                self._cooling_until.clear()
+            self._synced_at = time.monotonic()
+            self._update_gauges()
+
+    async def _sync_db(self, day: str) -> None:
+        from sqlalchemy import select, update
+        from sqlalchemy.exc import IntegrityError
+        from .database import NaverApiUsage
+
+        if not self._schema_ready:
+            # 검색만 하는 CLI처럼 init_db 없이 쓰는 경우에도 기록할 수 있도록
+            async with self.db.engine.begin() as conn:
+                await conn.run_sync(NaverApiUsage.__table__.create, checkfirst=True)
+            self._schema_ready = True
+
+        pending = {client_id: delta for client_id, delta in self._pending.items() if delta}
+        async with self.db.async_session() as session:
+            for client_id, delta in pending.items():
+                # 증분 UPDATE라 여러 프로세스가 동시에 더해도 합계가 맞음
+                result = await session.execute(
+                    update(NaverApiUsage)
+                    .where(NaverApiUsage.day == day)
+                    .where(NaverApiUsage.client_id == client_id)
+                    .values(calls=NaverApiUsage.calls + delta, updated_at=datetime.now())
+                )
+                if result.rowcount == 0:
+                    try:
+                        async with session.begin_nested():
+                            session.add(NaverApiUsage(day=day, client_id=client_id, calls=delta))
+                    except IntegrityError:
+                        await session.execute(
+                            update(NaverApiUsage)
+                            .where(NaverApiUsage.day == day)
+                            .where(NaverApiUsage.client_id == client_id)
+                            .values(calls=NaverApiUsage.calls + delta)
+                        )
+            await session.commit()
+
+            # 동기화 중에 늘어난 호출 수는 다음 동기화로 넘김
+            for client_id, delta in pending.items():
+                self._pending[client_id] -= delta
+
+            result = await session.execute(
+                select(NaverApiUsage.client_id, NaverApiUsage.calls).where(NaverApiUsage.day == day)
+            )
+            stored = dict(result.all())
+
+        self._calls = {
+            c.client_id: stored.get(c.client_id, 0) + self._pending[c.client_id]
+            for c in self.credentials
+        }
+
+    async def close(self) -> None:
+        """남은 호출 수 반영"""
+        if self.persist and any(self._pending.values()):
+            await self.sync()
+
+
+def settings_credentials() -> List[Tuple[str, str]]:
+    """설정의 인증 정보 목록 (NAVER_CLIENT_ID/SECRET + NAVER_CREDENTIALS, 중복 제거)"""
+    settings = get_settings()
+    credentials = []
+    if settings.naver_client_id and settings.naver_client_secret:
+        credentials.append((settings.naver_client_id, settings.naver_client_secret))
+    credentials.extend(parse_credentials(settings.naver_credentials))
+    return list(dict.fromkeys(credentials))
+
+
+@lru_cache()
+def get_credential_pool() -> NaverCredentialPool:
+    """설정의 인증 정보로 만든 프로세스 공용 풀 (사용량은 기본 DB에 기록)"""
+    settings = get_settings()
+    return NaverCredentialPool(
+        settings_credentials(),
+        daily_quota=settings.naver_daily_quota,
+        cooldown=settings.naver_rate_limit_cooldown,
+        sync_interval=settings.naver_quota_sync_interval,
+        persist=True
+    )
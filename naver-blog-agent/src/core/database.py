@@ -1,6 +1,9 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, Text, JSON
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import DeclarativeBase, relationship
+from sqlalchemy import (
+    Column, String, Integer, Float, Boolean, DateTime, Text, JSON, LargeBinary, ForeignKey, Index, inspect, event
+)
 from datetime import datetime
 import uuid
 
@@ -30,26 +33,184 @@ class SearchTask(Base):
     start_date = Column(String)
     end_date = Column(String)
     max_results = Column(Integer, default=100)
+    task_type = Column(String(20), default="search")  # search, monitor
     status = Column(String(50), default="pending")
     total_found = Column(Integer, default=0)
     total_crawled = Column(Integer, default=0)
     total_analyzed = Column(Integer, default=0)
     created_at = Column(DateTime, default=datetime.now)
     completed_at = Column(DateTime, nullable=True)
+    # 완료 후 결과(분석/게시글 본문)가 바뀔 때마다 증가 (API ETag에 포함)
+    result_version = Column(Integer, default=0)
+
+    # 실행 옵션과 워커 점유 정보 (API 워커가 상태를 갖지 않도록 DB에 보관)
+    crawl_content = Column(Boolean, default=True)
+    analyze_content = Column(Boolean, default=True)
+    worker_id = Column(String(255), nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+
+    # 취소/마감: 실행 중인 프로세스가 주기적으로 확인해 중단
+    deadline = Column(DateTime, nullable=True)
+    cancel_requested = Column(Boolean, default=False)
+
+
+class KeywordWatermark(Base):
+    """모니터링 키워드별 수집 기준점 (최신 게시일, 이미 본 게시글 ID)"""
+    __tablename__ = "keyword_watermarks"
+
+    keyword = Column(String(500), primary_key=True)
+    newest_postdate = Column(String(8), nullable=True)  # YYYYMMDD
+    seen_ids = Column(JSON, default=list)  # 최근 게시글 정규 ID (blogId/logNo)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+
+class NaverApiUsage(Base):
+    """네이버 API 인증 정보별 일일 호출 수 (여러 프로세스가 함께 갱신)"""
+    __tablename__ = "naver_api_usage"
+
+    day = Column(String(10), primary_key=True)  # YYYY-MM-DD (KST)
+    client_id = Column(String(255), primary_key=True)
+    calls = Column(Integer, default=0)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+
+class LlmUsage(Base):
+    """날짜/작업/모델별 LLM 호출 수와 토큰 사용량 (여러 프로세스가 증분으로 갱신)"""
+    __tablename__ = "llm_usage"
+
+    day = Column(String(10), primary_key=True)  # YYYY-MM-DD
+    task_id = Column(String, primary_key=True)  # 작업 ID, 작업 밖의 호출은 흐름 이름 (interactive, default)
+    model = Column(String(100), primary_key=True)
+    calls = Column(Integer, default=0)
+    prompt_tokens = Column(Integer, default=0)
+    output_tokens = Column(Integer, default=0)
+    latency_seconds = Column(Float, default=0.0)
+    cost_usd = Column(Float, default=0.0)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+    __table_args__ = (
+        Index("ix_llm_usage_task", "task_id"),
+    )
+
+
+class Monitor(Base):
+    """cron 일정으로 반복 실행되는 키워드 모니터"""
+    __tablename__ = "monitors"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    keyword = Column(String(500), nullable=False)
+    cron = Column(String(100), nullable=False)
+    max_results = Column(Integer, default=100)
+    enabled = Column(Boolean, default=True)
+    last_run_at = Column(DateTime, nullable=True)
+    last_task_id = Column(String, nullable=True)
+    next_run_at = Column(DateTime, nullable=True, index=True)
+    created_at = Column(DateTime, default=datetime.now)
 
 
 class BlogPost(Base):
     __tablename__ = "blog_posts"
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    task_id = Column(String, nullable=False)
+    task_id = Column(String, nullable=False)  # 처음 수집한 작업 (작업별 게시글은 task_posts)
     url = Column(String(2048), unique=True, nullable=False)
     title = Column(String(500))
     author = Column(String(255))
-    content = Column(Text)
+    _content = Column("content", Text)  # 평문 본문 (압축 저장 시 NULL)
+    content_length = Column(Integer, nullable=True)
     post_date = Column(String)
     images = Column(JSON)
     crawled_at = Column(DateTime, default=datetime.now)
+    simhash = Column(String(16), nullable=True)  # 64비트 SimHash (16진수)
+    cluster_id = Column(String, nullable=True, index=True)  # 유사 중복 클러스터 (대표 게시글 ID)
+
+    # 압축 본문은 본문을 읽는 곳에서만 selectinload(BlogPost.content_blob)로 함께 로드
+    content_blob = relationship(
+        "BlogPostContent", uselist=False, lazy="raise", cascade="all, delete-orphan"
+    )
+
+    @property
+    def content(self):
+        """본문 (압축 저장된 경우 투명하게 해제)"""
+        if self._content is not None:
+            return self._content
+        if self.content_blob is None:
+            return None
+
+        cached = self.__dict__.get("_decoded_content")
+        if cached is None:
+            from .compression import get_content_codec
+            cached = get_content_codec().decompress(self.content_blob.data, self.content_blob.dict_id)
+            self.__dict__["_decoded_content"] = cached
+        return cached
+
+    @content.setter
+    def content(self, text):
+        self.set_content(text, compress=get_settings().content_compression)
+
+    def set_content(self, text, compress: bool = False):
+        """본문 저장 (compress=True면 압축 테이블에 저장)"""
+        self.__dict__.pop("_decoded_content", None)
+        self.content_length = len(text) if text is not None else None
+
+        if text is None or not compress:
+            self._content = text
+            self.content_blob = None
+            return
+
+        from .compression import CODEC_ZSTD, get_content_codec
+        codec = get_content_codec()
+        self._content = None
+        self.content_blob = BlogPostContent(
+            codec=CODEC_ZSTD,
+            dict_id=codec.dict_id,
+            data=codec.compress(text)
+        )
+
+    @property
+    def has_content(self) -> bool:
+        """본문을 해제하지 않고 본문 존재 여부 확인"""
+        if self.content_length is not None:
+            return self.content_length > 0
+        return bool(self._content)
+
+
+class TaskPost(Base):
+    """작업-게시글 연결 (게시글은 URL당 하나이고 여러 작업이 공유)"""
+    __tablename__ = "task_posts"
+
+    task_id = Column(String, primary_key=True)
+    post_id = Column(String, primary_key=True)
+    rank = Column(Integer, default=0)  # 검색 결과 순서
+    reused = Column(Boolean, default=False)  # 저장된 본문을 재사용했는지
+    added_at = Column(DateTime, default=datetime.now)
+
+    __table_args__ = (
+        Index("ix_task_posts_post", "post_id"),
+    )
+
+
+class BlogPostContent(Base):
+    """압축된 게시글 본문 (blog_posts와 분리해 본문 외 컬럼 스캔을 가볍게 유지)"""
+    __tablename__ = "blog_post_contents"
+
+    post_id = Column(String, ForeignKey("blog_posts.id", ondelete="CASCADE"), primary_key=True)
+    codec = Column(String(20), nullable=False)
+    dict_id = Column(Integer, default=0)
+    data = Column(LargeBinary, nullable=False)
+
+
+class PostSignatureBand(Base):
+    """SimHash 밴드 색인 (작업 간 유사 중복 후보 조회용)"""
+    __tablename__ = "post_signature_bands"
+
+    post_id = Column(String, primary_key=True)
+    band = Column(Integer, primary_key=True)
+    value = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("ix_post_signature_bands_band_value", "band", "value"),
+    )
 
 
 class Analysis(Base):
@@ -57,6 +218,7 @@ class Analysis(Base):
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     post_id = Column(String, nullable=False)
+    task_id = Column(String, nullable=True, index=True)
     url = Column(String(2048))
     sentiment_score = Column(Float)
     sentiment_label = Column(String(50))
@@ -68,21 +230,75 @@ class Analysis(Base):
     analyzed_at = Column(DateTime, default=datetime.now)
 
 
+class AnalysisKeyword(Base):
+    """분석 결과의 키워드 (정규화, SQL로 조회 가능)"""
+    __tablename__ = "analysis_keywords"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    analysis_id = Column(String, nullable=False, index=True)
+    task_id = Column(String, nullable=True)
+    keyword = Column(String(255), nullable=False)
+    count = Column(Integer, default=0)
+
+    __table_args__ = (
+        Index("ix_analysis_keywords_task_keyword", "task_id", "keyword"),
+        Index("ix_analysis_keywords_keyword", "keyword"),
+    )
+
+
+class TaskAggregate(Base):
+    """작업별 분석 집계 (분석 저장 시 증분 갱신)"""
+    __tablename__ = "task_aggregates"
+
+    task_id = Column(String, primary_key=True)
+    analysis_count = Column(Integer, default=0)
+    sentiment_sum = Column(Float, default=0.0)
+    sentiment_histogram = Column(JSON, default=dict)  # {"긍정": 10, ...}
+    ad_count = Column(Integer, default=0)
+    content_type_counts = Column(JSON, default=dict)  # {"후기": 5, ...}
+    quality_sum = Column(Integer, default=0)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+
+class TaskKeywordCount(Base):
+    """작업별 키워드 누적 빈도"""
+    __tablename__ = "task_keyword_counts"
+
+    task_id = Column(String, primary_key=True)
+    keyword = Column(String(255), primary_key=True)
+    count = Column(Integer, default=0)
+    post_count = Column(Integer, default=0)
+
+    __table_args__ = (
+        Index("ix_task_keyword_counts_task_count", "task_id", "count"),
+    )
+
+
 class Database:
     """비동기 데이터베이스 클래스"""
 
     def __init__(self, database_url: str = None):
         settings = get_settings()
         self.database_url = database_url or settings.database_url
-        self.engine = create_async_engine(self.database_url, echo=False)
+        self.engine = create_async_engine(self.database_url, echo=False, **_engine_options(self.database_url))
         self.async_session = async_sessionmaker(
             self.engine, class_=AsyncSession, expire_on_commit=False
         )
 
+        if self.engine.dialect.name == "sqlite":
+            event.listen(self.engine.sync_engine, "connect", _sqlite_on_connect)
+
     async def init_db(self):
         """데이터베이스 테이블 생성"""
         async with self.engine.begin() as conn:
+            existing_tables = await conn.run_sync(lambda c: set(inspect(c).get_table_names()))
             await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(_add_missing_columns)
+            if "blog_posts" in existing_tables and TaskPost.__tablename__ not in existing_tables:
+                await conn.run_sync(_backfill_task_posts)
+
+            from .search_index import get_search_index
+            await conn.run_sync(get_search_index().ensure_schema)
 
     async def get_session(self) -> AsyncSession:
         """세션 반환"""
@@ -94,6 +310,85 @@ class Database:
         await self.engine.dispose()
 
 
+def _engine_options(database_url: str) -> dict:
+    """DB 종류별 엔진 옵션 (Postgres는 커넥션 풀과 prepared statement 캐시 설정)"""
+    settings = get_settings()
+    url = make_url(database_url)
+
+    if url.get_backend_name() == "postgresql":
+        options = {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_recycle": settings.db_pool_recycle,
+            "pool_timeout": settings.db_pool_timeout,
+            "pool_pre_ping": settings.db_pool_pre_ping,
+        }
+        if url.get_driver_name() == "asyncpg":
+            options["connect_args"] = {
+                "prepared_statement_cache_size": settings.db_statement_cache_size,
+            }
+        return options
+
+    return {}
+
+
+def _sqlite_on_connect(dbapi_connection, connection_record) -> None:
+    """SQLite: 여러 프로세스가 같은 파일을 쓸 수 있도록 WAL 모드와 잠금 대기 설정"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+
+def _add_missing_columns(sync_conn) -> None:
+    """기존 테이블에 모델에 새로 추가된 컬럼(nullable)과 인덱스 반영
+
+    create_all은 기존 테이블을 변경하지 않으므로, 이전 버전으로 만든 DB 파일도
+    그대로 쓸 수 있도록 누락된 컬럼만 ALTER TABLE로 추가한다.
+    """
+    inspector = inspect(sync_conn)
+    existing_tables = set(inspector.get_table_names())
+
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+
+        existing_columns = {c["name"] for c in inspector.get_columns(table.name)}
+        added = []
+        for column in table.columns:
+            if column.name in existing_columns:
+                continue
+            column_type = column.type.compile(dialect=sync_conn.dialect)
+            sync_conn.exec_driver_sql(
+                f'ALTER TABLE {table.name} ADD COLUMN "{column.name}" {column_type}'
+            )
+            added.append(column.name)
+
+        if added:
+            for index in table.indexes:
+                if any(c.name in added for c in index.columns):
+                    index.create(sync_conn, checkfirst=True)
+
+
+def _backfill_task_posts(sync_conn) -> None:
+    """task_posts 도입 전 DB: 게시글의 task_id로 작업-게시글 연결 생성"""
+    from sqlalchemy import select, literal
+
+    # reused는 Boolean 컬럼이라 정수 0이 아닌 false로 넣어야 Postgres에서도 동작
+    sync_conn.execute(
+        TaskPost.__table__.insert().from_select(
+            ["task_id", "post_id", "rank", "reused", "added_at"],
+            select(BlogPost.task_id, BlogPost.id, literal(0), literal(False, Boolean), BlogPost.crawled_at)
+        )
+    )
+    # 작업별 분석 조회가 analyses.task_id를 쓰므로 비어 있는 예전 분석도 채움
+    sync_conn.exec_driver_sql(
+        "UPDATE analyses SET task_id = "
+        "(SELECT p.task_id FROM blog_posts p WHERE p.id = analyses.post_id) "
+        "WHERE task_id IS NULL"
+    )
+
+
 # 싱글톤 인스턴스
 _db_instance: Database = None
 
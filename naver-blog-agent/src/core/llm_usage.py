@@ -0,0 +1,207 @@
+import asyncio
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Tuple
+from loguru import logger
+
+from .config import get_settings
+from .concurrency import current_flow
+from .metrics import REGISTRY
+
+LLM_CALLS = REGISTRY.counter("llm_calls_total", "LLM 호출 수", ["model", "agent"])
+LLM_TOKENS = REGISTRY.counter("llm_tokens_total", "LLM 토큰 수 (kind: prompt/output)", ["model", "kind"])
+LLM_COST = REGISTRY.counter("llm_cost_usd_total", "LLM 예상 비용 (USD)", ["model"])
+LLM_LATENCY = REGISTRY.histogram(
+    "llm_latency_seconds", "LLM 호출 시간 (초)", ["model"],
+    buckets=(0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0)
+)
+
+_FIELDS = ("calls", "prompt_tokens", "output_tokens", "latency_seconds", "cost_usd")
+
+# (날짜, 작업 ID, 모델)
+_Key = Tuple[str, str, str]
+
+
+def parse_prices(value: str) -> Dict[str, Tuple[float, float]]:
+    """"model=0.10:0.40,..." → {model: (입력 단가, 출력 단가)} (100만 토큰당 USD)"""
+    prices = {}
+    for item in value.split(","):
+        model, _, pair = item.strip().partition("=")
+        prompt_price, _, output_price = pair.partition(":")
+        try:
+            prices[model.strip()] = (float(prompt_price), float(output_price))
+        except ValueError:
+            continue
+    return prices
+
+
+class LlmUsageRecorder:
+    """LLM 호출별 토큰/지연 시간/비용 기록
+
+    호출은 현재 흐름(concurrency.flow, 작업 실행 중이면 작업 ID)에 귀속되며, 작업 밖의
+    호출은 "interactive"/"default"로 모인다. 메모리에서 (날짜, 작업, 모델)별로 더하고
+    flush_interval마다 또는 작업이 끝날 때 llm_usage 테이블에 증분으로 반영한다.
+    db가 없고 persist=False면 지표만 남긴다.
+    """
+
+    def __init__(
+        self,
+        prices: Dict[str, Tuple[float, float]] = None,
+        db=None,
+        flush_interval: float = 30.0,
+        persist: bool = False
+    ):
+        self.prices = prices or {}
+        self._db = db
+        self.persist = persist or db is not None
+        self.flush_interval = flush_interval
+
+        self._pending: Dict[_Key, Dict[str, float]] = {}
+        self._flushed_at = time.monotonic()
+        self._schema_ready = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def db(self):
+        if self._db is None and self.persist:
+            from .database import get_database
+            self._db = get_database()
+        return self._db
+
+    def cost(self, model: str, prompt_tokens: int, output_tokens: int) -> float:
+        prompt_price, output_price = self.prices.get(model, (0.0, 0.0))
+        return (prompt_tokens * prompt_price + output_tokens * output_price) / 1_000_000
+
+    async def record(
+        self,
+        model: str,
+        prompt_tokens: int,
+        output_tokens: int,
+        latency: float,
+        agent: str = "analysis",
+        price_factor: float = 1.0
+    ) -> None:
+        """호출 한 건 기록 (flush_interval이 지났으면 DB에 반영)
+
+        price_factor: 온라인 요청 대비 단가 (배치 작업 할인 등)
+        """
+        cost = self.cost(model, prompt_tokens, output_tokens) * price_factor
+        LLM_CALLS.inc(model=model, agent=agent)
+        LLM_TOKENS.inc(prompt_tokens, model=model, kind="prompt")
+        LLM_TOKENS.inc(output_tokens, model=model, kind="output")
+        LLM_COST.inc(cost, model=model)
+        LLM_LATENCY.observe(latency, model=model)
+
+        if not self.persist:
+            return
+
+        key = (datetime.now().date().isoformat(), current_flow(), model)
+        usage = self._pending.setdefault(key, dict.fromkeys(_FIELDS, 0))
+        for field, value in zip(_FIELDS, (1, prompt_tokens, output_tokens, latency, cost)):
+            usage[field] += value
+
+        if time.monotonic() - self._flushed_at >= self.flush_interval:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """쌓인 사용량을 DB에 더함 (실패하면 다음 반영 때 다시 시도)"""
+        async with self._lock:
+            self._flushed_at = time.monotonic()
+            if not self.persist or not self._pending:
+                return
+
+            pending, self._pending = self._pending, {}
+            try:
+                await self._flush_db(pending)
+            except Exception as e:
+                logger.warning(f"LLM 사용량 기록 실패: {str(e)}")
+                for key, usage in pending.items():
+                    merged = self._pending.setdefault(key, dict.fromkeys(_FIELDS, 0))
+                    for field, value in usage.items():
+                        merged[field] += value
+
+    async def _flush_db(self, pending: Dict[_Key, Dict[str, float]]) -> None:
+        from sqlalchemy import update
+        from sqlalchemy.exc import IntegrityError
+        from .database import LlmUsage
+
+        if not self._schema_ready:
+            async with self.db.engine.begin() as conn:
+                await conn.run_sync(LlmUsage.__table__.create, checkfirst=True)
+            self._schema_ready = True
+
+        async with self.db.async_session() as session:
+            for (day, task_id, model), usage in pending.items():
+                statement = (
+                    update(LlmUsage)
+                    .where(LlmUsage.day == day)
+                    .where(LlmUsage.task_id == task_id)
+                    .where(LlmUsage.model == model)
+                    .values(
+                        updated_at=datetime.now(),
+                        **{field: getattr(LlmUsage, field) + usage[field] for field in _FIELDS}
+                    )
+                )
+                # 증분 UPDATE라 여러 프로세스가 동시에 더해도 합계가 맞음
+                result = await session.execute(statement)
+                if result.rowcount == 0:
+                    try:
+                        async with session.begin_nested():
+                            session.add(LlmUsage(day=day, task_id=task_id, model=model, **usage))
+                    except IntegrityError:
+                        await session.execute(statement)
+            await session.commit()
+
+    async def task_totals(self, session, task_id: str) -> Dict[str, float]:
+        """작업의 누적 사용량 (쌓인 사용량을 먼저 반영한 뒤 session의 DB에서 조회)"""
+        from sqlalchemy import select, func
+        from .database import LlmUsage
+
+        await self.flush()
+        row = (await session.execute(
+            select(*[func.coalesce(func.sum(getattr(LlmUsage, field)), 0) for field in _FIELDS])
+            .where(LlmUsage.task_id == task_id)
+        )).one()
+        return dict(zip(_FIELDS, row))
+
+    async def daily_totals(self, days: int = 7) -> List[Dict]:
+        """최근 며칠간 날짜/모델별 사용량 (최신 날짜부터)"""
+        from datetime import timedelta
+        from sqlalchemy import select, func
+        from .database import LlmUsage
+
+        await self.flush()
+        since = (datetime.now().date() - timedelta(days=days - 1)).isoformat()
+        async with self.db.async_session() as session:
+            result = await session.execute(
+                select(LlmUsage.day, LlmUsage.model, *[func.sum(getattr(LlmUsage, field)) for field in _FIELDS])
+                .where(LlmUsage.day >= since)
+                .group_by(LlmUsage.day, LlmUsage.model)
+                .order_by(LlmUsage.day.desc(), LlmUsage.model)
+            )
+            return [
+                {"day": day, "model": model, **dict(zip(_FIELDS, values))}
+                for day, model, *values in result.all()
+            ]
+
+    async def close(self) -> None:
+        """남은 사용량 반영"""
+        await self.flush()
+
+
+def create_llm_usage(db=None) -> LlmUsageRecorder:
+    """설정의 단가로 db(없으면 기본 DB)에 기록하는 기록기"""
+    settings = get_settings()
+    return LlmUsageRecorder(
+        parse_prices(settings.llm_prices),
+        db=db,
+        flush_interval=settings.llm_usage_flush_interval,
+        persist=True
+    )
+
+
+@lru_cache()
+def get_llm_usage() -> LlmUsageRecorder:
+    """프로세스 공용 기록기 (기본 DB에 기록)"""
+    return create_llm_usage()
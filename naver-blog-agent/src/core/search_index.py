@@ -0,0 +1,230 @@
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+from loguru import logger
+
+from .config import get_settings
+
+_WORD_PATTERN = re.compile(r"[가-힣]+|[A-Za-z0-9]+|[^\sA-Za-z0-9가-힣]+")
+_HANGUL = re.compile(r"[가-힣]+")
+
+# 질의어 끝의 조사 (색인 본문에는 조사가 붙지 않은 형태도 있으므로 질의에서 제거)
+_QUERY_PARTICLES = sorted([
+    "에서", "으로", "에게", "까지", "부터", "처럼", "이랑",
+    "은", "는", "이", "가", "을", "를", "에", "로", "의", "와", "과", "도", "만",
+], key=len, reverse=True)
+
+
+class Tokenizer:
+    """검색 색인용 토크나이저 기본 클래스
+
+    형태소 분석기를 쓰려면 이 클래스를 상속해 tokenize()를 구현하고
+    register_tokenizer()로 등록한 뒤 SEARCH_TOKENIZER 설정으로 선택한다.
+    """
+
+    def tokenize(self, text: str) -> List[str]:
+        raise NotImplementedError
+
+    def query_phrases(self, query: str) -> List[List[str]]:
+        """질의어를 단어별 토큰 구(phrase) 목록으로 변환"""
+        phrases = []
+        for word in query.split():
+            tokens = self.tokenize(word)
+            if tokens:
+                phrases.append(tokens)
+        return phrases
+
+
+class CharNgramTokenizer(Tokenizer):
+    """한글은 글자 n-gram, 영문/숫자는 단어 단위로 분할
+
+    조사가 붙은 어절("연희동에서")도 "연희", "희동" 바이그램으로 일치한다.
+    """
+
+    def __init__(self, n: int = 2):
+        self.n = n
+
+    def query_phrases(self, query: str) -> List[List[str]]:
+        words = []
+        for word in query.split():
+            if _HANGUL.fullmatch(word):
+                for particle in _QUERY_PARTICLES:
+                    if word.endswith(particle) and len(word) - len(particle) >= self.n:
+                        word = word[:-len(particle)]
+                        break
+            words.append(word)
+        return super().query_phrases(" ".join(words))
+
+    def tokenize(self, text: str) -> List[str]:
+        tokens = []
+        for word in _WORD_PATTERN.findall(text or ""):
+            if _HANGUL.fullmatch(word):
+                if len(word) <= self.n:
+                    tokens.append(word)
+                else:
+                    tokens.extend(word[i:i + self.n] for i in range(len(word) - self.n + 1))
+            elif word.isalnum():
+                tokens.append(word.lower())
+        return tokens
+
+
+_TOKENIZERS: Dict[str, Callable[[], Tokenizer]] = {
+    "ngram": CharNgramTokenizer,
+}
+
+
+def register_tokenizer(name: str, factory: Callable[[], Tokenizer]) -> None:
+    """토크나이저 등록 (예: 형태소 분석기 기반)"""
+    _TOKENIZERS[name] = factory
+
+
+class SearchIndex:
+    """게시글 전문 검색 색인
+
+    SQLite는 FTS5 가상 테이블(bm25 순위), Postgres는 tsvector + GIN 색인을 사용한다.
+    어느 쪽이든 토큰화는 파이썬 토크나이저로 미리 수행해 공백으로 이어 저장하므로
+    한국어 처리 방식이 DB 종류와 무관하게 같다.
+    """
+
+    TABLE = "post_search"
+
+    def __init__(self, tokenizer: Tokenizer = None):
+        self.tokenizer = tokenizer or CharNgramTokenizer()
+
+    def ensure_schema(self, sync_conn) -> None:
+        """색인 테이블 생성 (Database.init_db에서 호출)"""
+        dialect = sync_conn.dialect.name
+        if dialect == "sqlite":
+            sync_conn.exec_driver_sql(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.TABLE} "
+                f"USING fts5(post_id UNINDEXED, title, body, tokenize='unicode61')"
+            )
+        elif dialect == "postgresql":
+            sync_conn.exec_driver_sql(
+                f"CREATE TABLE IF NOT EXISTS {self.TABLE} ("
+                f"post_id VARCHAR PRIMARY KEY, title_doc TSVECTOR, body_doc TSVECTOR)"
+            )
+            sync_conn.exec_driver_sql(
+                f"CREATE INDEX IF NOT EXISTS ix_{self.TABLE}_docs ON {self.TABLE} "
+                f"USING GIN ((setweight(title_doc, 'A') || body_doc))"
+            )
+        else:
+            logger.warning(f"전문 검색 색인을 지원하지 않는 DB: {dialect}")
+
+    def _document(self, text: Optional[str]) -> str:
+        return " ".join(self.tokenizer.tokenize(text or ""))
+
+    async def index_posts(self, session, posts: List[Any]) -> int:
+        """게시글 색인 추가/갱신 (같은 세션 트랜잭션에 포함)"""
+        from sqlalchemy import text
+
+        dialect = session.bind.dialect.name
+        rows = [
+            {"post_id": post.id, "title": self._document(post.title), "body": self._document(post.content)}
+            for post in posts
+        ]
+        if not rows:
+            return 0
+
+        if dialect == "sqlite":
+            await session.execute(
+                text(f"DELETE FROM {self.TABLE} WHERE post_id = :post_id"),
+                [{"post_id": row["post_id"]} for row in rows]
+            )
+            await session.execute(
+                text(f"INSERT INTO {self.TABLE} (post_id, title, body) VALUES (:post_id, :title, :body)"),
+                rows
+            )
+        elif dialect == "postgresql":
+            await session.execute(
+                text(
+                    f"INSERT INTO {self.TABLE} (post_id, title_doc, body_doc) "
+                    f"VALUES (:post_id, to_tsvector('simple', :title), to_tsvector('simple', :body)) "
+                    f"ON CONFLICT (post_id) DO UPDATE SET "
+                    f"title_doc = EXCLUDED.title_doc, body_doc = EXCLUDED.body_doc"
+                ),
+                rows
+            )
+        return len(rows)
+
+    def _match_expression(self, query: str, dialect: str) -> Optional[str]:
+        phrases = self.tokenizer.query_phrases(query)
+        if not phrases:
+            return None
+        if dialect == "sqlite":
+            # 단어마다 토큰 구(phrase) 일치, 단어끼리는 AND
+            return " AND ".join('"' + " ".join(tokens) + '"' for tokens in phrases)
+        return " & ".join("(" + " <-> ".join(tokens) + ")" for tokens in phrases)
+
+    async def search(
+        self,
+        session,
+        query: str,
+        task_id: str = None,
+        date_from: str = None,
+        date_to: str = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> Dict[str, Any]:
+        """색인 검색 (관련도 순)
+
+        Args:
+            date_from, date_to: 게시일 범위 (YYYYMMDD)
+
+        Returns:
+            {"total": 전체 일치 수, "items": [(post_id, score), ...]}
+        """
+        from sqlalchemy import text
+
+        dialect = session.bind.dialect.name
+        match = self._match_expression(query, dialect)
+        if not match:
+            return {"total": 0, "items": []}
+
+        filters = []
+        params: Dict[str, Any] = {"match": match, "limit": limit, "offset": offset}
+        if task_id:
+            filters.append(
+                "EXISTS (SELECT 1 FROM task_posts tp WHERE tp.post_id = p.id AND tp.task_id = :task_id)"
+            )
+            params["task_id"] = task_id
+        if date_from:
+            filters.append("p.post_date >= :date_from")
+            params["date_from"] = date_from
+        if date_to:
+            filters.append("p.post_date <= :date_to")
+            params["date_to"] = date_to
+        where = "".join(f" AND {f}" for f in filters)
+
+        if dialect == "sqlite":
+            base = (
+                f"FROM {self.TABLE} s JOIN blog_posts p ON p.id = s.post_id "
+                f"WHERE {self.TABLE} MATCH :match{where}"
+            )
+            # bm25는 값이 작을수록 관련도가 높음 (제목 가중치 2배)
+            score = f"-bm25({self.TABLE}, 0.0, 2.0, 1.0)"
+        elif dialect == "postgresql":
+            document = "(setweight(s.title_doc, 'A') || s.body_doc)"
+            base = (
+                f"FROM {self.TABLE} s JOIN blog_posts p ON p.id = s.post_id "
+                f"WHERE {document} @@ to_tsquery('simple', :match){where}"
+            )
+            score = f"ts_rank({document}, to_tsquery('simple', :match))"
+        else:
+            return {"total": 0, "items": []}
+
+        total = (await session.execute(text(f"SELECT COUNT(*) {base}"), params)).scalar_one()
+        result = await session.execute(
+            text(f"SELECT s.post_id, {score} AS score {base} ORDER BY score DESC LIMIT :limit OFFSET :offset"),
+            params
+        )
+        return {"total": total, "items": [(row[0], float(row[1])) for row in result.all()]}
+
+
+@lru_cache()
+def get_search_index() -> SearchIndex:
+    settings = get_settings()
+    factory = _TOKENIZERS.get(settings.search_tokenizer)
+    if factory is None:
+        raise ValueError(f"알 수 없는 토크나이저: {settings.search_tokenizer}")
+    return SearchIndex(factory())
@@ -8,10 +8,13 @@ from .schemas import (
     BlogContent,
     AnalysisInput,
     AnalysisResult,
+    AnalysisBatchRequest,
+    PreAnalysisResult,
     TaskCreate,
     TaskResponse,
     TaskProgress,
 )
+from .records import PostMetaRecord, ContentRecord
 
 __all__ = [
     "TaskStatus",
@@ -23,7 +26,11 @@ __all__ = [
     "BlogContent",
     "AnalysisInput",
     "AnalysisResult",
+    "AnalysisBatchRequest",
+    "PreAnalysisResult",
     "TaskCreate",
     "TaskResponse",
     "TaskProgress",
+    "PostMetaRecord",
+    "ContentRecord",
 ]
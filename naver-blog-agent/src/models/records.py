@@ -0,0 +1,39 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import List, Optional
+
+from .schemas import BlogContent, BlogPostMeta
+
+# 검색/수집 경로에서 게시글마다 만드는 내부 레코드.
+# Pydantic 모델과 필드가 같지만 검증과 인스턴스 __dict__가 없어 수만 건을 만들 때
+# 생성 시간과 메모리가 적다. 외부로 내보낼 때만 to_model()로 검증된 모델로 바꾼다.
+
+
+@dataclass(slots=True)
+class PostMetaRecord:
+    """검색 결과 한 건 (BlogPostMeta와 같은 필드)"""
+    title: str
+    link: str
+    description: str
+    bloggername: str
+    bloggerlink: str
+    postdate: str  # YYYYMMDD
+
+    def to_model(self) -> BlogPostMeta:
+        return BlogPostMeta.model_validate(self)
+
+
+@dataclass(slots=True)
+class ContentRecord:
+    """수집된 게시글 한 건 (BlogContent와 같은 필드)"""
+    url: str
+    title: Optional[str] = None
+    author: Optional[str] = None
+    content: Optional[str] = None
+    post_date: Optional[date] = None
+    images: List[str] = field(default_factory=list)
+    crawled_at: datetime = field(default_factory=datetime.now)
+    method: str = "httpx"  # httpx, curl_cffi, playwright, stored
+
+    def to_model(self) -> BlogContent:
+        return BlogContent.model_validate(self)
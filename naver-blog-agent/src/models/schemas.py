@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, HttpUrl
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from typing import List, Optional, Dict, Any, Callable
 from datetime import date, datetime
 from enum import Enum
 
@@ -11,6 +11,8 @@ class TaskStatus(str, Enum):
     ANALYZING = "analyzing"
     COMPLETED = "completed"
     FAILED = "failed"
+    CANCELLED = "cancelled"
+    TIMED_OUT = "timed_out"
 
 class SentimentLabel(str, Enum):
     VERY_POSITIVE = "매우 긍정"
@@ -33,9 +35,14 @@ class SearchInput(BaseModel):
     end_date: Optional[date] = None
     max_results: int = Field(default=100, ge=1, le=1000)
     sort: str = Field(default="sim", pattern="^(sim|date)$")
+    # 모니터링: 이미 본 게시글 정규 ID / 마지막 수집 최신 게시일(YYYYMMDD)에 도달하면 페이징 중단
+    known_ids: List[str] = []
+    since_postdate: Optional[str] = None
 
 class BlogPostMeta(BaseModel):
     """블로그 게시글 메타데이터 (검색 결과)"""
+    model_config = ConfigDict(from_attributes=True)  # 내부 레코드(records.PostMetaRecord)에서 변환
+
     title: str
     link: str
     description: str
@@ -47,9 +54,13 @@ class BlogPostMeta(BaseModel):
 class CrawlerInput(BaseModel):
     urls: List[str]
     concurrency: int = Field(default=50, ge=1, le=100)
+    # 게시글 하나를 수집할 때마다 호출 (작업이 중간에 취소돼도 수집분을 저장하기 위함)
+    on_result: Optional[Callable[["BlogContent"], None]] = None
 
 class BlogContent(BaseModel):
     """수집된 블로그 콘텐츠"""
+    model_config = ConfigDict(from_attributes=True)  # 내부 레코드(records.ContentRecord)에서 변환
+
     url: str
     title: Optional[str] = None
     author: Optional[str] = None
@@ -75,6 +86,17 @@ class AnalysisResult(BaseModel):
     quality_score: int = Field(ge=1, le=10)
     analyzed_at: datetime = Field(default_factory=datetime.now)
 
+class AnalysisBatchRequest(BaseModel):
+    """여러 URL 일괄 분석 요청"""
+    urls: List[str] = Field(min_length=1, max_length=200)
+
+class PreAnalysisResult(BaseModel):
+    """로컬 사전 분석 결과 (LLM 호출 전 규칙 기반)"""
+    result: AnalysisResult
+    confidence: float = Field(ge=0.0, le=1.0)
+    ad_phrases: List[str] = []
+    needs_summary: bool = False  # 추출 요약이 본문을 다 담지 못함 (LLM 요약 필요)
+
 # 작업 관련
 class TaskCreate(BaseModel):
     keyword: str
@@ -83,6 +105,8 @@ class TaskCreate(BaseModel):
     max_results: int = Field(default=100, ge=1, le=1000)
     crawl_content: bool = True
     analyze_content: bool = True
+    task_type: str = Field(default="search", pattern="^(search|monitor)$")
+    deadline: Optional[datetime] = None  # 이 시각까지 끝나지 않으면 수집분만 저장하고 TIMED_OUT
 
 class TaskResponse(BaseModel):
     id: str
@@ -93,6 +117,13 @@ class TaskResponse(BaseModel):
     total_analyzed: int = 0
     created_at: datetime
     completed_at: Optional[datetime] = None
+    deadline: Optional[datetime] = None
+    result_version: int = 0  # 완료 후 결과가 바뀐 횟수
+    # LLM 사용량 (작업 중 호출 합계)
+    llm_calls: int = 0
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+    llm_cost_usd: float = 0.0
 
 class TaskProgress(BaseModel):
     status: TaskStatus
@@ -0,0 +1,127 @@
+from typing import Any, Dict, Iterable
+
+
+async def bump_result_version(session, task_ids: Iterable[str] = (), post_ids: Iterable[str] = ()) -> None:
+    """작업 결과 버전 증가 (완료된 작업의 API 캐시 무효화)
+
+    Args:
+        session: 결과를 바꾸는 것과 같은 세션 (같은 트랜잭션으로 커밋)
+        task_ids: 결과가 바뀐 작업 ID
+        post_ids: 본문이 바뀐 게시글 ID (이 게시글이 연결된 모든 작업)
+    """
+    from sqlalchemy import func, or_, select, update
+    from ..core.database import SearchTask, TaskPost
+
+    task_ids, post_ids = list(task_ids), list(post_ids)
+    conditions = []
+    if task_ids:
+        conditions.append(SearchTask.id.in_(task_ids))
+    if post_ids:
+        conditions.append(SearchTask.id.in_(select(TaskPost.task_id).where(TaskPost.post_id.in_(post_ids))))
+    if not conditions:
+        return
+
+    await session.execute(
+        update(SearchTask)
+        .where(or_(*conditions))
+        .values(result_version=func.coalesce(SearchTask.result_version, 0) + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def record_analysis(session, task_id: str, analysis) -> None:
+    """분석 한 건을 작업 집계와 키워드 테이블에 반영 (증분 갱신)
+
+    Args:
+        session: 분석을 저장하는 것과 같은 세션 (같은 트랜잭션으로 커밋)
+        task_id: 작업 ID
+        analysis: 저장할 Analysis 행 (id가 부여된 상태)
+    """
+    from ..core.database import AnalysisKeyword, TaskAggregate, TaskKeywordCount
+
+    aggregate = await session.get(TaskAggregate, task_id)
+    if aggregate is None:
+        aggregate = TaskAggregate(
+            task_id=task_id,
+            analysis_count=0,
+            sentiment_sum=0.0,
+            sentiment_histogram={},
+            ad_count=0,
+            content_type_counts={},
+            quality_sum=0
+        )
+        session.add(aggregate)
+
+    aggregate.analysis_count += 1
+    aggregate.sentiment_sum += analysis.sentiment_score or 0.0
+    aggregate.quality_sum += analysis.quality_score or 0
+    if analysis.is_ad:
+        aggregate.ad_count += 1
+
+    # JSON 컬럼은 새 dict를 대입해야 변경이 감지됨
+    histogram = dict(aggregate.sentiment_histogram or {})
+    histogram[analysis.sentiment_label] = histogram.get(analysis.sentiment_label, 0) + 1
+    aggregate.sentiment_histogram = histogram
+
+    content_types = dict(aggregate.content_type_counts or {})
+    content_types[analysis.content_type] = content_types.get(analysis.content_type, 0) + 1
+    aggregate.content_type_counts = content_types
+
+    merged: Dict[str, int] = {}
+    for item in analysis.keywords or []:
+        keyword = str(item.get("keyword", "")).strip()[:255] if isinstance(item, dict) else ""
+        if not keyword:
+            continue
+        try:
+            count = int(item.get("count", 1))
+        except (TypeError, ValueError):
+            count = 1
+        merged[keyword] = merged.get(keyword, 0) + count
+
+    for keyword, count in merged.items():
+        session.add(AnalysisKeyword(
+            analysis_id=analysis.id,
+            task_id=task_id,
+            keyword=keyword,
+            count=count
+        ))
+
+        keyword_count = await session.get(TaskKeywordCount, (task_id, keyword))
+        if keyword_count is None:
+            keyword_count = TaskKeywordCount(task_id=task_id, keyword=keyword, count=0, post_count=0)
+            session.add(keyword_count)
+        keyword_count.count += count
+        keyword_count.post_count += 1
+
+
+async def get_task_summary(session, task_id: str, top_n: int = 20) -> Dict[str, Any]:
+    """작업 요약 조회 (집계 행 + 상위 키워드)"""
+    from sqlalchemy import select
+    from ..core.database import TaskAggregate, TaskKeywordCount
+
+    aggregate = await session.get(TaskAggregate, task_id)
+    count = aggregate.analysis_count if aggregate else 0
+
+    result = await session.execute(
+        select(TaskKeywordCount.keyword, TaskKeywordCount.count, TaskKeywordCount.post_count)
+        .where(TaskKeywordCount.task_id == task_id)
+        .order_by(TaskKeywordCount.count.desc())
+        .limit(top_n)
+    )
+    top_keywords = [
+        {"keyword": keyword, "count": keyword_count, "post_count": post_count}
+        for keyword, keyword_count, post_count in result.all()
+    ]
+
+    return {
+        "task_id": task_id,
+        "analysis_count": count,
+        "sentiment": {
+            "average": (aggregate.sentiment_sum / count) if count else None,
+            "histogram": aggregate.sentiment_histogram if aggregate else {},
+        },
+        "ad_ratio": (aggregate.ad_count / count) if count else None,
+        "content_types": aggregate.content_type_counts if aggregate else {},
+        "average_quality": (aggregate.quality_sum / count) if count else None,
+        "top_keywords": top_keywords,
+    }
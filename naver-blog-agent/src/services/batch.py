@@ -0,0 +1,132 @@
+import asyncio
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+from loguru import logger
+
+from ..models import TaskCreate, TaskStatus
+
+
+def read_keywords(path: str) -> List[str]:
+    """키워드 파일 읽기 ("-"이면 표준 입력)
+
+    한 줄에 키워드 하나, 빈 줄과 '#'으로 시작하는 줄은 무시하고 중복은 제거한다.
+    """
+    if path == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+
+    keywords = [line.strip() for line in lines]
+    return list(dict.fromkeys(k for k in keywords if k and not k.startswith("#")))
+
+
+class BatchManifest:
+    """배치 진행 상황 파일 (중단 후 재실행 시 완료된 키워드는 건너뜀)
+
+    키워드별 상태가 바뀔 때마다 임시 파일에 쓴 뒤 교체하므로
+    프로세스가 도중에 종료돼도 파일이 깨지지 않는다.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f).get("keywords", {})
+
+    def is_completed(self, keyword: str) -> bool:
+        return self.entries.get(keyword, {}).get("status") == TaskStatus.COMPLETED.value
+
+    def update(self, keyword: str, **fields) -> None:
+        entry = self.entries.setdefault(keyword, {})
+        entry.update(fields, updated_at=datetime.now().isoformat(timespec="seconds"))
+        self.save()
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"keywords": self.entries}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+async def run_batch(
+    orchestrator,
+    keywords: List[str],
+    parallel: int = 4,
+    manifest: BatchManifest = None,
+    max_results: int = 100,
+    crawl_content: bool = True,
+    analyze_content: bool = True,
+    on_done: Callable[[str, Dict[str, Any]], None] = None,
+    timeout: Optional[float] = None
+) -> Dict[str, int]:
+    """여러 키워드를 한 프로세스에서 동시에 실행
+
+    오케스트레이터 하나를 공유하므로 DB 연결 풀, 크롤러 HTTP 연결 풀,
+    LLM 동시 호출 한도가 모든 키워드에 공통으로 적용된다.
+    parallel은 동시에 실행하는 키워드(작업) 수.
+    timeout은 키워드(작업)마다의 제한 시간(초)으로, 작업을 시작할 때부터 잰다.
+
+    Returns:
+        {"completed", "failed", "skipped"} 개수
+    """
+    manifest = manifest or BatchManifest()
+    counts = {"completed": 0, "failed": 0, "skipped": 0}
+
+    pending = []
+    for keyword in keywords:
+        if manifest.is_completed(keyword):
+            counts["skipped"] += 1
+        else:
+            pending.append(keyword)
+
+    if counts["skipped"]:
+        logger.info(f"이전 실행에서 완료된 키워드 {counts['skipped']}개 건너뜀")
+
+    await orchestrator.initialize()
+    semaphore = asyncio.Semaphore(parallel)
+
+    async def run_one(keyword: str) -> None:
+        async with semaphore:
+            task_id = None
+            try:
+                task = await orchestrator.create_task(TaskCreate(
+                    keyword=keyword,
+                    max_results=max_results,
+                    crawl_content=crawl_content,
+                    analyze_content=analyze_content,
+                    deadline=datetime.now() + timedelta(seconds=timeout) if timeout else None
+                ))
+                task_id = task.id
+                manifest.update(keyword, status=TaskStatus.SEARCHING.value, task_id=task_id, error=None)
+
+                result = await orchestrator.run_task(task_id, crawl_content, analyze_content)
+                entry = {
+                    "status": result.status.value,
+                    "task_id": task_id,
+                    "total_found": result.total_found,
+                    "total_crawled": result.total_crawled,
+                    "total_analyzed": result.total_analyzed,
+                }
+                # 취소/마감 초과로 중단된 키워드는 다음 실행에서 다시 시도
+                if result.status != TaskStatus.COMPLETED:
+                    entry["error"] = f"작업 중단 ({result.status.value})"
+                manifest.update(keyword, **entry)
+                counts["completed" if result.status == TaskStatus.COMPLETED else "failed"] += 1
+            except Exception as e:
+                logger.error(f"배치 키워드 실패 '{keyword}': {str(e)}")
+                entry = {"status": TaskStatus.FAILED.value, "task_id": task_id, "error": str(e)}
+                manifest.update(keyword, **entry)
+                counts["failed"] += 1
+
+            if on_done:
+                on_done(keyword, entry)
+
+    await asyncio.gather(*(run_one(keyword) for keyword in pending))
+    return counts
@@ -0,0 +1,370 @@
+import asyncio
+import json
+import os
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from loguru import logger
+
+from ..core.concurrency import flow
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+
+def _api_schema(schema: Any) -> Any:
+    """응답 스키마를 REST 형식으로 (type 값은 대문자 열거형)"""
+    if isinstance(schema, dict):
+        return {
+            key: value.upper() if key == "type" else _api_schema(value)
+            for key, value in schema.items()
+        }
+    if isinstance(schema, list):
+        return [_api_schema(item) for item in schema]
+    return schema
+
+
+def build_request_line(key: str, prompt: str, schema: Dict[str, Any]) -> str:
+    """배치 요청 파일 한 줄 (Gemini Batch API JSONL 형식)"""
+    return json.dumps({
+        "key": key,
+        "request": {
+            "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+            "generationConfig": {"responseMimeType": "application/json", "responseSchema": _api_schema(schema)},
+        },
+    }, ensure_ascii=False)
+
+
+def parse_result_line(line: str) -> Tuple[str, Optional[str], Dict[str, int], Optional[str]]:
+    """배치 결과 한 줄 → (key, 응답 텍스트, 토큰 사용량, 오류)"""
+    data = json.loads(line)
+    key = data.get("key", "")
+    if data.get("error"):
+        return key, None, {}, str(data["error"])
+
+    response = data.get("response") or {}
+    usage = response.get("usageMetadata") or response.get("usage_metadata") or {}
+    tokens = {
+        "prompt": int(usage.get("promptTokenCount", usage.get("prompt_token_count", 0)) or 0),
+        "output": int(usage.get("candidatesTokenCount", usage.get("candidates_token_count", 0)) or 0),
+    }
+    try:
+        parts = response["candidates"][0]["content"]["parts"]
+        text = "".join(part.get("text", "") for part in parts)
+    except (KeyError, IndexError, TypeError):
+        return key, None, tokens, "응답에 후보가 없음"
+    return key, text, tokens, None
+
+
+class GeminiBatchBackend:
+    """Gemini Batch API (google-genai 패키지 필요)
+
+    요청 파일을 업로드해 배치 작업을 만들고, 완료되면 결과 파일을 내려받는다.
+    """
+
+    _STATES = {
+        "JOB_STATE_PENDING": JOB_PENDING,
+        "JOB_STATE_QUEUED": JOB_PENDING,
+        "JOB_STATE_RUNNING": JOB_RUNNING,
+        "JOB_STATE_SUCCEEDED": JOB_SUCCEEDED,
+        "JOB_STATE_FAILED": JOB_FAILED,
+        "JOB_STATE_CANCELLED": JOB_FAILED,
+        "JOB_STATE_EXPIRED": JOB_FAILED,
+    }
+
+    def __init__(self, api_key: str):
+        try:
+            from google import genai
+        except ImportError:
+            raise ImportError("google-genai 패키지가 필요합니다: pip install google-genai")
+        self._client = genai.Client(api_key=api_key)
+
+    async def submit(self, path: str, model: str, display_name: str) -> str:
+        uploaded = await asyncio.to_thread(
+            self._client.files.upload,
+            file=path,
+            config={"display_name": display_name, "mime_type": "jsonl"}
+        )
+        job = await asyncio.to_thread(
+            self._client.batches.create,
+            model=model,
+            src=uploaded.name,
+            config={"display_name": display_name}
+        )
+        return job.name
+
+    async def state(self, job_name: str) -> str:
+        job = await asyncio.to_thread(self._client.batches.get, name=job_name)
+        return self._STATES.get(job.state.name, JOB_RUNNING)
+
+    async def download(self, job_name: str, path: str) -> None:
+        job = await asyncio.to_thread(self._client.batches.get, name=job_name)
+        data = await asyncio.to_thread(self._client.files.download, file=job.dest.file_name)
+        with open(path, "wb") as f:
+            f.write(data)
+
+
+class LocalBatchBackend:
+    """배치 서비스 대역 (테스트/시험 실행용)
+
+    제출된 요청마다 responder(요청) → 응답 텍스트를 호출해 Gemini 배치 결과와 같은 형식의
+    파일을 만든다. responder가 예외를 내면 그 요청은 오류 줄이 된다. 작업은 조회
+    polls_until_done번 뒤에 완료된다.
+    """
+
+    def __init__(self, responder: Callable[[Dict[str, Any]], str], polls_until_done: int = 1):
+        self.responder = responder
+        self.polls_until_done = polls_until_done
+        self.submitted: List[str] = []
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+
+    async def submit(self, path: str, model: str, display_name: str) -> str:
+        job_name = f"batches/local-{len(self._jobs) + 1}"
+        self._jobs[job_name] = {"path": path, "polls": 0}
+        self.submitted.append(job_name)
+        return job_name
+
+    async def state(self, job_name: str) -> str:
+        job = self._jobs[job_name]
+        job["polls"] += 1
+        return JOB_SUCCEEDED if job["polls"] >= self.polls_until_done else JOB_RUNNING
+
+    async def download(self, job_name: str, path: str) -> None:
+        with open(self._jobs[job_name]["path"], encoding="utf-8") as src, \
+                open(path, "w", encoding="utf-8") as dst:
+            for line in src:
+                request = json.loads(line)
+                try:
+                    text = self.responder(request)
+                    result = {
+                        "key": request["key"],
+                        "response": {
+                            "candidates": [{"content": {"parts": [{"text": text}]}}],
+                            "usageMetadata": {"promptTokenCount": len(line), "candidatesTokenCount": len(text)},
+                        },
+                    }
+                except Exception as e:
+                    result = {"key": request["key"], "error": {"message": str(e)}}
+                dst.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+
+class BulkAnalyzer:
+    """작업 전체 분석을 배치 작업 하나로 처리 (오프라인 대량 분석)
+
+    작업에 연결된 게시글 중 본문이 있고 아직 이 작업의 분석이 없는 것을 요청 파일(JSONL)로
+    쓰고, 배치 서비스에 제출해 poll_interval마다 완료를 확인한 뒤 결과를 파싱해 Analysis에
+    일괄 저장한다. 제출한 배치 작업은 work_dir/{task_id}.job.json에 남겨, 중단 후 다시
+    실행하면 새로 제출하지 않고 이어서 기다린다. 실패하거나 형식이 잘못된 게시글은
+    분석하지 않은 채로 남아 다음 실행 때 다시 제출된다.
+    """
+
+    def __init__(
+        self,
+        db,
+        agent,
+        backend,
+        work_dir: str,
+        poll_interval: float = 60.0,
+        price_factor: float = 0.5,
+        chunk_size: int = 500
+    ):
+        self.db = db
+        self.agent = agent
+        self.backend = backend
+        self.work_dir = work_dir
+        self.poll_interval = poll_interval
+        self.price_factor = price_factor
+        self.chunk_size = chunk_size
+
+    def _paths(self, task_id: str) -> Dict[str, str]:
+        return {
+            "requests": os.path.join(self.work_dir, f"{task_id}.requests.jsonl"),
+            "results": os.path.join(self.work_dir, f"{task_id}.results.jsonl"),
+            "job": os.path.join(self.work_dir, f"{task_id}.job.json"),
+        }
+
+    async def run(self, task_id: str) -> Dict[str, int]:
+        """작업의 미분석 게시글을 배치 작업으로 분석해 저장
+
+        Returns:
+            {"requests", "succeeded", "invalid", "failed", "saved"}
+        """
+        os.makedirs(self.work_dir, exist_ok=True)
+        paths = self._paths(task_id)
+        counts = {"requests": 0, "succeeded": 0, "invalid": 0, "failed": 0, "saved": 0}
+
+        if os.path.exists(paths["job"]):
+            with open(paths["job"], encoding="utf-8") as f:
+                job = json.load(f)
+            logger.info(f"[{task_id}] 제출된 배치 작업 이어서 대기: {job['job']}")
+        else:
+            count = await self._write_requests(task_id, paths["requests"])
+            if not count:
+                logger.info(f"[{task_id}] 일괄 분석할 게시글 없음")
+                os.remove(paths["requests"])
+                return counts
+
+            name = await self.backend.submit(paths["requests"], self.agent.model, f"nbas-{task_id}")
+            job = {"job": name, "requests": count, "submitted_at": datetime.now().isoformat()}
+            with open(paths["job"], "w", encoding="utf-8") as f:
+                json.dump(job, f)
+            logger.info(f"[{task_id}] 배치 작업 제출: {name} ({count}개)")
+
+        counts["requests"] = job["requests"]
+        state = await self._wait(job["job"])
+        if state != JOB_SUCCEEDED:
+            os.remove(paths["job"])
+            raise RuntimeError(f"배치 작업 실패: {job['job']} ({state})")
+
+        await self.backend.download(job["job"], paths["results"])
+        await self._save_results(task_id, paths["results"], counts)
+
+        for name in ("requests", "results", "job"):
+            if os.path.exists(paths[name]):
+                os.remove(paths[name])
+
+        logger.info(f"[{task_id}] 일괄 분석 완료: {counts}")
+        return counts
+
+    async def _wait(self, job_name: str) -> str:
+        while True:
+            state = await self.backend.state(job_name)
+            if state in (JOB_SUCCEEDED, JOB_FAILED):
+                return state
+            await asyncio.sleep(self.poll_interval)
+
+    async def _write_requests(self, task_id: str, path: str) -> int:
+        """분석할 게시글을 요청 파일로 기록, 요청 수 반환"""
+        from sqlalchemy import select, exists
+        from sqlalchemy.orm import selectinload
+        from ..core.database import BlogPost, TaskPost, Analysis
+        from ..agents.analysis_agent import ANALYSIS_SCHEMA
+        from ..models import ContentRecord
+
+        analyzed = exists().where(Analysis.post_id == BlogPost.id).where(Analysis.task_id == task_id)
+        statement = (
+            select(BlogPost)
+            .options(selectinload(BlogPost.content_blob))
+            .join(TaskPost, TaskPost.post_id == BlogPost.id)
+            .where(TaskPost.task_id == task_id)
+            .where(~analyzed)
+            .order_by(TaskPost.rank)
+        )
+
+        count = 0
+        offset = 0
+        with open(path, "w", encoding="utf-8") as f:
+            while True:
+                async with self.db.async_session() as session:
+                    result = await session.execute(statement.offset(offset).limit(self.chunk_size))
+                    posts = result.scalars().all()
+                    if not posts:
+                        break
+                    offset += len(posts)
+
+                    for post in posts:
+                        if not post.has_content:
+                            continue
+                        content = ContentRecord(url=post.url, title=post.title, author=post.author, content=post.content)
+                        f.write(build_request_line(post.id, self.agent._build_prompt(content), ANALYSIS_SCHEMA) + "\n")
+                        count += 1
+        return count
+
+    def _read_results(self, path: str) -> Iterator[Tuple[str, Optional[str], Dict[str, int], Optional[str]]]:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield parse_result_line(line)
+
+    async def _save_results(self, task_id: str, path: str, counts: Dict[str, int]) -> None:
+        from sqlalchemy import select, func, update
+        from ..core.database import SearchTask, Analysis
+        from ..agents.analysis_agent import LLM_RESPONSES
+        from .aggregates import bump_result_version
+
+        model = self.agent.model
+        chunk: List[Tuple[str, str]] = []
+
+        with flow(task_id):
+            for key, text, tokens, error in self._read_results(path):
+                if tokens:
+                    await self.agent.usage.record(
+                        model, tokens["prompt"], tokens["output"], latency=0.0,
+                        agent="bulk", price_factor=self.price_factor
+                    )
+                if error:
+                    counts["failed"] += 1
+                    LLM_RESPONSES.inc(model=model, mode="bulk", outcome="error")
+                    logger.debug(f"[{task_id}] 배치 결과 오류 ({key}): {error}")
+                    continue
+
+                chunk.append((key, text))
+                if len(chunk) >= self.chunk_size:
+                    await self._save_chunk(task_id, chunk, counts)
+                    chunk = []
+
+            if chunk:
+                await self._save_chunk(task_id, chunk, counts)
+
+        async with self.db.async_session() as session:
+            analyzed = (await session.execute(
+                select(func.count()).select_from(Analysis).where(Analysis.task_id == task_id)
+            )).scalar_one()
+            await session.execute(
+                update(SearchTask).where(SearchTask.id == task_id).values(total_analyzed=analyzed)
+            )
+            if counts["saved"]:
+                await bump_result_version(session, task_ids=[task_id])
+            await session.commit()
+
+    async def _save_chunk(self, task_id: str, chunk: List[Tuple[str, str]], counts: Dict[str, int]) -> None:
+        """결과 묶음을 파싱해 한 트랜잭션으로 저장 (이미 분석된 게시글은 건너뜀)"""
+        import uuid
+        from sqlalchemy import select
+        from ..core.database import BlogPost, Analysis
+        from ..agents.analysis_agent import LLM_RESPONSES
+        from .aggregates import record_analysis
+
+        model = self.agent.model
+        async with self.db.async_session() as session:
+            post_ids = [key for key, _ in chunk]
+            urls = dict((await session.execute(
+                select(BlogPost.id, BlogPost.url).where(BlogPost.id.in_(post_ids))
+            )).all())
+            done = set((await session.execute(
+                select(Analysis.post_id).where(Analysis.task_id == task_id).where(Analysis.post_id.in_(post_ids))
+            )).scalars().all())
+
+            for post_id, text in chunk:
+                if post_id not in urls or post_id in done:
+                    continue
+                try:
+                    data = self.agent._parse_response(text, urls[post_id])
+                except (json.JSONDecodeError, KeyError, ValueError, TypeError) as e:
+                    counts["invalid"] += 1
+                    LLM_RESPONSES.inc(model=model, mode="bulk", outcome="invalid")
+                    logger.debug(f"[{task_id}] 배치 응답 형식 오류 ({post_id}): {str(e)}")
+                    continue
+
+                counts["succeeded"] += 1
+                LLM_RESPONSES.inc(model=model, mode="bulk", outcome="valid")
+                analysis = Analysis(
+                    id=str(uuid.uuid4()),
+                    post_id=post_id,
+                    task_id=task_id,
+                    url=data.url,
+                    sentiment_score=data.sentiment_score,
+                    sentiment_label=data.sentiment_label.value,
+                    keywords=data.keywords,
+                    summary=data.summary,
+                    content_type=data.content_type.value,
+                    is_ad=data.is_ad,
+                    quality_score=data.quality_score
+                )
+                session.add(analysis)
+                await record_analysis(session, task_id, analysis)
+                done.add(post_id)
+                counts["saved"] += 1
+
+            await session.commit()
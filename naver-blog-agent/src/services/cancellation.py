@@ -0,0 +1,81 @@
+import asyncio
+from datetime import datetime
+from typing import Optional
+from loguru import logger
+
+from ..models import TaskStatus
+
+
+class TaskWatchdog:
+    """실행 중인 작업의 취소 요청과 마감 시각 감시
+
+    DB의 cancel_requested(다른 프로세스의 취소 요청)를 주기적으로 확인하고, 취소 요청이나
+    마감 시각을 발견하면 작업을 실행 중인 asyncio 태스크를 취소한다. 취소는 진행 중인
+    await 지점(검색 페이징, 수집 gather, Playwright, 분석 요청)으로 바로 전달되고,
+    reason에 CANCELLED/TIMED_OUT이 남는다. 외부 종료로 인한 취소면 reason은 None.
+    """
+
+    def __init__(self, db, task_id: str, deadline: datetime = None, poll_interval: float = 2.0):
+        self.db = db
+        self.task_id = task_id
+        self.deadline = deadline
+        self.poll_interval = poll_interval
+        self.reason: Optional[TaskStatus] = None
+        self._wake = asyncio.Event()
+        self._target: Optional[asyncio.Task] = None
+        self._watcher: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """현재 태스크 감시 시작"""
+        self._target = asyncio.current_task()
+        self._watcher = asyncio.create_task(self._watch())
+
+    def request_cancel(self) -> None:
+        """같은 프로세스의 취소 요청 (DB 확인 주기를 기다리지 않음)"""
+        self._wake.set()
+
+    async def stop(self) -> None:
+        if self._watcher is not None and not self._watcher.done():
+            self._watcher.cancel()
+            try:
+                await self._watcher
+            except asyncio.CancelledError:
+                pass
+
+    def _trigger(self, reason: TaskStatus) -> None:
+        self.reason = reason
+        logger.info(f"[{self.task_id}] 작업 중단: {reason.value}")
+        self._target.cancel()
+
+    async def _cancel_requested(self) -> bool:
+        from sqlalchemy import select
+        from ..core.database import SearchTask
+
+        try:
+            async with self.db.async_session() as session:
+                result = await session.execute(
+                    select(SearchTask.cancel_requested).where(SearchTask.id == self.task_id)
+                )
+                return bool(result.scalar_one_or_none())
+        except Exception as e:
+            logger.warning(f"[{self.task_id}] 취소 요청 확인 실패: {str(e)}")
+            return False
+
+    async def _watch(self) -> None:
+        while True:
+            timeout = self.poll_interval
+            if self.deadline is not None:
+                remaining = (self.deadline - datetime.now()).total_seconds()
+                if remaining <= 0:
+                    self._trigger(TaskStatus.TIMED_OUT)
+                    return
+                timeout = min(timeout, remaining)
+
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+            if self._wake.is_set() or await self._cancel_requested():
+                self._trigger(TaskStatus.CANCELLED)
+                return
@@ -0,0 +1,155 @@
+import hashlib
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+from loguru import logger
+
+from ..core.config import get_settings
+
+SIMHASH_BITS = 64
+# 64비트를 16비트 밴드 4개로 분할: 해밍 거리 3 이하인 두 서명은
+# 비둘기집 원리에 의해 적어도 하나의 밴드가 정확히 일치한다
+BAND_COUNT = 4
+BAND_BITS = SIMHASH_BITS // BAND_COUNT
+SHINGLE_SIZE = 3
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _shingles(text: str, size: int = SHINGLE_SIZE) -> Counter:
+    """공백 정규화 후 글자 n-gram 빈도 (한국어 어절 변형에 강함)"""
+    normalized = _WHITESPACE.sub(" ", text).strip().lower()
+    if len(normalized) <= size:
+        return Counter([normalized]) if normalized else Counter()
+    return Counter(normalized[i:i + size] for i in range(len(normalized) - size + 1))
+
+
+def _hash64(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def simhash(text: str) -> int:
+    """64비트 SimHash 서명"""
+    weights = [0] * SIMHASH_BITS
+    for shingle, count in _shingles(text).items():
+        h = _hash64(shingle)
+        for bit in range(SIMHASH_BITS):
+            if h >> bit & 1:
+                weights[bit] += count
+            else:
+                weights[bit] -= count
+
+    signature = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            signature |= 1 << bit
+    return signature
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def split_bands(signature: int) -> List[int]:
+    """서명을 밴드 값 목록으로 분할"""
+    mask = (1 << BAND_BITS) - 1
+    return [(signature >> (band * BAND_BITS)) & mask for band in range(BAND_COUNT)]
+
+
+def to_hex(signature: int) -> str:
+    return f"{signature:016x}"
+
+
+class NearDuplicateDetector:
+    """SimHash 기반 유사 중복 게시글 클러스터링
+
+    서명과 밴드 색인을 게시글별로 DB에 저장하므로 이전 작업에서 수집한
+    게시글과도 같은 클러스터로 묶인다. 클러스터 ID는 처음 등록된 게시글의 ID.
+    """
+
+    def __init__(self, max_distance: int = None):
+        settings = get_settings()
+        self.max_distance = max_distance if max_distance is not None else settings.dedup_max_distance
+
+    async def assign_clusters(self, session, posts: List[Tuple[str, str]]) -> Dict[str, str]:
+        """(post_id, 본문) 목록에 클러스터 ID를 부여하고 저장
+
+        Returns:
+            post_id → cluster_id
+        """
+        from sqlalchemy import delete, select, tuple_
+        from ..core.database import BlogPost, PostSignatureBand
+
+        signatures = {post_id: simhash(text) for post_id, text in posts if text}
+        if not signatures:
+            return {}
+
+        # DB에 저장된 후보 (밴드 값이 하나라도 일치하는 게시글)
+        band_keys = {
+            (band, value)
+            for signature in signatures.values()
+            for band, value in enumerate(split_bands(signature))
+        }
+        candidates: Dict[int, Dict[int, List[str]]] = {band: {} for band in range(BAND_COUNT)}
+        stored: Dict[str, Tuple[int, Optional[str]]] = {}
+
+        band_list = list(band_keys)
+        for i in range(0, len(band_list), 500):
+            chunk = band_list[i:i + 500]
+            result = await session.execute(
+                select(PostSignatureBand.post_id, PostSignatureBand.band, PostSignatureBand.value, BlogPost.simhash, BlogPost.cluster_id)
+                .join(BlogPost, BlogPost.id == PostSignatureBand.post_id)
+                .where(tuple_(PostSignatureBand.band, PostSignatureBand.value).in_(chunk))
+            )
+            for post_id, band, value, stored_hash, cluster_id in result.all():
+                # 이번에 서명을 새로 구한 게시글의 이전 밴드는 후보에서 제외
+                if not stored_hash or post_id in signatures:
+                    continue
+                candidates[band].setdefault(value, []).append(post_id)
+                stored[post_id] = (int(stored_hash, 16), cluster_id or post_id)
+
+        clusters: Dict[str, str] = {}
+        for post_id, signature in signatures.items():
+            cluster_id = None
+            for band, value in enumerate(split_bands(signature)):
+                for other_id in candidates[band].get(value, []):
+                    other_signature, other_cluster = stored[other_id]
+                    if hamming_distance(signature, other_signature) <= self.max_distance:
+                        cluster_id = other_cluster
+                        break
+                if cluster_id:
+                    break
+
+            cluster_id = cluster_id or post_id
+            clusters[post_id] = cluster_id
+
+            # 같은 배치의 이후 게시글이 후보로 찾을 수 있도록 등록
+            stored[post_id] = (signature, cluster_id)
+            for band, value in enumerate(split_bands(signature)):
+                candidates[band].setdefault(value, []).append(post_id)
+
+        # 서명, 클러스터 저장. 서명이 바뀐 게시글(재수집)은 밴드 색인을 다시 씀
+        post_ids = list(signatures)
+        changed: List[str] = []
+        for i in range(0, len(post_ids), 500):
+            result = await session.execute(
+                select(BlogPost).where(BlogPost.id.in_(post_ids[i:i + 500]))
+            )
+            for post in result.scalars().all():
+                new_hash = to_hex(signatures[post.id])
+                if post.simhash != new_hash:
+                    changed.append(post.id)
+                post.simhash = new_hash
+                post.cluster_id = clusters[post.id]
+
+        for i in range(0, len(changed), 500):
+            await session.execute(
+                delete(PostSignatureBand).where(PostSignatureBand.post_id.in_(changed[i:i + 500]))
+            )
+        for post_id in changed:
+            for band, value in enumerate(split_bands(signatures[post_id])):
+                session.add(PostSignatureBand(post_id=post_id, band=band, value=value))
+
+        duplicates = sum(1 for post_id, cluster_id in clusters.items() if post_id != cluster_id)
+        logger.info(f"유사 중복 탐지: {len(clusters)}개 중 {duplicates}개 중복")
+        return clusters
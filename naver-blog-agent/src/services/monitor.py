@@ -0,0 +1,125 @@
+import asyncio
+from datetime import datetime
+from typing import List
+from loguru import logger
+
+from ..core.config import get_settings
+from ..models import TaskCreate
+from ..utils.cron import cron_next, parse_cron
+
+
+async def create_monitor(db, keyword: str, cron: str, max_results: int = 100):
+    """키워드 모니터 등록"""
+    from ..core.database import Monitor
+
+    parse_cron(cron)  # 잘못된 표현식은 등록 전에 거부
+
+    async with db.async_session() as session:
+        monitor = Monitor(
+            keyword=keyword,
+            cron=cron,
+            max_results=max_results,
+            next_run_at=cron_next(cron, datetime.now())
+        )
+        session.add(monitor)
+        await session.commit()
+        await session.refresh(monitor)
+        return monitor
+
+
+async def list_monitors(db) -> List:
+    from sqlalchemy import select
+    from ..core.database import Monitor
+
+    async with db.async_session() as session:
+        result = await session.execute(select(Monitor).order_by(Monitor.created_at))
+        return list(result.scalars().all())
+
+
+async def delete_monitor(db, monitor_id: str) -> bool:
+    from ..core.database import Monitor
+
+    async with db.async_session() as session:
+        monitor = await session.get(Monitor, monitor_id)
+        if monitor is None:
+            return False
+        await session.delete(monitor)
+        await session.commit()
+        return True
+
+
+class MonitorScheduler:
+    """cron 일정이 된 모니터마다 monitor 작업을 생성해 실행
+
+    monitor 작업은 키워드 기준점(KeywordWatermark) 이후의 새 게시글만 수집하므로
+    자주 실행해도 API 호출과 크롤링은 새로 올라온 글 수에 비례한다.
+    task_execution_mode="queue"이면 작업만 생성하고 실행은 `nbas worker`에 맡긴다.
+    """
+
+    def __init__(self, orchestrator, poll_interval: float = None):
+        settings = get_settings()
+        self.orchestrator = orchestrator
+        self.poll_interval = poll_interval or settings.monitor_poll_interval
+        self.inline = settings.task_execution_mode != "queue"
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    async def run_due(self, now: datetime = None) -> List[str]:
+        """실행 시각이 된 모니터의 작업 생성 (생성한 작업 ID 반환)"""
+        from sqlalchemy import select
+        from ..core.database import Monitor
+
+        now = now or datetime.now()
+        task_ids = []
+
+        async with self.orchestrator.db.async_session() as session:
+            result = await session.execute(
+                select(Monitor)
+                .where(Monitor.enabled.is_(True))
+                .where(Monitor.next_run_at <= now)
+                .order_by(Monitor.next_run_at)
+            )
+            monitors = result.scalars().all()
+
+            for monitor in monitors:
+                task = await self.orchestrator.create_task(TaskCreate(
+                    keyword=monitor.keyword,
+                    max_results=monitor.max_results,
+                    task_type="monitor"
+                ))
+                monitor.last_run_at = now
+                monitor.last_task_id = task.id
+                monitor.next_run_at = cron_next(monitor.cron, now)
+                task_ids.append(task.id)
+                logger.info(f"모니터 실행: {monitor.keyword} → {task.id} (다음: {monitor.next_run_at})")
+
+            await session.commit()
+
+        if self.inline:
+            for task_id in task_ids:
+                try:
+                    await self.orchestrator.run_task(task_id)
+                except Exception as e:
+                    logger.error(f"모니터 작업 실패 {task_id}: {str(e)}")
+
+        return task_ids
+
+    async def run(self) -> None:
+        """중지될 때까지 주기적으로 due 모니터 실행"""
+        await self.orchestrator.initialize()
+        logger.info(f"모니터 스케줄러 시작 (확인 주기 {self.poll_interval}초)")
+
+        while not self._stopping.is_set():
+            try:
+                await self.run_due()
+            except Exception as e:
+                logger.error(f"모니터 확인 실패: {str(e)}")
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+        logger.info("모니터 스케줄러 종료")
+
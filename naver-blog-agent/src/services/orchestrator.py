@@ -1,59 +1,150 @@
 import asyncio
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator, TYPE_CHECKING
 from datetime import datetime
 from loguru import logger
 
-from ..agents import SearchAgent, HybridCrawlerAgent, AnalysisAgent, RSSCrawlerAgent
+from ..core.config import get_settings
+from ..core.concurrency import flow
+from ..core.llm_usage import LlmUsageRecorder, create_llm_usage
+from ..utils.helpers import canonical_post_id
+from ..utils.singleflight import SingleFlight
 from ..models import (
-    SearchInput, BlogPostMeta, BlogContent, AnalysisResult,
+    SearchInput, PostMetaRecord, ContentRecord, AnalysisResult,
     TaskStatus, TaskCreate, TaskResponse
 )
-from ..core.database import Database, get_database, SearchTask, BlogPost, Analysis
-from sqlalchemy import select
+
+if TYPE_CHECKING:
+    from ..agents import SearchAgent, HybridCrawlerAgent, AnalysisAgent, RSSCrawlerAgent, LocalAnalyzerAgent
+    from ..core.database import Database
+    from .cancellation import TaskWatchdog
+
+
+# 더 이상 실행되지 않는 작업 상태
+FINISHED_STATUSES = [
+    TaskStatus.COMPLETED.value,
+    TaskStatus.FAILED.value,
+    TaskStatus.CANCELLED.value,
+    TaskStatus.TIMED_OUT.value,
+]
+
+
+def _local_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """시간대가 있는 시각은 로컬 시각으로 바꿔 DB의 naive datetime과 비교할 수 있게 함"""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone().replace(tzinfo=None)
+    return value
 
 
 class Orchestrator:
-    """에이전트 조율 및 워크플로우 관리"""
+    """에이전트 조율 및 워크플로우 관리
+
+    에이전트와 DB 엔진은 처음 사용할 때 생성된다. 검색만 하는 CLI 호출이나
+    헬스 체크가 Gemini SDK, 크롤러 클라이언트를 불러오지 않도록 하기 위함.
+    """
 
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
-        self.search_agent = SearchAgent(config)
-        self.crawler_agent = HybridCrawlerAgent(config)
-        self.analysis_agent = AnalysisAgent(config)
-        self.rss_agent = RSSCrawlerAgent(config)
-        self.db = get_database()
+        self._search_agent: Optional["SearchAgent"] = None
+        self._crawler_agent: Optional["HybridCrawlerAgent"] = None
+        self._analysis_agent: Optional["AnalysisAgent"] = None
+        self._rss_agent: Optional["RSSCrawlerAgent"] = None
+        self._local_analyzer: Optional["LocalAnalyzerAgent"] = None
+        self._db: Optional["Database"] = None
+        self._llm_usage: Optional["LlmUsageRecorder"] = None
         self._initialized = False
+        # 빠른 검색/분석: 동시에 들어온 같은 요청은 한 번만 실행
+        self._quick_flight = SingleFlight(ttl=get_settings().quick_result_ttl)
+        # 이 프로세스에서 실행 중인 작업의 감시자 (취소 요청을 바로 전달)
+        self._watchdogs: Dict[str, "TaskWatchdog"] = {}
+
+    @property
+    def db(self) -> "Database":
+        if self._db is None:
+            from ..core.database import get_database
+            self._db = get_database()
+        return self._db
+
+    @property
+    def llm_usage(self) -> "LlmUsageRecorder":
+        """LLM 사용량 기록기 (작업 결과와 같은 DB에 기록)"""
+        if self._llm_usage is None:
+            self._llm_usage = create_llm_usage(self.db)
+        return self._llm_usage
+
+    @property
+    def search_agent(self) -> "SearchAgent":
+        if self._search_agent is None:
+            from ..agents.search_agent import SearchAgent
+            self._search_agent = SearchAgent(self.config)
+        return self._search_agent
+
+    @property
+    def crawler_agent(self) -> "HybridCrawlerAgent":
+        if self._crawler_agent is None:
+            from ..agents.crawler_agent import HybridCrawlerAgent
+            self._crawler_agent = HybridCrawlerAgent(self.config)
+        return self._crawler_agent
+
+    @property
+    def analysis_agent(self) -> "AnalysisAgent":
+        if self._analysis_agent is None:
+            from ..agents.analysis_agent import AnalysisAgent
+            self._analysis_agent = AnalysisAgent(self.config)
+            self._analysis_agent.usage = self.llm_usage
+        return self._analysis_agent
+
+    @property
+    def rss_agent(self) -> "RSSCrawlerAgent":
+        if self._rss_agent is None:
+            from ..agents.rss_agent import RSSCrawlerAgent
+            self._rss_agent = RSSCrawlerAgent(self.config)
+        return self._rss_agent
+
+    @property
+    def local_analyzer(self) -> "LocalAnalyzerAgent":
+        if self._local_analyzer is None:
+            from ..agents.local_analyzer import LocalAnalyzerAgent
+            self._local_analyzer = LocalAnalyzerAgent(self.config)
+        return self._local_analyzer
+
+    def _created_agents(self) -> list:
+        """지금까지 생성된 에이전트 목록"""
+        agents = [
+            self._search_agent, self._crawler_agent, self._analysis_agent,
+            self._rss_agent, self._local_analyzer,
+        ]
+        return [agent for agent in agents if agent is not None]
 
     async def initialize(self):
-        """초기화"""
+        """초기화 (DB 스키마만 생성, 에이전트는 첫 사용 시 초기화)"""
         if self._initialized:
             return
 
         await self.db.init_db()
-        await self.search_agent.initialize()
-        await self.crawler_agent.initialize()
-        await self.analysis_agent.initialize()
-        await self.rss_agent.initialize()
         self._initialized = True
         logger.info("Orchestrator initialized")
 
     async def cleanup(self):
         """정리"""
-        await self.search_agent.cleanup()
-        await self.crawler_agent.cleanup()
-        await self.analysis_agent.cleanup()
-        await self.rss_agent.cleanup()
+        for agent in self._created_agents():
+            await agent.cleanup()
         self._initialized = False
 
     async def create_task(self, task_input: TaskCreate) -> TaskResponse:
         """새 작업 생성"""
+        from ..core.database import SearchTask
+
         async with self.db.async_session() as session:
             task = SearchTask(
                 keyword=task_input.keyword,
                 start_date=str(task_input.start_date) if task_input.start_date else None,
                 end_date=str(task_input.end_date) if task_input.end_date else None,
                 max_results=task_input.max_results,
-                status=TaskStatus.PENDING.value
+                status=TaskStatus.PENDING.value,
+                crawl_content=task_input.crawl_content,
+                analyze_content=task_input.analyze_content,
+                task_type=task_input.task_type,
+                deadline=_local_naive(task_input.deadline)
             )
             session.add(task)
             await session.commit()
@@ -63,9 +154,40 @@ class Orchestrator:
                 id=task.id,
                 status=TaskStatus.PENDING,
                 keyword=task.keyword,
-                created_at=task.created_at
+                created_at=task.created_at,
+                deadline=task.deadline
             )
 
+    async def cancel_task(self, task_id: str) -> Optional[TaskResponse]:
+        """작업 취소 요청
+
+        대기 중인 작업은 바로 CANCELLED로 바꾸고, 실행 중인 작업은 취소 요청만 기록한다.
+        실행 중인 프로세스가 요청을 발견하면 그때까지의 결과를 저장하고 CANCELLED로 끝낸다.
+        """
+        from sqlalchemy import update
+        from ..core.database import SearchTask
+
+        async with self.db.async_session() as session:
+            await session.execute(
+                update(SearchTask)
+                .where(SearchTask.id == task_id)
+                .where(SearchTask.status.notin_(FINISHED_STATUSES))
+                .values(cancel_requested=True)
+            )
+            await session.execute(
+                update(SearchTask)
+                .where(SearchTask.id == task_id)
+                .where(SearchTask.status == TaskStatus.PENDING.value)
+                .values(status=TaskStatus.CANCELLED.value, completed_at=datetime.now())
+            )
+            await session.commit()
+
+        watchdog = self._watchdogs.get(task_id)
+        if watchdog is not None:
+            watchdog.request_cancel()
+
+        return await self.get_task_status(task_id)
+
     async def run_task(
         self,
         task_id: str,
@@ -73,7 +195,22 @@ class Orchestrator:
         analyze_content: bool = True,
         progress_callback: callable = None
     ) -> TaskResponse:
-        """전체 워크플로우 실행"""
+        """전체 워크플로우 실행
+
+        크롤러/LLM 동시 실행 슬롯은 작업 단위로 공정하게 나눠 받는다.
+        """
+        with flow(task_id):
+            return await self._run_task(task_id, crawl_content, analyze_content, progress_callback)
+
+    async def _run_task(
+        self,
+        task_id: str,
+        crawl_content: bool,
+        analyze_content: bool,
+        progress_callback: callable
+    ) -> TaskResponse:
+        from sqlalchemy import select
+        from ..core.database import SearchTask
 
         if not self._initialized:
             await self.initialize()
@@ -88,6 +225,20 @@ class Orchestrator:
             if not task:
                 raise ValueError(f"Task not found: {task_id}")
 
+            # 실행 전에 이미 취소됐거나 마감이 지난 작업
+            if task.cancel_requested or task.status == TaskStatus.CANCELLED.value:
+                return await self._finish_interrupted(session, task, TaskStatus.CANCELLED)
+            if task.deadline and task.deadline <= datetime.now():
+                return await self._finish_interrupted(session, task, TaskStatus.TIMED_OUT)
+
+            from .cancellation import TaskWatchdog
+            watchdog = TaskWatchdog(
+                self.db, task_id, task.deadline,
+                poll_interval=get_settings().task_cancel_poll_interval
+            )
+            watchdog.start()
+            self._watchdogs[task_id] = watchdog
+
             try:
                 # 1. 검색 단계
                 logger.info(f"[{task_id}] 검색 시작: {task.keyword}")
@@ -104,31 +255,31 @@ class Orchestrator:
                     max_results=task.max_results
                 )
 
+                # 모니터링 작업: 최신순으로 지난 실행 이후 새 글만 수집
+                watermark = None
+                if task.task_type == "monitor":
+                    watermark = await self._load_watermark(session, task.keyword)
+                    search_input.sort = "date"
+                    search_input.known_ids = list(watermark.seen_ids or [])
+                    search_input.since_postdate = watermark.newest_postdate
+
                 search_result = await self.search_agent.run(search_input)
 
                 if not search_result.success:
                     raise Exception(f"검색 실패: {search_result.error}")
 
-                posts_meta: List[BlogPostMeta] = search_result.data
+                posts_meta: List[PostMetaRecord] = search_result.data
                 task.total_found = len(posts_meta)
                 await session.commit()
 
                 logger.info(f"[{task_id}] 검색 완료: {len(posts_meta)}개 발견")
 
-                # DB에 검색 결과 저장
-                for meta in posts_meta:
-                    post = BlogPost(
-                        task_id=task_id,
-                        url=meta.link,
-                        title=meta.title.replace("<b>", "").replace("</b>", ""),
-                        author=meta.bloggername,
-                        post_date=meta.postdate
-                    )
-                    session.add(post)
-
+                # DB에 검색 결과 저장 (다른 작업이 저장한 게시글은 연결만)
+                posts = await self._link_posts(session, task_id, posts_meta)
                 await session.commit()
 
                 # 2. 수집 단계
+                clusters: Dict[str, str] = {}
                 if crawl_content and posts_meta:
                     logger.info(f"[{task_id}] 콘텐츠 수집 시작")
                     task.status = TaskStatus.CRAWLING.value
@@ -137,25 +288,58 @@ class Orchestrator:
                     if progress_callback:
                         await progress_callback(TaskStatus.CRAWLING, 30, "콘텐츠 수집 중...")
 
-                    urls = [meta.link for meta in posts_meta]
-                    crawl_result = await self.crawler_agent.crawl(urls)
-
-                    if crawl_result.success:
-                        contents: List[BlogContent] = crawl_result.data
-                        task.total_crawled = len(contents)
-
-                        # DB 업데이트
-                        for content in contents:
-                            result = await session.execute(
-                                select(BlogPost).where(BlogPost.url == content.url)
+                    # 신선한 본문이 저장된 게시글은 재사용하고 나머지만 수집
+                    reused_posts, stale_urls = self._split_fresh(posts)
+                    await self._load_contents(session, reused_posts)
+                    contents = [self._stored_content(post) for post in reused_posts]
+                    if reused_posts:
+                        await self._mark_reused(session, task_id, reused_posts)
+
+                    crawled_posts = []
+
+                    def apply(content: ContentRecord) -> None:
+                        # 수집되는 대로 세션에 반영 (취소 시 여기까지 저장)
+                        post = posts.get(content.url)
+                        if post:
+                            post.content = content.content
+                            post.images = content.images
+                            post.crawled_at = content.crawled_at
+                            crawled_posts.append(post)
+                            contents.append(content)
+                            task.total_crawled = len(contents)
+
+                    task.total_crawled = len(contents)
+                    from ..core.search_index import get_search_index
+                    from .aggregates import bump_result_version
+                    try:
+                        if stale_urls:
+                            await self.crawler_agent.crawl(stale_urls, on_result=apply)
+                    finally:
+                        # 전문 검색 색인 갱신 (재사용한 게시글은 이미 색인됨, 취소돼도 수집분은 색인)
+                        await get_search_index().index_posts(session, crawled_posts)
+                        # 다시 수집한 게시글을 공유하는 완료된 작업의 결과 버전 증가
+                        await bump_result_version(session, post_ids=[p.id for p in crawled_posts])
+
+                    # 유사 중복 클러스터링 (같은 클러스터는 분석 1회만)
+                    if get_settings().dedup_enabled:
+                        if crawled_posts:
+                            from .dedup import NearDuplicateDetector
+
+                            post_clusters = await NearDuplicateDetector().assign_clusters(
+                                session, [(p.id, p.content) for p in crawled_posts]
                             )
-                            post = result.scalar_one_or_none()
-                            if post:
-                                post.content = content.content
-                                post.crawled_at = content.crawled_at
+                            clusters = {
+                                p.url: post_clusters[p.id]
+                                for p in crawled_posts if p.id in post_clusters
+                            }
+                        # 재사용한 게시글은 저장된 클러스터로 이전 분석 결과까지 재사용
+                        clusters.update({p.url: p.cluster_id for p in reused_posts if p.cluster_id})
 
-                        await session.commit()
-                        logger.info(f"[{task_id}] 수집 완료: {len(contents)}개")
+                    await session.commit()
+                    logger.info(
+                        f"[{task_id}] 수집 완료: {len(contents)}개 "
+                        f"(재사용 {len(reused_posts)}개, 수집 {len(crawled_posts)}개)"
+                    )
                 else:
                     contents = []
 
@@ -168,52 +352,17 @@ class Orchestrator:
                     if progress_callback:
                         await progress_callback(TaskStatus.ANALYZING, 60, "AI 분석 중...")
 
-                    analyzed_count = 0
-                    for i, content in enumerate(contents):
-                        try:
-                            analysis_result = await self.analysis_agent.analyze(content)
-
-                            if analysis_result.success:
-                                analysis_data: AnalysisResult = analysis_result.data
-
-                                # 해당 post 찾기
-                                result = await session.execute(
-                                    select(BlogPost).where(BlogPost.url == content.url)
-                                )
-                                post = result.scalar_one_or_none()
-
-                                if post:
-                                    analysis = Analysis(
-                                        post_id=post.id,
-                                        url=content.url,
-                                        sentiment_score=analysis_data.sentiment_score,
-                                        sentiment_label=analysis_data.sentiment_label.value,
-                                        keywords=analysis_data.keywords,
-                                        summary=analysis_data.summary,
-                                        content_type=analysis_data.content_type.value,
-                                        is_ad=analysis_data.is_ad,
-                                        quality_score=analysis_data.quality_score
-                                    )
-                                    session.add(analysis)
-                                    analyzed_count += 1
-
-                            # 진행률 업데이트
-                            if progress_callback and i % 5 == 0:
-                                progress = 60 + (i / len(contents)) * 30
-                                await progress_callback(
-                                    TaskStatus.ANALYZING,
-                                    progress,
-                                    f"분석 중... ({i+1}/{len(contents)})"
-                                )
-
-                        except Exception as e:
-                            logger.warning(f"분석 실패 ({content.url}): {str(e)}")
+                    analyzed_count = await self._run_analysis(session, task_id, contents, progress_callback, clusters)
 
                     task.total_analyzed = analyzed_count
                     await session.commit()
                     logger.info(f"[{task_id}] 분석 완료: {analyzed_count}개")
 
-                # 4. 완료
+                # 4. 완료 (여기부터는 취소하지 않음)
+                await watchdog.stop()
+                # 기준점은 완료 시에만 갱신 (실패/중단된 작업의 새 글은 다음 실행에서 다시 수집)
+                if watermark is not None:
+                    self._advance_watermark(watermark, posts_meta)
                 task.status = TaskStatus.COMPLETED.value
                 task.completed_at = datetime.now()
                 await session.commit()
@@ -231,17 +380,403 @@ class Orchestrator:
                     total_crawled=task.total_crawled,
                     total_analyzed=task.total_analyzed,
                     created_at=task.created_at,
-                    completed_at=task.completed_at
+                    completed_at=task.completed_at,
+                    deadline=task.deadline,
+                    **await self._llm_usage_fields(session, task.id)
                 )
 
+            except asyncio.CancelledError:
+                # 취소 요청/마감이 아닌 취소(프로세스 종료 등)는 그대로 전파
+                if watchdog.reason is None:
+                    raise
+                asyncio.current_task().uncancel()
+                return await self._finish_interrupted(session, task, watchdog.reason)
+
             except Exception as e:
                 logger.error(f"[{task_id}] 작업 실패: {str(e)}")
                 task.status = TaskStatus.FAILED.value
                 await session.commit()
                 raise
 
+            finally:
+                await watchdog.stop()
+                self._watchdogs.pop(task_id, None)
+                await self.llm_usage.flush()
+
+    async def _finish_interrupted(self, session, task, status: TaskStatus) -> TaskResponse:
+        """중단된 작업: 그때까지의 수집/분석 결과를 저장하고 CANCELLED/TIMED_OUT으로 종료"""
+        from sqlalchemy import select, update, func
+        from ..core.database import SearchTask, Analysis
+
+        try:
+            await session.commit()
+        except Exception as e:
+            logger.warning(f"[{task.id}] 부분 결과 저장 실패: {str(e)}")
+            await session.rollback()
+
+        # 중단 시점에 세션이 쓰던 연결 상태와 무관하게 새 세션으로 상태 기록
+        completed_at = datetime.now()
+        async with self.db.async_session() as status_session:
+            analyzed = (await status_session.execute(
+                select(func.count()).select_from(Analysis).where(Analysis.task_id == task.id)
+            )).scalar_one()
+            await status_session.execute(
+                update(SearchTask)
+                .where(SearchTask.id == task.id)
+                .values(status=status.value, completed_at=completed_at, total_analyzed=analyzed)
+            )
+            await status_session.commit()
+            usage = await self._llm_usage_fields(status_session, task.id)
+
+        logger.info(f"[{task.id}] 작업 중단({status.value}): 수집 {task.total_crawled or 0}개, 분석 {analyzed}개 저장")
+        return TaskResponse(
+            id=task.id,
+            status=status,
+            keyword=task.keyword,
+            total_found=task.total_found or 0,
+            total_crawled=task.total_crawled or 0,
+            total_analyzed=analyzed,
+            created_at=task.created_at,
+            completed_at=completed_at,
+            deadline=task.deadline,
+            **usage
+        )
+
+    async def _llm_usage_fields(self, session, task_id: str) -> Dict[str, Any]:
+        """TaskResponse의 LLM 사용량 필드 (llm_usage 테이블의 작업 합계)"""
+        totals = await self.llm_usage.task_totals(session, task_id)
+        return {
+            "llm_calls": int(totals["calls"]),
+            "prompt_tokens": int(totals["prompt_tokens"]),
+            "output_tokens": int(totals["output_tokens"]),
+            "llm_cost_usd": round(float(totals["cost_usd"]), 6),
+        }
+
+    async def _link_posts(self, session, task_id: str, posts_meta: List[PostMetaRecord]) -> Dict[str, Any]:
+        """검색 결과를 작업에 연결 → {URL: BlogPost}
+
+        게시글은 URL당 하나만 저장하고, 이미 있는 게시글은 새로 만들지 않고 연결만 추가한다.
+        """
+        import uuid
+        from sqlalchemy import select
+        from ..core.database import BlogPost, TaskPost
+
+        metas: Dict[str, PostMetaRecord] = {}
+        for meta in posts_meta:
+            metas.setdefault(meta.link, meta)
+
+        posts: Dict[str, Any] = {}
+        urls = list(metas)
+        for i in range(0, len(urls), 500):
+            result = await session.execute(select(BlogPost).where(BlogPost.url.in_(urls[i:i + 500])))
+            posts.update({post.url: post for post in result.scalars().all()})
+
+        # 재시도된 작업은 이미 연결된 게시글이 있을 수 있음
+        result = await session.execute(select(TaskPost.post_id).where(TaskPost.task_id == task_id))
+        linked = set(result.scalars().all())
+
+        for rank, (url, meta) in enumerate(metas.items()):
+            post = posts.get(url)
+            if post is None:
+                post = BlogPost(
+                    id=str(uuid.uuid4()),
+                    task_id=task_id,
+                    url=url,
+                    title=meta.title.replace("<b>", "").replace("</b>", ""),
+                    author=meta.bloggername,
+                    post_date=meta.postdate
+                )
+                session.add(post)
+                posts[url] = post
+            if post.id not in linked:
+                session.add(TaskPost(task_id=task_id, post_id=post.id, rank=rank))
+
+        return posts
+
+    def _split_fresh(self, posts: Dict[str, Any]):
+        """재사용할 게시글(기간 내 수집된 본문 있음)과 수집할 URL로 분리"""
+        from datetime import timedelta
+
+        reuse_days = get_settings().content_reuse_days
+        cutoff = datetime.now() - timedelta(days=reuse_days)
+
+        reused, stale = [], []
+        for url, post in posts.items():
+            if reuse_days > 0 and post.has_content and post.crawled_at and post.crawled_at >= cutoff:
+                reused.append(post)
+            else:
+                stale.append(url)
+        return reused, stale
+
+    async def _load_contents(self, session, posts: List[Any]) -> None:
+        """본문을 읽을 게시글의 압축 본문을 한 번에 로드 (이미 세션에 있는 객체에 채워짐)"""
+        from sqlalchemy import select
+        from sqlalchemy.orm import selectinload
+        from ..core.database import BlogPost
+
+        ids = [post.id for post in posts]
+        for i in range(0, len(ids), 500):
+            await session.execute(
+                select(BlogPost)
+                .options(selectinload(BlogPost.content_blob))
+                .where(BlogPost.id.in_(ids[i:i + 500]))
+            )
+
+    def _stored_content(self, post) -> ContentRecord:
+        post_date = None
+        if post.post_date:
+            try:
+                post_date = datetime.strptime(post.post_date, "%Y%m%d").date()
+            except ValueError:
+                pass
+        return ContentRecord(
+            url=post.url,
+            title=post.title,
+            author=post.author,
+            content=post.content,
+            post_date=post_date,
+            images=post.images or [],
+            crawled_at=post.crawled_at,
+            method="stored"
+        )
+
+    async def _mark_reused(self, session, task_id: str, posts: List[Any]) -> None:
+        from sqlalchemy import update
+        from ..core.database import TaskPost
+
+        post_ids = [post.id for post in posts]
+        for i in range(0, len(post_ids), 500):
+            await session.execute(
+                update(TaskPost)
+                .where(TaskPost.task_id == task_id)
+                .where(TaskPost.post_id.in_(post_ids[i:i + 500]))
+                .values(reused=True)
+            )
+
+    async def _load_watermark(self, session, keyword: str):
+        """키워드 수집 기준점 조회 (없으면 생성)
+
+        같은 키워드의 모니터링 작업이 동시에 실행될 수 있으므로, 다른 작업이 먼저 만든
+        경우(IntegrityError)에는 그 행을 다시 조회한다.
+        """
+        from sqlalchemy.exc import IntegrityError
+        from ..core.database import KeywordWatermark
+
+        watermark = await session.get(KeywordWatermark, keyword)
+        if watermark is None:
+            try:
+                async with session.begin_nested():
+                    session.add(KeywordWatermark(keyword=keyword, seen_ids=[]))
+            except IntegrityError:
+                pass
+            # 잠금을 오래 잡지 않도록 검색 전에 커밋
+            await session.commit()
+            watermark = await session.get(KeywordWatermark, keyword)
+        return watermark
+
+    def _advance_watermark(self, watermark, posts_meta: List[PostMetaRecord]) -> None:
+        """새로 찾은 게시글로 기준점 갱신 (최근 ID는 설정 개수만 유지)"""
+        if not posts_meta:
+            return
+
+        new_ids = [canonical_post_id(meta.link) for meta in posts_meta]
+        seen_ids = list(dict.fromkeys(new_ids + list(watermark.seen_ids or [])))
+        # JSON 컬럼은 새 리스트를 할당해야 변경이 감지된다
+        watermark.seen_ids = seen_ids[:get_settings().monitor_seen_ids_limit]
+
+        newest = max(meta.postdate for meta in posts_meta)
+        if not watermark.newest_postdate or newest > watermark.newest_postdate:
+            watermark.newest_postdate = newest
+
+    async def _run_analysis(
+        self,
+        session,
+        task_id: str,
+        contents: List[ContentRecord],
+        progress_callback: callable = None,
+        clusters: Dict[str, str] = None
+    ) -> int:
+        """분석 단계 실행 후 저장된 분석 수 반환
+
+        유사 중복 클러스터마다 대표 게시글 하나만 분석해 결과를 공유하고,
+        로컬 사전 분석 결과가 충분히 확실한 게시글은 LLM을 호출하지 않는다.
+        """
+        settings = get_settings()
+        analyzed_count = 0
+
+        # 클러스터 대표 게시글 → 나머지 구성원
+        duplicates: Dict[str, List[ContentRecord]] = {}
+        if clusters:
+            groups: Dict[str, List[ContentRecord]] = {}
+            for content in contents:
+                groups.setdefault(clusters.get(content.url, content.url), []).append(content)
+
+            # 이전 작업에서 이미 분석된 클러스터는 그 결과를 재사용
+            reused = await self._find_cluster_analyses(session, list(groups))
+            contents = []
+            for cluster_id, members in groups.items():
+                if cluster_id in reused:
+                    for member in members:
+                        data = reused[cluster_id].model_copy(update={"url": member.url})
+                        if await self._save_analysis(session, task_id, member.url, data):
+                            analyzed_count += 1
+                else:
+                    contents.append(members[0])
+                    duplicates[members[0].url] = members[1:]
+
+            logger.info(
+                f"유사 중복 제외 후 분석 대상: {len(contents)}개 "
+                f"(재사용 {len(reused)}개 클러스터)"
+            )
+
+        async def save(content: ContentRecord, analysis_data: AnalysisResult) -> int:
+            saved = 0
+            for member in [content] + duplicates.get(content.url, []):
+                data = analysis_data if member is content else analysis_data.model_copy(update={"url": member.url})
+                if await self._save_analysis(session, task_id, member.url, data):
+                    saved += 1
+            return saved
+
+        if settings.local_analysis_enabled and contents:
+            pre_result = await self.local_analyzer.pre_analyze(contents)
+            if pre_result.success:
+                llm_contents = []
+                for content, pre in zip(contents, pre_result.data):
+                    if (
+                        pre.confidence >= settings.local_analysis_confidence_threshold
+                        and not (settings.local_analysis_summary_required and pre.needs_summary)
+                    ):
+                        analyzed_count += await save(content, pre.result)
+                    else:
+                        llm_contents.append(content)
+
+                logger.info(f"로컬 사전 분석: {analyzed_count}개 확정, {len(llm_contents)}개 LLM 분석 필요")
+                contents = llm_contents
+
+        if not contents:
+            return analyzed_count
+
+        if settings.analysis_batch_mode:
+            # 여러 게시글을 한 요청으로 묶어 분석 (작업이 취소돼도 끝난 분석은 저장)
+            finished: List[tuple] = []
+
+            async def on_progress(done: int, total: int) -> None:
+                if progress_callback:
+                    await progress_callback(
+                        TaskStatus.ANALYZING,
+                        60 + (done / total) * 30,
+                        f"분석 중... ({done}/{total})"
+                    )
+
+            try:
+                await self.analysis_agent.analyze_batched(
+                    contents,
+                    concurrency=settings.analysis_concurrency,
+                    on_result=lambda i, analysis: finished.append((contents[i], analysis)),
+                    on_progress=on_progress
+                )
+            except Exception as e:
+                # 개별 분석과 같이 실패는 기록만 하고 수집 결과는 유지
+                logger.warning(f"배치 분석 실패 ({len(contents)}개): {str(e)}")
+            finally:
+                for content, analysis in finished:
+                    analyzed_count += await save(content, analysis)
+            return analyzed_count
+
+        for i, content in enumerate(contents):
+            try:
+                analysis_result = await self.analysis_agent.analyze(content)
+
+                if analysis_result.success:
+                    analyzed_count += await save(content, analysis_result.data)
+
+                # 진행률 업데이트
+                if progress_callback and i % 5 == 0:
+                    progress = 60 + (i / len(contents)) * 30
+                    await progress_callback(
+                        TaskStatus.ANALYZING,
+                        progress,
+                        f"분석 중... ({i+1}/{len(contents)})"
+                    )
+
+            except Exception as e:
+                logger.warning(f"분석 실패 ({content.url}): {str(e)}")
+
+        return analyzed_count
+
+    async def _find_cluster_analyses(self, session, cluster_ids: List[str]) -> Dict[str, AnalysisResult]:
+        """클러스터별로 이미 저장된 최신 분석 결과 조회"""
+        from sqlalchemy import select
+        from ..core.database import BlogPost, Analysis
+
+        if not cluster_ids:
+            return {}
+
+        result = await session.execute(
+            select(BlogPost.cluster_id, Analysis)
+            .join(Analysis, Analysis.post_id == BlogPost.id)
+            .where(BlogPost.cluster_id.in_(cluster_ids))
+            .order_by(Analysis.analyzed_at)
+        )
+
+        found: Dict[str, AnalysisResult] = {}
+        for cluster_id, analysis in result.all():
+            found[cluster_id] = self._analysis_to_result(analysis)
+        return found
+
+    def _analysis_to_result(self, analysis) -> AnalysisResult:
+        """Analysis 행 → AnalysisResult"""
+        from ..models import SentimentLabel, ContentType
+
+        return AnalysisResult(
+            url=analysis.url,
+            sentiment_score=analysis.sentiment_score,
+            sentiment_label=SentimentLabel(analysis.sentiment_label),
+            keywords=analysis.keywords or [],
+            summary=analysis.summary or "",
+            content_type=ContentType(analysis.content_type),
+            is_ad=bool(analysis.is_ad),
+            quality_score=analysis.quality_score,
+            analyzed_at=analysis.analyzed_at
+        )
+
+    async def _save_analysis(self, session, task_id: str, url: str, analysis_data: AnalysisResult) -> bool:
+        """분석 결과를 해당 게시글에 연결해 저장하고 작업 집계 갱신"""
+        import uuid
+        from sqlalchemy import select
+        from ..core.database import BlogPost, Analysis
+        from .aggregates import record_analysis
+
+        result = await session.execute(
+            select(BlogPost).where(BlogPost.url == url)
+        )
+        post = result.scalar_one_or_none()
+
+        if not post:
+            return False
+
+        analysis = Analysis(
+            id=str(uuid.uuid4()),
+            post_id=post.id,
+            task_id=task_id,
+            url=url,
+            sentiment_score=analysis_data.sentiment_score,
+            sentiment_label=analysis_data.sentiment_label.value,
+            keywords=analysis_data.keywords,
+            summary=analysis_data.summary,
+            content_type=analysis_data.content_type.value,
+            is_ad=analysis_data.is_ad,
+            quality_score=analysis_data.quality_score
+        )
+        session.add(analysis)
+        await record_analysis(session, task_id, analysis)
+        return True
+
     async def get_task_status(self, task_id: str) -> Optional[TaskResponse]:
         """작업 상태 조회"""
+        from sqlalchemy import select
+        from ..core.database import SearchTask
+
         async with self.db.async_session() as session:
             result = await session.execute(
                 select(SearchTask).where(SearchTask.id == task_id)
@@ -259,18 +794,23 @@ class Orchestrator:
                 total_crawled=task.total_crawled or 0,
                 total_analyzed=task.total_analyzed or 0,
                 created_at=task.created_at,
-                completed_at=task.completed_at
+                completed_at=task.completed_at,
+                deadline=task.deadline,
+                result_version=task.result_version or 0,
+                **await self._llm_usage_fields(session, task.id)
             )
 
     async def quick_search(
         self,
         keyword: str,
         max_results: int = 100
-    ) -> List[BlogPostMeta]:
+    ) -> List[PostMetaRecord]:
         """빠른 검색 (DB 저장 없이)"""
-        if not self._initialized:
-            await self.initialize()
+        key = ("search", keyword.strip(), max_results)
+        with flow("interactive", priority=True):
+            return await self._quick_flight.do(key, lambda: self._quick_search(keyword, max_results))
 
+    async def _quick_search(self, keyword: str, max_results: int) -> List[PostMetaRecord]:
         search_input = SearchInput(keyword=keyword, max_results=max_results)
         result = await self.search_agent.run(search_input)
 
@@ -282,24 +822,94 @@ class Orchestrator:
         self,
         url: str
     ) -> Optional[AnalysisResult]:
-        """빠른 분석 (단일 URL, DB 저장 없이)"""
-        if not self._initialized:
-            await self.initialize()
+        """빠른 분석 (단일 URL, DB 저장 없이)
+
+        모바일/데스크톱 URL은 같은 게시글로 보고 합친다.
+        """
+        key = ("analyze", canonical_post_id(url))
+        # 대화형 요청: 대량 작업이 슬롯을 쓰고 있어도 우선 레인으로 바로 처리
+        with flow("interactive", priority=True):
+            return await self._quick_flight.do(key, lambda: self._quick_analyze(url))
 
+    async def _quick_analyze(self, url: str) -> Optional[AnalysisResult]:
         # 수집
         crawl_result = await self.crawler_agent.crawl([url])
         if not crawl_result.success or not crawl_result.data:
             return None
 
-        content = crawl_result.data[0]
+        return await self._analyze_content(crawl_result.data[0])
 
-        # 분석
+    async def _analyze_content(self, content: ContentRecord) -> Optional[AnalysisResult]:
         analysis_result = await self.analysis_agent.analyze(content)
         if analysis_result.success:
             return analysis_result.data
-
         return None
 
+    async def analyze_urls_stream(self, urls: List[str]) -> AsyncIterator[Dict[str, Any]]:
+        """여러 URL을 한 번에 수집하고, 분석이 끝나는 순서대로 결과를 내보냄 (DB 저장 없이)
+
+        게시글마다 수집되는 즉시 분석을 시작한다. quick_analyze와 결과 기억/동시 요청
+        합치기를 공유하고, 동시 LLM 호출 수는 AnalysisAgent의 공유 한도를 따른다.
+        클라이언트가 스트림을 끊으면 수집과, 이 스트림만 기다리던 분석을 취소한다.
+
+        Yields:
+            {"url", "result": AnalysisResult | None, "error": str | None}
+        """
+        pending = []
+        for url in dict.fromkeys(urls):
+            hit, result = self._quick_flight.cached(("analyze", canonical_post_id(url)))
+            if hit:
+                yield {"url": url, "result": result, "error": None}
+            else:
+                pending.append(url)
+
+        if not pending:
+            return
+
+        async def analyze_one(content: ContentRecord) -> Dict[str, Any]:
+            key = ("analyze", canonical_post_id(content.url))
+            try:
+                result = await self._quick_flight.do(
+                    key, lambda: self._analyze_content(content), cancel_on_abandon=True
+                )
+            except Exception as e:
+                return {"url": content.url, "result": None, "error": str(e)}
+            return {"url": content.url, "result": result, "error": None if result else "분석 실패"}
+
+        # 끝난 분석 작업, 수집이 끝나면 None
+        done: asyncio.Queue = asyncio.Queue()
+        jobs: Dict[str, asyncio.Future] = {}
+
+        def start(content: ContentRecord) -> None:
+            if content.url in jobs:
+                return
+            job = asyncio.ensure_future(analyze_one(content))
+            job.add_done_callback(done.put_nowait)
+            jobs[content.url] = job
+
+        crawling = asyncio.ensure_future(self.crawler_agent.crawl(pending, on_result=start))
+        crawling.add_done_callback(lambda _: done.put_nowait(None))
+
+        try:
+            crawled = False
+            yielded = 0
+            while not crawled or yielded < len(jobs):
+                job = await done.get()
+                if job is None:
+                    crawled = True
+                    if not crawling.cancelled() and crawling.exception() is not None:
+                        logger.warning(f"일괄 분석 수집 실패: {str(crawling.exception())}")
+                    for url in pending:
+                        if url not in jobs:
+                            yield {"url": url, "result": None, "error": "콘텐츠 수집 실패"}
+                    continue
+                yielded += 1
+                yield job.result()
+        finally:
+            crawling.cancel()
+            for job in jobs.values():
+                job.cancel()
+
 
 # 싱글톤 인스턴스
 _orchestrator_instance: Orchestrator = None
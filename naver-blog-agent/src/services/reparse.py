@@ -0,0 +1,109 @@
+import asyncio
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from loguru import logger
+
+
+def _parse_chunk(segment: str, entries: List[Dict]) -> List[Tuple[str, Optional[Dict]]]:
+    """세그먼트 하나의 레코드들을 현재 추출기로 파싱 (프로세스 풀에서 실행)"""
+    from ..agents.crawler_agent import parse_blog_html
+    from ..core.archive import parse_record
+
+    results = []
+    with open(segment, "rb") as f:
+        for entry in sorted(entries, key=lambda e: e["offset"]):
+            try:
+                f.seek(entry["offset"])
+                _, html = parse_record(f.read(entry["length"]))
+                content = parse_blog_html(html, entry["url"])
+            except Exception:
+                content = None
+
+            if content and content.content:
+                results.append((entry["url"], {"content": content.content, "images": content.images}))
+            else:
+                results.append((entry["url"], None))
+    return results
+
+
+async def _apply(db, parsed: List[Tuple[str, Optional[Dict]]]) -> int:
+    """파싱 결과로 BlogPost 본문 일괄 갱신 (바뀐 게시글만), 갱신 수 반환"""
+    from sqlalchemy import select
+    from sqlalchemy.orm import selectinload
+    from ..core.database import BlogPost
+    from ..core.search_index import get_search_index
+    from .aggregates import bump_result_version
+
+    by_url = {url: data for url, data in parsed if data}
+    if not by_url:
+        return 0
+
+    updated = []
+    async with db.async_session() as session:
+        urls = list(by_url)
+        for i in range(0, len(urls), 500):
+            result = await session.execute(
+                select(BlogPost)
+                .options(selectinload(BlogPost.content_blob))
+                .where(BlogPost.url.in_(urls[i:i + 500]))
+            )
+            for post in result.scalars().all():
+                data = by_url[post.url]
+                if post.content == data["content"]:
+                    continue
+                post.content = data["content"]
+                post.images = data["images"]
+                updated.append(post)
+
+        if updated:
+            await get_search_index().index_posts(session, updated)
+            await bump_result_version(session, post_ids=[post.id for post in updated])
+        await session.commit()
+
+    return len(updated)
+
+
+async def reparse_archive(
+    db,
+    archive,
+    workers: int = 4,
+    chunk_size: int = 200,
+    since: datetime = None
+) -> Dict[str, int]:
+    """보관된 원본 HTML을 현재 추출기로 다시 파싱해 본문 갱신 (네트워크 요청 없음)
+
+    게시글마다 가장 최근 레코드만 사용한다. 세그먼트별로 묶어 chunk_size씩
+    프로세스 풀에 나눠 파싱하고, 끝나는 청크부터 DB에 반영한다.
+
+    Returns:
+        {"records", "parsed", "unparsed", "updated"}
+    """
+    records = archive.latest_records(since)
+    counts = {"records": len(records), "parsed": 0, "unparsed": 0, "updated": 0}
+    if not records:
+        return counts
+
+    by_segment: Dict[str, List[Dict]] = defaultdict(list)
+    for entry in records:
+        by_segment[entry["segment"]].append(entry)
+
+    chunks = [
+        (segment, entries[i:i + chunk_size])
+        for segment, entries in by_segment.items()
+        for i in range(0, len(entries), chunk_size)
+    ]
+    logger.info(f"재파싱 시작: 레코드 {len(records)}개, 청크 {len(chunks)}개, 프로세스 {workers}개")
+
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [loop.run_in_executor(pool, _parse_chunk, segment, entries) for segment, entries in chunks]
+        for future in asyncio.as_completed(futures):
+            parsed = await future
+            counts["parsed"] += sum(1 for _, data in parsed if data)
+            counts["unparsed"] += sum(1 for _, data in parsed if not data)
+            counts["updated"] += await _apply(db, parsed)
+
+    logger.info(f"재파싱 완료: {counts}")
+    return counts
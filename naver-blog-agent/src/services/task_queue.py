@@ -0,0 +1,178 @@
+import asyncio
+import os
+import socket
+from datetime import datetime, timedelta
+from typing import Optional, Set
+from loguru import logger
+
+from ..core.config import get_settings
+from ..models import TaskStatus
+
+# 아직 실행이 끝나지 않은 상태
+ACTIVE_STATUSES = [
+    TaskStatus.SEARCHING.value,
+    TaskStatus.CRAWLING.value,
+    TaskStatus.ANALYZING.value,
+]
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+async def claim_next_task(db, worker_id: str) -> Optional[str]:
+    """대기 중인 작업 하나를 원자적으로 점유
+
+    조건부 UPDATE(worker_id IS NULL)의 영향 행 수로 점유 성공 여부를 판단하므로
+    SQLite와 Postgres 모두에서 여러 워커가 같은 작업을 가져가지 않는다.
+    """
+    from sqlalchemy import select, update
+    from ..core.database import SearchTask
+
+    async with db.async_session() as session:
+        result = await session.execute(
+            select(SearchTask.id)
+            .where(SearchTask.status == TaskStatus.PENDING.value)
+            .where(SearchTask.worker_id.is_(None))
+            .order_by(SearchTask.created_at)
+            .limit(5)
+        )
+        candidates = [row[0] for row in result.all()]
+
+        for task_id in candidates:
+            claimed = await session.execute(
+                update(SearchTask)
+                .where(SearchTask.id == task_id)
+                .where(SearchTask.worker_id.is_(None))
+                .values(worker_id=worker_id, heartbeat_at=datetime.now())
+            )
+            await session.commit()
+            if claimed.rowcount == 1:
+                return task_id
+
+    return None
+
+
+async def heartbeat(db, task_ids: Set[str], worker_id: str) -> None:
+    """실행 중인 작업의 heartbeat 갱신"""
+    from sqlalchemy import update
+    from ..core.database import SearchTask
+
+    if not task_ids:
+        return
+
+    async with db.async_session() as session:
+        await session.execute(
+            update(SearchTask)
+            .where(SearchTask.id.in_(list(task_ids)))
+            .where(SearchTask.worker_id == worker_id)
+            .values(heartbeat_at=datetime.now())
+        )
+        await session.commit()
+
+
+async def fail_stale_tasks(db, timeout: int) -> int:
+    """heartbeat가 끊긴 작업(워커 종료 등)을 실패 처리"""
+    from sqlalchemy import update
+    from ..core.database import SearchTask
+
+    cutoff = datetime.now() - timedelta(seconds=timeout)
+    async with db.async_session() as session:
+        result = await session.execute(
+            update(SearchTask)
+            .where(SearchTask.worker_id.isnot(None))
+            .where(SearchTask.heartbeat_at < cutoff)
+            .where(SearchTask.status.in_(ACTIVE_STATUSES + [TaskStatus.PENDING.value]))
+            .values(status=TaskStatus.FAILED.value)
+        )
+        await session.commit()
+
+    if result.rowcount:
+        logger.warning(f"heartbeat 중단된 작업 {result.rowcount}개 실패 처리")
+    return result.rowcount
+
+
+class TaskWorker:
+    """DB 작업 큐를 소비하는 워커
+
+    API 프로세스는 작업을 생성만 하고(task_execution_mode="queue"),
+    실행 상태는 모두 DB에 있으므로 워커를 여러 프로세스/노드로 늘릴 수 있다.
+    """
+
+    def __init__(self, orchestrator, concurrency: int = 2, worker_id: str = None):
+        settings = get_settings()
+        self.orchestrator = orchestrator
+        self.concurrency = concurrency
+        self.worker_id = worker_id or default_worker_id()
+        self.poll_interval = settings.worker_poll_interval
+        self.heartbeat_interval = settings.worker_heartbeat_interval
+        self.stale_timeout = settings.worker_stale_timeout
+        self._running: Set[str] = set()
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    async def _execute(self, task_id: str) -> None:
+        from sqlalchemy import select
+        from ..core.database import SearchTask
+
+        try:
+            async with self.orchestrator.db.async_session() as session:
+                result = await session.execute(select(SearchTask).where(SearchTask.id == task_id))
+                task = result.scalar_one()
+                crawl_content = task.crawl_content is not False
+                analyze_content = task.analyze_content is not False
+
+            await self.orchestrator.run_task(task_id, crawl_content, analyze_content)
+        except Exception as e:
+            logger.error(f"[{self.worker_id}] 작업 실패 {task_id}: {str(e)}")
+        finally:
+            self._running.discard(task_id)
+
+    async def _heartbeat_loop(self) -> None:
+        db = self.orchestrator.db
+        while not self._stopping.is_set():
+            try:
+                await heartbeat(db, set(self._running), self.worker_id)
+                await fail_stale_tasks(db, self.stale_timeout)
+            except Exception as e:
+                logger.warning(f"heartbeat 실패: {str(e)}")
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.heartbeat_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run(self) -> None:
+        """중지될 때까지 작업을 점유해 실행"""
+        await self.orchestrator.initialize()
+        db = self.orchestrator.db
+        logger.info(f"워커 시작: {self.worker_id} (동시 작업 {self.concurrency}개)")
+
+        heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        in_flight: Set[asyncio.Task] = set()
+
+        try:
+            while not self._stopping.is_set():
+                task_id = None
+                if len(self._running) < self.concurrency:
+                    task_id = await claim_next_task(db, self.worker_id)
+
+                if task_id:
+                    logger.info(f"[{self.worker_id}] 작업 점유: {task_id}")
+                    self._running.add(task_id)
+                    job = asyncio.create_task(self._execute(task_id))
+                    in_flight.add(job)
+                    job.add_done_callback(in_flight.discard)
+                    continue
+
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+            self._stopping.set()
+            await heartbeat_task
+            logger.info(f"워커 종료: {self.worker_id}")
@@ -2,6 +2,7 @@ from .logger import setup_logger
 from .helpers import (
     clean_html,
     extract_blog_id,
+    canonical_post_id,
     format_date,
     parse_date,
     truncate_text,
@@ -11,11 +12,14 @@ from .helpers import (
     chunk_list,
     safe_get,
 )
+from .matcher import AhoCorasick
+from .singleflight import SingleFlight
 
 __all__ = [
     "setup_logger",
     "clean_html",
     "extract_blog_id",
+    "canonical_post_id",
     "format_date",
     "parse_date",
     "truncate_text",
@@ -24,4 +28,6 @@ __all__ = [
     "get_rss_url",
     "chunk_list",
     "safe_get",
+    "AhoCorasick",
+    "SingleFlight",
 ]
@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+from typing import List, Set, Tuple
+
+# (필드 이름, 최솟값, 최댓값)
+_FIELDS: List[Tuple[str, int, int]] = [
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day", 1, 31),
+    ("month", 1, 12),
+    ("weekday", 0, 6),  # 0 = 일요일
+]
+
+
+def _parse_field(expr: str, low: int, high: int) -> Set[int]:
+    values: Set[int] = set()
+    for part in expr.split(","):
+        step = 1
+        if "/" in part:
+            part, step_str = part.split("/", 1)
+            step = int(step_str)
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start_str, end_str = part.split("-", 1)
+            start, end = int(start_str), int(end_str)
+        else:
+            start = end = int(part)
+        if start < low or end > high or start > end or step < 1:
+            raise ValueError(f"잘못된 cron 필드: {expr}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+def parse_cron(expr: str) -> List[Set[int]]:
+    """5필드 cron 표현식 파싱 (분 시 일 월 요일)"""
+    parts = expr.split()
+    if len(parts) != 5:
+        raise ValueError(f"cron 표현식은 5개 필드가 필요합니다: {expr}")
+    fields = [_parse_field(part, low, high) for part, (_, low, high) in zip(parts, _FIELDS)]
+    # 요일 7도 일요일로 허용
+    if 7 in fields[4]:
+        fields[4].discard(7)
+        fields[4].add(0)
+    return fields
+
+
+def cron_next(expr: str, after: datetime) -> datetime:
+    """after 이후(초과) 처음으로 일치하는 시각"""
+    minutes, hours, days, months, weekdays = parse_cron(expr)
+    day_any = len(days) == 31
+    weekday_any = len(weekdays) == 7
+
+    candidate = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+    limit = candidate + timedelta(days=366 * 4)
+
+    while candidate < limit:
+        if candidate.month not in months:
+            year = candidate.year + (candidate.month == 12)
+            month = candidate.month % 12 + 1
+            candidate = candidate.replace(year=year, month=month, day=1, hour=0, minute=0)
+            continue
+
+        weekday = (candidate.weekday() + 1) % 7
+        if day_any or weekday_any:
+            day_ok = candidate.day in days and weekday in weekdays
+        else:
+            # 표준 cron: 일과 요일이 모두 지정되면 둘 중 하나만 맞아도 실행
+            day_ok = candidate.day in days or weekday in weekdays
+        if not day_ok:
+            candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+            continue
+
+        if candidate.hour not in hours:
+            candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+            continue
+
+        if candidate.minute not in minutes:
+            candidate += timedelta(minutes=1)
+            continue
+
+        return candidate
+
+    raise ValueError(f"일치하는 시각이 없습니다: {expr}")
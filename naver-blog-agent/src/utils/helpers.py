@@ -1,7 +1,7 @@
 import re
 from typing import List, Dict, Any
 from datetime import datetime, date
-from urllib.parse import urlparse
+from urllib.parse import urlparse, parse_qs
 
 
 def clean_html(text: str) -> str:
@@ -19,6 +19,22 @@ def extract_blog_id(url: str) -> str:
     return ""
 
 
+def canonical_post_id(url: str) -> str:
+    """블로그 게시글 URL → 정규 ID ("blogId/logNo")
+
+    blog.naver.com/{blogId}/{logNo}, m.blog.naver.com, PostView.naver?blogId=&logNo= 형식을 모두 처리한다.
+    """
+    parsed = urlparse(url)
+    query = parse_qs(parsed.query)
+    if "blogId" in query and "logNo" in query:
+        return f"{query['blogId'][0]}/{query['logNo'][0]}"
+
+    path_parts = [p for p in parsed.path.split('/') if p]
+    if len(path_parts) >= 2 and path_parts[1].isdigit():
+        return f"{path_parts[0]}/{path_parts[1]}"
+    return url
+
+
 def format_date(date_str: str) -> str:
     """날짜 문자열 포맷팅 (YYYYMMDD -> YYYY-MM-DD)"""
     if len(date_str) == 8:
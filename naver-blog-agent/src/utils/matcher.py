@@ -0,0 +1,77 @@
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+
+class AhoCorasick:
+    """다중 패턴 문자열 매칭 (Aho-Corasick 오토마톤)
+
+    본문을 한 번만 훑어 모든 패턴의 출현 위치를 찾는다.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = [p for p in dict.fromkeys(patterns) if p]
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self._build()
+
+    def _build(self) -> None:
+        """트라이와 실패 링크 구성"""
+        for pattern_id, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(pattern_id)
+
+        # 루트의 자식은 실패 링크가 루트(0)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+    def find_all(self, text: str) -> List[Tuple[int, str]]:
+        """(시작 위치, 패턴) 목록 반환"""
+        matches: List[Tuple[int, str]] = []
+        state = 0
+        for pos, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for pattern_id in self._output[state]:
+                pattern = self.patterns[pattern_id]
+                matches.append((pos - len(pattern) + 1, pattern))
+        return matches
+
+    def count(self, text: str) -> Dict[str, int]:
+        """패턴별 출현 횟수"""
+        counts: Dict[str, int] = {}
+        for _, pattern in self.find_all(text):
+            counts[pattern] = counts.get(pattern, 0) + 1
+        return counts
+
+    def find_longest(self, text: str) -> List[Tuple[int, str]]:
+        """겹치지 않는 (시작 위치, 패턴) 목록 (앞에서부터, 같은 위치면 가장 긴 패턴)
+
+        "불친절" 안의 "친절"처럼 더 긴 매칭에 포함되거나 걸친 매칭은 버린다.
+        """
+        matches = sorted(self.find_all(text), key=lambda m: (m[0], -len(m[1])))
+        selected: List[Tuple[int, str]] = []
+        end = 0
+        for start, pattern in matches:
+            if start >= end:
+                selected.append((start, pattern))
+                end = start + len(pattern)
+        return selected
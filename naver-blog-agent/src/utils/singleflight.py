@@ -0,0 +1,75 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    """같은 키의 동시 요청을 하나의 실행으로 합치고, 결과를 잠시 기억
+
+    먼저 온 요청이 실행을 시작하면 이후 같은 키의 요청은 그 실행을 기다린다.
+    실행은 별도 태스크에서 돌기 때문에 먼저 온 요청이 취소돼도(클라이언트 연결 종료)
+    기다리던 다른 요청은 결과를 받는다. 결과가 비어 있으면(실패) 기억하지 않는다.
+    cancel_on_abandon=True로 기다리던 요청이 마지막으로 취소되면 실행도 취소한다.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._waiters: Dict[asyncio.Task, int] = {}
+        self._memo: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def cached(self, key: Hashable) -> Tuple[bool, Any]:
+        """기억된 결과 조회 → (있는지, 값)"""
+        entry = self._memo.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._memo[key]
+            return False, None
+        self._memo.move_to_end(key)
+        return True, value
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+
+        value = task.result()
+        if self.ttl > 0 and value:
+            self._memo[key] = (time.monotonic() + self.ttl, value)
+            self._memo.move_to_end(key)
+            while len(self._memo) > self.max_entries:
+                self._memo.popitem(last=False)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]], cancel_on_abandon: bool = False) -> Any:
+        """key에 대한 fn() 결과 (진행 중이면 합류, 기억된 결과가 있으면 바로 반환)
+
+        cancel_on_abandon: 이 요청이 취소될 때 더 기다리는 요청이 없으면 실행도 취소
+        """
+        hit, value = self.cached(key)
+        if hit:
+            return value
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if cancel_on_abandon and self._waiters[task] == 1:
+                task.cancel()
+            raise
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+
+    def forget(self, key: Hashable) -> None:
+        self._memo.pop(key, None)
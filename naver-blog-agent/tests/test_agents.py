@@ -42,6 +42,77 @@ class TestSearchAgent:
         with pytest.raises(Exception):
             SearchInput(keyword="테스트", max_results=2000)
 
+    @pytest.mark.asyncio
+    async def test_stops_at_known_post(self):
+        from src.agents import SearchAgent
+
+        agent = SearchAgent({"client_id": "test_id", "client_secret": "test_secret", "rate_limit": 1000})
+        items = [
+            {"title": f"t{i}", "link": f"https://blog.naver.com/user{i}/22{i}", "description": "",
+             "bloggername": "b", "postdate": "20260105"}
+            for i in range(5)
+        ]
+        calls = []
+
+        async def fake_call_api(query, start, display, sort):
+            calls.append(sort)
+            return {"total": 5, "items": items[start - 1:start - 1 + display]}
+
+        agent._call_api = fake_call_api
+        result = await agent.search("테스트", max_results=5, sort="date", known_ids=["user2/222"])
+
+        assert [post.link for post in result.data] == [items[0]["link"], items[1]["link"]]
+        assert result.metadata["reached_seen"] is True
+        assert calls == ["date"]
+
+
+class TestNaverCredentialPool:
+    """네이버 API 인증 정보 풀 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_quota_exceeded_fails_over(self):
+        import httpx
+        from src.agents import SearchAgent
+        from src.core.credentials import NaverCredentialPool
+
+        def handler(request):
+            if request.headers["X-Naver-Client-Id"] == "first":
+                return httpx.Response(429, json={"errorCode": "010", "errorMessage": "Query limit exceeded."})
+            item = {"title": "t", "link": "https://blog.naver.com/u/1", "description": "",
+                    "bloggername": "b", "postdate": "20260105"}
+            return httpx.Response(200, json={"total": 1, "items": [item]})
+
+        agent = SearchAgent({"rate_limit": 1000})
+        agent.pool = NaverCredentialPool([("first", "s1"), ("second", "s2")], daily_quota=100)
+        agent._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        result = await agent.search("테스트", max_results=1)
+        await agent._client.aclose()
+
+        assert [post.link for post in result.data] == ["https://blog.naver.com/u/1"]
+        assert agent.pool.remaining("first") == 0
+        assert agent.pool.calls("second") == 1
+
+    @pytest.mark.asyncio
+    async def test_usage_shared_through_db(self, tmp_path):
+        from src.core.credentials import NaverCredentialPool
+        from src.core.database import Database
+
+        db = Database(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+        credentials = [("first", "s1"), ("second", "s2")]
+        # 같은 DB를 쓰는 두 프로세스
+        pool_a = NaverCredentialPool(credentials, daily_quota=100, db=db, sync_interval=3600)
+        pool_b = NaverCredentialPool(credentials, daily_quota=100, db=db, sync_interval=3600)
+
+        used = [(await pool_a.acquire()).client_id for _ in range(4)]
+        await pool_a.sync()
+        await pool_b.sync()
+        await db.close()
+
+        # 호출 수가 적은 인증 정보부터 번갈아 사용
+        assert sorted(used) == ["first", "first", "second", "second"]
+        assert pool_b.calls("first") == 2 and pool_b.remaining("second") == 98
+
 
 class TestCrawlerAgent:
     """수집 에이전트 테스트"""
@@ -58,6 +129,1289 @@ class TestCrawlerAgent:
         assert "example/12345" in mobile_url
 
 
+class TestStreamingFetch:
+    """스트리밍 조기 종료 수집 테스트"""
+
+    HEAD = '<html><head><meta property="og:title" content="제목"></head><body>'
+    CONTENT = ('<div class="se-main-container"><div class="se-text"><p>' + "본문 내용입니다. " * 20
+               + '</p></div><div><img class="se-image-resource" src="https://postfiles.pstatic.net/a.jpg"></div></div>')
+    AUTHOR = '<span class="nick"><span>작성자</span></span>'
+    TAIL = '<div class="comments">' + "댓글 " * 5000 + "</div>"
+
+    def test_scanner_done_after_content_and_author(self):
+        from src.agents.crawler_agent import MainContentScanner, parse_blog_html
+
+        scanner = MainContentScanner()
+        page = self.HEAD + self.CONTENT + self.AUTHOR
+        for i in range(0, len(page), 37):
+            assert not scanner.done
+            scanner.feed(page[i:i + 37])
+        assert scanner.done
+
+        content = parse_blog_html(scanner.html, "https://blog.naver.com/a/1")
+        assert content.title == "제목" and content.author == "작성자"
+        assert content.images == ["https://postfiles.pstatic.net/a.jpg"]
+
+        # 작성자 노드가 없으면 본문 이후 author_window만큼 더 읽고 종료
+        scanner = MainContentScanner(author_window=100)
+        scanner.feed(self.HEAD + self.CONTENT)
+        assert not scanner.done
+        scanner.feed(self.TAIL[:200])
+        assert scanner.done
+
+    @pytest.mark.asyncio
+    async def test_stream_stops_before_tail(self):
+        import httpx
+        from src.agents import HybridCrawlerAgent
+
+        chunks = [self.HEAD, self.CONTENT, self.AUTHOR] + [self.TAIL] * 10
+        sent = []
+
+        class Body(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                for chunk in chunks:
+                    sent.append(chunk)
+                    yield chunk.encode("utf-8")
+
+        agent = HybridCrawlerAgent()
+        agent._client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, headers={"content-type": "text/html; charset=utf-8"}, stream=Body())
+        ))
+
+        content = await agent._fetch_httpx_one("https://blog.naver.com/a/1")
+        await agent._client.aclose()
+
+        assert content.author == "작성자" and content.method == "httpx"
+        assert len(sent) == 3
+
+    @pytest.mark.asyncio
+    async def test_archive_keeps_full_pages_only(self, tmp_path):
+        import httpx
+        from src.agents import HybridCrawlerAgent
+        from src.core.archive import HtmlArchive, read_record
+
+        chunks = [self.HEAD, self.CONTENT, self.AUTHOR] + [self.TAIL] * 3
+
+        class Body(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                for chunk in chunks:
+                    yield chunk.encode("utf-8")
+
+        agent = HybridCrawlerAgent()
+        agent.archive = HtmlArchive(str(tmp_path / "archive"))
+        agent._client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, headers={"content-type": "text/html; charset=utf-8"}, stream=Body())
+        ))
+
+        full = await agent._fetch_httpx_one("https://blog.naver.com/a/1")
+        # 최대 크기에서 잘린 페이지는 보관하지 않음
+        agent.stream_max_bytes = 1
+        capped = await agent._fetch_httpx_one("https://blog.naver.com/a/2")
+        await agent._client.aclose()
+
+        records = agent.archive.latest_records()
+        _, html = read_record(records[0]["segment"], records[0]["offset"], records[0]["length"])
+
+        assert full.author == "작성자"
+        assert capped is None
+        assert [entry["post_id"] for entry in records] == ["a/1"]
+        assert html == "".join(chunks)
+
+
+class TestCrawlerHedging:
+    """느린 httpx 요청 헤징 테스트"""
+
+    def _content(self, url, method):
+        from src.models import BlogContent
+        return BlogContent(url=url, content="본문" * 100, method=method)
+
+    @pytest.mark.asyncio
+    async def test_slow_fetch_is_hedged(self):
+        from src.agents import HybridCrawlerAgent
+
+        agent = HybridCrawlerAgent()
+        agent._latency.initial = 0.01
+
+        async def slow_httpx(url):
+            await asyncio.sleep(1)
+            return self._content(url, "httpx")
+
+        async def fast_curl(url):
+            return self._content(url, "curl_cffi")
+
+        agent._fetch_httpx_one = slow_httpx
+        agent._fetch_curl_one = fast_curl
+
+        hedged = set()
+        content = await agent._fetch_hedged("https://blog.naver.com/a/1", hedged)
+
+        assert content.method == "curl_cffi"
+        assert hedged == {"https://blog.naver.com/a/1"}
+
+    def test_hedge_budget_limits_extra_requests(self):
+        from src.agents.crawler_agent import HedgeBudget
+
+        budget = HedgeBudget(ratio=0.1, burst=1.0)
+        spent = 0
+        for _ in range(100):
+            budget.on_request()
+            spent += budget.try_spend()
+
+        assert spent <= 11
+
+
+class TestFetchRouter:
+    """블로그별 수집 경로 학습 테스트"""
+
+    def test_routes_hard_blog_to_working_stage(self):
+        from src.agents.crawler_agent import FetchRouter
+
+        router = FetchRouter(half_life=3600, probe_rate=0.0)
+        assert router.route("hardblog") == ("httpx", "default")
+
+        for _ in range(3):
+            router.record("hardblog", "httpx", False)
+            router.record("hardblog", "curl_cffi", True)
+        router.record("easyblog", "httpx", True)
+
+        assert router.route("hardblog") == ("curl_cffi", "routed")
+        assert router.route("easyblog") == ("httpx", "default")
+
+        router.probe_rate = 1.0
+        assert router.route("hardblog") == ("httpx", "probe")
+
+    def test_old_failures_decay(self):
+        from src.agents.crawler_agent import FetchRouter
+
+        router = FetchRouter(half_life=10, probe_rate=0.0)
+        for _ in range(3):
+            router.record("blog", "httpx", False)
+
+        # 반감기 여러 번이 지난 것으로 간주
+        updated_at, stats = router._stats["blog"]
+        router._stats["blog"] = (updated_at - 100, stats)
+        assert router.route("blog") == ("httpx", "default")
+
+    def test_metrics_render(self):
+        from src.core.metrics import Registry
+
+        registry = Registry()
+        counter = registry.counter("test_fetch_total", "테스트", ["method"])
+        counter.inc(method="httpx")
+        counter.inc(2, method="httpx")
+
+        assert 'test_fetch_total{method="httpx"} 3.0' in registry.render()
+
+
+class TestHtmlArchive:
+    """원본 HTML 보관/재파싱 테스트"""
+
+    def test_append_and_read_latest(self, tmp_path):
+        from datetime import datetime, timedelta
+        from src.core.archive import HtmlArchive, read_record
+
+        archive = HtmlArchive(str(tmp_path / "archive"), segment_bytes=200)
+        old = datetime.now() - timedelta(days=2)
+        archive.append("https://blog.naver.com/user/1", "<p>옛 본문</p>", "httpx", old)
+        archive.append("https://m.blog.naver.com/user/1", "<p>새 본문</p>", "curl_cffi")
+        archive.append("https://blog.naver.com/user/2", "<p>다른 글</p>", "httpx", old)
+
+        latest = {entry["post_id"]: entry for entry in archive.latest_records()}
+        assert set(latest) == {"user/1", "user/2"}
+
+        headers, html = read_record(latest["user/1"]["segment"], latest["user/1"]["offset"], latest["user/1"]["length"])
+        assert html == "<p>새 본문</p>"
+        assert headers["X-Fetch-Method"] == "curl_cffi"
+
+        recent = archive.latest_records(since=datetime.now() - timedelta(days=1))
+        assert [entry["post_id"] for entry in recent] == ["user/1"]
+
+    @pytest.mark.asyncio
+    async def test_reparse_updates_changed_posts(self, tmp_path):
+        from sqlalchemy import select
+        from src.core.archive import HtmlArchive
+        from src.core.database import Database, BlogPost, SearchTask, TaskPost
+        from src.services.reparse import reparse_archive
+
+        db = Database(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+        await db.init_db()
+        archive = HtmlArchive(str(tmp_path / "archive"))
+        body = "새로 추출한 본문 " * 10
+
+        async with db.async_session() as session:
+            session.add_all([SearchTask(id="t", keyword="재파싱"), SearchTask(id="other", keyword="무관")])
+            for i in range(3):
+                url = f"https://blog.naver.com/user/{i}"
+                session.add(BlogPost(id=f"p{i}", task_id="t", url=url, title="제목", content="" if i < 2 else body.strip()))
+                session.add(TaskPost(task_id="t", post_id=f"p{i}", rank=i))
+                archive.append(url, f'<div class="se-main-container">{body}</div>', "httpx")
+            archive.append("https://blog.naver.com/user/9", "<html></html>", "httpx")
+            await session.commit()
+
+        counts = await reparse_archive(db, archive, workers=1)
+        async with db.async_session() as session:
+            versions = {task.id: task.result_version for task in (await session.execute(select(SearchTask))).scalars()}
+        await db.close()
+
+        assert counts == {"records": 4, "parsed": 3, "unparsed": 1, "updated": 2}
+        # 본문이 바뀐 게시글이 연결된 작업만 결과 버전 증가
+        assert versions == {"t": 1, "other": 0}
+
+
+class TestFairShareLimiter:
+    """작업 간 공정 분배 슬롯 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_flows_interleave(self):
+        from src.core.concurrency import FairShareLimiter, flow
+
+        limiter = FairShareLimiter("test", capacity=1)
+        order = []
+
+        async def request(flow_id):
+            with flow(flow_id):
+                async with limiter:
+                    order.append(flow_id)
+                    await asyncio.sleep(0)
+
+        await limiter.acquire()
+        # 큰 작업이 먼저 요청을 잔뜩 쌓아도 작은 작업이 번갈아 슬롯을 받음
+        jobs = [asyncio.create_task(request("big")) for _ in range(4)]
+        await asyncio.sleep(0)
+        jobs += [asyncio.create_task(request("small")) for _ in range(2)]
+        await asyncio.sleep(0)
+        limiter.release()
+        await asyncio.gather(*jobs)
+
+        assert order == ["big", "small", "big", "small", "big", "big"]
+        assert limiter.in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_priority_lane_uses_reserve(self):
+        from src.core.concurrency import FairShareLimiter, flow
+
+        limiter = FairShareLimiter("test", capacity=1, priority_reserve=1)
+        await limiter.acquire()
+
+        with flow("interactive", priority=True):
+            await asyncio.wait_for(limiter.acquire(), timeout=1)
+
+        # 일반 요청은 기다리다 취소돼도 슬롯을 새지 않음
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release()
+        limiter.release()
+
+        assert limiter.in_use == 0
+
+
+class TestAnalysisAgent:
+    """분석 에이전트 테스트"""
+
+    def _contents(self, n):
+        from src.models import BlogContent
+
+        return [
+            BlogContent(url=f"https://blog.naver.com/test/{i}", title=f"제목 {i}", content="본문 " * 50)
+            for i in range(n)
+        ]
+
+    def test_pack_batches_respects_limits(self):
+        from src.agents import AnalysisAgent
+
+        agent = AnalysisAgent({"api_key": "test"})
+        agent.batch_max_posts = 3
+        contents = self._contents(7)
+
+        batches = agent._pack_batches(contents, list(range(7)))
+
+        assert [len(b) for b in batches] == [3, 3, 1]
+        assert sum(batches, []) == list(range(7))
+
+    def test_parse_batch_response_skips_malformed(self):
+        from src.agents import AnalysisAgent
+
+        agent = AnalysisAgent({"api_key": "test"})
+        response = """[
+    {"index": 0, "sentiment_score": 0.5, "sentiment_label": "긍정", "summary": "요약", "content_type": "후기", "quality_score": 7},
+    {"index": 1, "sentiment_score": 0.5, "sentiment_label": "알 수 없음", "summary": "요약", "content_type": "후기", "quality_score": 7},
+    {"index": 2, "sentiment_score": "잘못된 값"}
+]"""
+
+        parsed = agent._parse_batch_response(response, ["u0", "u1", "u2"])
+
+        assert list(parsed.keys()) == [0]
+        assert parsed[0].url == "u0"
+
+    @pytest.mark.asyncio
+    async def test_analyze_batched_retries_missing_only(self):
+        import json as _json
+        from src.agents import AnalysisAgent
+
+        agent = AnalysisAgent({"api_key": "test"})
+        agent._is_initialized = True
+        contents = self._contents(3)
+        prompts = []
+
+        async def fake_llm(prompt, schema=None):
+            assert schema["type"] == "array"
+            prompts.append(prompt)
+            count = prompt.count("### [")
+            # 첫 요청에서는 마지막 게시글 결과를 누락
+            indices = range(count - 1) if len(prompts) == 1 else range(count)
+            return _json.dumps([
+                {"index": i, "sentiment_score": 0.1, "sentiment_label": "중립", "summary": "s",
+                 "content_type": "기타", "quality_score": 5}
+                for i in indices
+            ])
+
+        progress = []
+
+        async def on_progress(done, total):
+            progress.append((done, total))
+
+        agent._call_llm = fake_llm
+        results = await agent.analyze_batched(contents, on_progress=on_progress)
+
+        assert all(r.success for r in results)
+        assert [r.data.url for r in results] == [c.url for c in contents]
+        assert len(prompts) == 2
+        assert prompts[1].count("### [") == 1
+        assert progress == [(2, 3), (3, 3)]
+
+    @pytest.mark.asyncio
+    async def test_analyze_retries_invalid_response_only(self):
+        import json as _json
+        from src.agents import AnalysisAgent
+        from src.agents.analysis_agent import LLM_RETRIES
+
+        agent = AnalysisAgent({"api_key": "test"})
+        agent._is_initialized = True
+        agent.model = "test-retry"
+        responses = [
+            "분석 결과입니다",
+            _json.dumps({"sentiment_score": 0.8, "sentiment_label": "긍정", "keywords": [],
+                         "summary": "s", "content_type": "후기", "is_ad": False, "quality_score": 8}),
+        ]
+
+        async def fake_llm(prompt, schema=None):
+            assert schema["required"]
+            return responses.pop(0)
+
+        agent._call_llm = fake_llm
+        result = await agent.analyze(self._contents(1)[0])
+
+        assert result.success and result.data.quality_score == 8
+        assert result.metadata["attempts"] == 2
+        assert LLM_RETRIES.value(model="test-retry", mode="single") == 1
+
+        async def failing_llm(prompt, schema=None):
+            raise RuntimeError("quota")
+
+        agent._call_llm = failing_llm
+        result = await agent.analyze(self._contents(1)[0])
+
+        # API 오류는 재시도하지 않고, 실패 결과를 기본값으로 채우지 않음
+        assert not result.success and result.data is None
+        assert LLM_RETRIES.value(model="test-retry", mode="single") == 1
+
+
+class TestLlmUsage:
+    """LLM 토큰/비용 기록 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_usage_attributed_to_task(self, tmp_path):
+        from types import SimpleNamespace
+        from src.core.concurrency import flow
+        from src.core.database import Database
+        from src.core.llm_usage import LLM_TOKENS
+        from src.models import TaskCreate
+        from src.services.orchestrator import Orchestrator
+
+        # 기본 DB가 아닌 DB를 쓰는 오케스트레이터도 사용량을 같은 DB에 기록하고 읽음
+        orchestrator = Orchestrator({"api_key": "test", "model": "test-usage"})
+        orchestrator._db = Database(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+        await orchestrator.initialize()
+        orchestrator.llm_usage.prices = {"test-usage": (1.0, 4.0)}
+        orchestrator.llm_usage.flush_interval = 3600
+        task = await orchestrator.create_task(TaskCreate(keyword="비용"))
+
+        class FakeModel:
+            def generate_content(self, prompt, generation_config=None):
+                usage = SimpleNamespace(prompt_token_count=1000, candidates_token_count=200)
+                return SimpleNamespace(text="{}", usage_metadata=usage)
+
+        agent = orchestrator.analysis_agent
+        agent._client = FakeModel()
+
+        with flow(task.id):
+            await agent._call_llm("프롬프트")
+            await agent._call_llm("프롬프트")
+        await agent._call_llm("작업 밖 호출")
+        await agent.cleanup()
+
+        status = await orchestrator.get_task_status(task.id)
+        await orchestrator.db.close()
+
+        assert status.llm_calls == 2
+        assert (status.prompt_tokens, status.output_tokens) == (2000, 400)
+        assert status.llm_cost_usd == pytest.approx(2000 * 1e-6 + 400 * 4e-6)
+        assert LLM_TOKENS.value(model="test-usage", kind="prompt") == 3000
+
+
+class TestBulkAnalysis:
+    """배치 작업 일괄 분석 테스트 (로컬 배치 서비스 대역 사용)"""
+
+    @pytest.mark.asyncio
+    async def test_bulk_analyze_saves_valid_and_resubmits_rest(self, tmp_path):
+        import json as _json
+        from sqlalchemy import select, func
+        from src.agents import AnalysisAgent
+        from src.core.database import Database, BlogPost, TaskPost, SearchTask, Analysis
+        from src.core.llm_usage import LlmUsageRecorder
+        from src.services.bulk_analysis import BulkAnalyzer, LocalBatchBackend
+
+        db = Database(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+        await db.init_db()
+        async with db.async_session() as session:
+            session.add(SearchTask(id="task-1", keyword="일괄"))
+            for i in range(3):
+                session.add(BlogPost(id=f"p{i}", task_id="task-1", url=f"https://blog.naver.com/a/{i}",
+                                     title=f"제목 {i}", content=f"본문 {i}"))
+                session.add(TaskPost(task_id="task-1", post_id=f"p{i}", rank=i))
+            await session.commit()
+
+        valid = _json.dumps({"sentiment_score": 0.5, "sentiment_label": "긍정", "keywords": [{"keyword": "일괄", "count": 2}],
+                             "summary": "s", "content_type": "후기", "is_ad": False, "quality_score": 7})
+        broken = {"https://blog.naver.com/a/1"}
+
+        def responder(request):
+            assert request["request"]["generationConfig"]["responseSchema"]["type"] == "OBJECT"
+            prompt = request["request"]["contents"][0]["parts"][0]["text"]
+            return "형식 오류" if any(f"URL: {url}\n" in prompt for url in broken) else valid
+
+        agent = AnalysisAgent({"api_key": "test", "model": "test-bulk"})
+        agent.usage = LlmUsageRecorder(db=db)
+        backend = LocalBatchBackend(responder, polls_until_done=2)
+        analyzer = BulkAnalyzer(db, agent, backend, work_dir=str(tmp_path / "batches"), poll_interval=0)
+
+        first = await analyzer.run("task-1")
+        broken.clear()
+        second = await analyzer.run("task-1")
+
+        async with db.async_session() as session:
+            analyses = (await session.execute(
+                select(func.count()).select_from(Analysis).where(Analysis.task_id == "task-1")
+            )).scalar_one()
+            task = await session.get(SearchTask, "task-1")
+            total_analyzed = task.total_analyzed
+            result_version = task.result_version
+            usage = await agent.usage.task_totals(session, "task-1")
+        await db.close()
+
+        assert (first["requests"], first["saved"], first["invalid"]) == (3, 2, 1)
+        assert (second["requests"], second["saved"]) == (1, 1)
+        assert analyses == total_analyzed == 3
+        assert result_version == 2
+        assert usage["calls"] == 4
+        assert len(backend.submitted) == 2
+        assert list((tmp_path / "batches").iterdir()) == []
+
+
+class TestLocalAnalyzer:
+    """로컬 사전 분석 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_ad_disclosure_and_keywords(self):
+        from src.agents import LocalAnalyzerAgent
+        from src.models import BlogContent, ContentType
+
+        agent = LocalAnalyzerAgent()
+        contents = [
+            BlogContent(url="u1", content="연희동 카페 후기입니다. 카페 분위기가 좋았고 커피도 맛있었어요. 이 글은 소정의 원고료를 받아 작성했습니다."),
+            BlogContent(url="u2", content="연희동 맛집 정리. 연희동 맛집 방문 일정 안내."),
+        ]
+
+        result = await agent.pre_analyze(contents)
+
+        ad, info = result.data
+        assert ad.result.is_ad
+        assert ad.result.content_type == ContentType.AD
+        assert "소정의 원고료" in ad.ad_phrases
+        assert not info.result.is_ad
+        assert {"keyword": "연희동", "count": 2} in info.result.keywords
+
+    @pytest.mark.asyncio
+    async def test_low_confidence_without_evidence(self):
+        from src.agents import LocalAnalyzerAgent
+        from src.models import BlogContent
+
+        agent = LocalAnalyzerAgent()
+        result = await agent.pre_analyze([BlogContent(url="u", content="오늘의 기록")])
+
+        assert result.data[0].confidence < 0.7
+
+    def test_negation_and_overlapping_terms(self):
+        from src.agents import LocalAnalyzerAgent
+
+        agent = LocalAnalyzerAgent()
+        negated, negated_confidence = agent._score_sentiment("맛있지 않았고 좋지 않았어요. 추천 안 합니다.")
+        overlapping, _ = agent._score_sentiment("직원이 불친절하고 비추천합니다.")
+
+        assert negated == -1.0
+        assert negated_confidence < 0.7
+        assert overlapping == -1.0
+
+    @pytest.mark.asyncio
+    async def test_needs_summary_per_post(self):
+        from src.agents import LocalAnalyzerAgent
+        from src.models import BlogContent
+
+        agent = LocalAnalyzerAgent()
+        result = await agent.pre_analyze([
+            BlogContent(url="short", content="짧은 후기. 좋았어요."),
+            BlogContent(url="long", content=" ".join(f"{i}번째 문장입니다." for i in range(10))),
+        ])
+
+        assert [pre.needs_summary for pre in result.data] == [False, True]
+
+    @pytest.mark.asyncio
+    async def test_posts_needing_summary_go_to_llm(self, tmp_path):
+        from src.agents.base import AgentResult
+        from src.core.database import Database, BlogPost
+        from src.models import BlogContent, AnalysisResult, SentimentLabel, ContentType
+        from src.services.orchestrator import Orchestrator
+
+        orchestrator = Orchestrator({"api_key": "test"})
+        orchestrator._db = Database(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+        await orchestrator.initialize()
+        sent = []
+
+        async def analyze(content):
+            sent.append(content.url)
+            return AgentResult(success=True, data=AnalysisResult(
+                url=content.url, sentiment_score=0.5, sentiment_label=SentimentLabel.POSITIVE,
+                summary="LLM 요약", content_type=ContentType.REVIEW, quality_score=7
+            ))
+
+        orchestrator.analysis_agent.analyze = analyze
+        # 확신도는 충분하지만 긴 글은 LLM 요약이 필요
+        review = "맛있고 친절하고 깔끔하고 만족, 가성비 최고 추천! 내돈내산 솔직 후기, 직접 다녀왔어요. 재방문 강추합니다."
+        contents = [
+            BlogContent(url="https://blog.naver.com/a/1", content=review),
+            BlogContent(url="https://blog.naver.com/a/2", content=review + " 더 자세한 이야기." * 5),
+        ]
+
+        async with orchestrator.db.async_session() as session:
+            session.add_all([BlogPost(task_id="task-1", url=c.url) for c in contents])
+            await session.flush()
+            saved = await orchestrator._run_analysis(session, "task-1", contents)
+            await session.commit()
+        await orchestrator.db.close()
+
+        assert saved == 2
+        assert sent == ["https://blog.naver.com/a/2"]
+
+    def test_aho_corasick_overlapping_matches(self):
+        from src.utils import AhoCorasick
+
+        matcher = AhoCorasick(["협찬", "협찬받아", "받아"])
+        counts = matcher.count("업체에서 협찬받아 작성")
+
+        assert counts == {"협찬": 1, "협찬받아": 1, "받아": 1}
+        assert matcher.find_longest("업체에서 협찬받아 작성") == [(5, "협찬받아")]
+
+
+class TestNearDuplicate:
+    """유사 중복 탐지 테스트"""
+
+    def test_simhash_near_copy(self):
+        from src.services.dedup import simhash, hamming_distance
+
+        base = "연희동 신축 아파트 분양 정보를 정리했습니다. 단지 규모와 교통, 학군까지 살펴보겠습니다. " * 5
+        copy = base + "문의는 댓글로 남겨주세요."
+        other = "주말에 다녀온 제주도 여행 후기입니다. 바다가 정말 예뻤고 음식도 맛있었어요. " * 5
+
+        assert hamming_distance(simhash(base), simhash(copy)) <= 3
+        assert hamming_distance(simhash(base), simhash(other)) > 10
+
+    def test_split_bands_roundtrip(self):
+        from src.services.dedup import split_bands, BAND_BITS
+
+        signature = 0x0123456789ABCDEF
+        bands = split_bands(signature)
+
+        assert sum(value << (i * BAND_BITS) for i, value in enumerate(bands)) == signature
+
+    @pytest.mark.asyncio
+    async def test_recrawl_rewrites_band_index(self, tmp_path):
+        from sqlalchemy import select
+        from src.core.database import Database, BlogPost, PostSignatureBand
+        from src.services.dedup import NearDuplicateDetector, simhash, split_bands
+
+        apartment = "연희동 신축 아파트 분양 정보를 정리했습니다. 단지 규모와 교통, 학군까지 살펴보겠습니다. " * 5
+        travel = "주말에 다녀온 제주도 여행 후기입니다. 바다가 정말 예뻤고 음식도 맛있었어요. " * 5
+
+        db = Database(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+        await db.init_db()
+        detector = NearDuplicateDetector(max_distance=3)
+        async with db.async_session() as session:
+            session.add_all([BlogPost(id=p, task_id="t", url=f"https://blog.naver.com/a/{p}") for p in ("p1", "p2")])
+            await session.flush()
+            await detector.assign_clusters(session, [("p1", apartment)])
+            await session.commit()
+
+            # 다시 수집한 p1의 본문이 바뀌면 밴드 색인도 새 서명으로 바뀜
+            await detector.assign_clusters(session, [("p1", travel)])
+            await session.commit()
+            bands = (await session.execute(
+                select(PostSignatureBand.band, PostSignatureBand.value).where(PostSignatureBand.post_id == "p1")
+            )).all()
+
+            clusters = await detector.assign_clusters(session, [("p2", travel + "문의는 댓글로.")])
+        await db.close()
+
+        assert sorted(bands) == list(enumerate(split_bands(simhash(travel))))
+        assert clusters == {"p2": "p1"}
+
+
+class TestContentCompression:
+    """본문 압축 저장 테스트"""
+
+    def test_codec_roundtrip_with_dictionary(self, tmp_path):
+        from src.core.compression import ContentCodec
+
+        codec = ContentCodec(dictionary_path=str(tmp_path / "content.zdict"))
+        samples = [f"연희동 아파트 분양 후기 {i}번째 글입니다. 교통과 학군이 좋아요. " * 20 for i in range(200)]
+        dict_id = codec.train_dictionary(samples, dict_size=4096)
+
+        data = codec.compress(samples[0])
+        reloaded = ContentCodec(dictionary_path=str(tmp_path / "content.zdict"))
+
+        assert len(data) < len(samples[0].encode("utf-8")) / 4
+        assert reloaded.decompress(data, dict_id) == samples[0]
+
+    def test_blog_post_transparent_content(self):
+        from src.core.database import BlogPost
+
+        post = BlogPost(url="https://blog.naver.com/test/1")
+        post.set_content("압축 저장 본문", compress=True)
+
+        assert post._content is None
+        assert post.content_blob is not None
+        assert post.has_content
+        assert post.content == "압축 저장 본문"
+
+    @pytest.mark.asyncio
+    async def test_content_blob_loaded_only_on_request(self, tmp_path):
+        from sqlalchemy import select
+        from sqlalchemy.exc import InvalidRequestError
+        from src.core.database import Database, BlogPost
+        from src.services.orchestrator import Orchestrator
+
+        db = Database(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+        await db.init_db()
+        async with db.async_session() as session:
+            post = BlogPost(task_id="t", url="https://blog.naver.com/test/1")
+            post.set_content("압축 저장 본문", compress=True)
+            session.add(post)
+            await session.commit()
+
+        async with db.async_session() as session:
+            post = (await session.execute(select(BlogPost))).scalar_one()
+            with pytest.raises(InvalidRequestError):
+                post.content
+            await Orchestrator({"api_key": "test"})._load_contents(session, [post])
+            content = post.content
+        await db.close()
+
+        assert content == "압축 저장 본문"
+
+
+class TestTaskAggregates:
+    """작업 집계 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_record_analysis_updates_summary(self, tmp_path):
+        from src.core.database import Database, Analysis
+        from src.services.aggregates import record_analysis, get_task_summary
+
+        db = Database(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+        await db.init_db()
+
+        async with db.async_session() as session:
+            for i, (label, is_ad) in enumerate([("긍정", True), ("긍정", False), ("부정", False)]):
+                analysis = Analysis(
+                    id=f"a{i}", post_id=f"p{i}", task_id="t1", url=f"u{i}",
+                    sentiment_score=0.5, sentiment_label=label, content_type="후기",
+                    is_ad=is_ad, quality_score=6,
+                    keywords=[{"keyword": "연희동", "count": 2}, {"keyword": f"k{i}", "count": 1}]
+                )
+                session.add(analysis)
+                await record_analysis(session, "t1", analysis)
+            await session.commit()
+
+            summary = await get_task_summary(session, "t1", top_n=1)
+
+        await db.close()
+
+        assert summary["analysis_count"] == 3
+        assert summary["sentiment"]["histogram"] == {"긍정": 2, "부정": 1}
+        assert summary["ad_ratio"] == pytest.approx(1 / 3)
+        assert summary["top_keywords"] == [{"keyword": "연희동", "count": 6, "post_count": 3}]
+
+
+class TestSearchIndex:
+    """전문 검색 색인 테스트"""
+
+    def test_ngram_tokenizer(self):
+        from src.core.search_index import CharNgramTokenizer
+
+        tokenizer = CharNgramTokenizer()
+
+        assert tokenizer.tokenize("연희동 카페 Cafe") == ["연희", "희동", "카페", "cafe"]
+        assert tokenizer.query_phrases("연희동에서") == [["연희", "희동"]]
+
+    @pytest.mark.asyncio
+    async def test_search_with_filters(self, tmp_path):
+        from src.core.database import Database, BlogPost, TaskPost
+        from src.core.search_index import SearchIndex
+
+        db = Database(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+        await db.init_db()
+        index = SearchIndex()
+
+        async with db.async_session() as session:
+            posts = [
+                BlogPost(id="p1", task_id="t1", url="u1", title="연희동 카페 후기", content="분위기 좋은 카페", post_date="20260110"),
+                BlogPost(id="p2", task_id="t2", url="u2", title="제주도 여행", content="연희동에서 출발한 여행", post_date="20260120"),
+                BlogPost(id="p3", task_id="t1", url="u3", title="맛집", content="서울 맛집 정리", post_date="20260130"),
+            ]
+            session.add_all(posts)
+            # p1은 두 작업이 공유
+            session.add_all([
+                TaskPost(task_id=task_id, post_id=post_id)
+                for task_id, post_id in [("t1", "p1"), ("t2", "p2"), ("t1", "p3"), ("t2", "p1")]
+            ])
+            await session.flush()
+            await index.index_posts(session, posts)
+            await session.commit()
+
+            all_matches = await index.search(session, "연희동")
+            filtered = await index.search(session, "연희동", task_id="t1", date_to="20260115")
+            shared = await index.search(session, "연희동", task_id="t2")
+
+        await db.close()
+
+        assert all_matches["total"] == 2
+        # 제목 일치가 본문 일치보다 높은 순위
+        assert all_matches["items"][0][0] == "p1"
+        assert [post_id for post_id, _ in filtered["items"]] == ["p1"]
+        assert shared["total"] == 2
+
+
+class TestTaskQueue:
+    """DB 작업 큐 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_claim_is_exclusive(self, tmp_path):
+        from src.core.database import Database, SearchTask
+        from src.services.task_queue import claim_next_task
+
+        db = Database(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+        await db.init_db()
+
+        async with db.async_session() as session:
+            session.add(SearchTask(id="t1", keyword="테스트", status="pending"))
+            await session.commit()
+
+        first = await claim_next_task(db, "worker-1")
+        second = await claim_next_task(db, "worker-2")
+
+        async with db.async_session() as session:
+            task = await session.get(SearchTask, "t1")
+
+        await db.close()
+
+        assert first == "t1"
+        assert second is None
+        assert task.worker_id == "worker-1"
+
+
+class TestMonitor:
+    """키워드 모니터링 테스트"""
+
+    def test_cron_next(self):
+        from datetime import datetime
+        from src.utils.cron import cron_next
+
+        after = datetime(2026, 1, 5, 10, 7, 30)  # 월요일
+        assert cron_next("*/15 * * * *", after) == datetime(2026, 1, 5, 10, 15)
+        assert cron_next("0 9 * * *", after) == datetime(2026, 1, 6, 9, 0)
+        assert cron_next("30 8 * * 0", after) == datetime(2026, 1, 11, 8, 30)
+
+        with pytest.raises(ValueError):
+            cron_next("61 * * * *", after)
+
+    def test_canonical_post_id(self):
+        from src.utils import canonical_post_id
+
+        assert canonical_post_id("https://blog.naver.com/user1/223") == "user1/223"
+        assert canonical_post_id("https://m.blog.naver.com/user1/223") == "user1/223"
+        assert canonical_post_id("https://blog.naver.com/PostView.naver?blogId=user1&logNo=223") == "user1/223"
+
+
+    @pytest.mark.asyncio
+    async def test_watermark_advances_only_on_completion(self, tmp_path):
+        from src.agents.base import AgentResult
+        from src.core.database import Database, KeywordWatermark
+        from src.models import BlogPostMeta, BlogContent, TaskCreate
+        from src.services.orchestrator import Orchestrator
+
+        orchestrator = Orchestrator({"api_key": "test"})
+        orchestrator._db = Database(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+        await orchestrator.initialize()
+        fail_crawl = [True]
+
+        async def search(search_input):
+            return AgentResult(success=True, data=[
+                BlogPostMeta(title="제목", link="https://blog.naver.com/a/1", description="",
+                             bloggername="b", bloggerlink="", postdate="20260101")
+            ])
+
+        async def crawl(urls, on_result=None):
+            if fail_crawl[0]:
+                raise RuntimeError("수집 실패")
+            for url in urls:
+                on_result(BlogContent(url=url, content="본문"))
+            return AgentResult(success=True, data=[])
+
+        async def seen_ids():
+            async with orchestrator.db.async_session() as session:
+                watermark = await session.get(KeywordWatermark, "모니터")
+                return list(watermark.seen_ids or [])
+
+        orchestrator.search_agent.run = search
+        orchestrator.crawler_agent.crawl = crawl
+
+        failed = await orchestrator.create_task(TaskCreate(keyword="모니터", task_type="monitor"))
+        with pytest.raises(RuntimeError):
+            await orchestrator.run_task(failed.id, analyze_content=False)
+        after_failure = await seen_ids()
+
+        fail_crawl[0] = False
+        completed = await orchestrator.create_task(TaskCreate(keyword="모니터", task_type="monitor"))
+        await orchestrator.run_task(completed.id, analyze_content=False)
+        after_completion = await seen_ids()
+        await orchestrator.db.close()
+
+        assert after_failure == []
+        assert after_completion == ["a/1"]
+
+
+    @pytest.mark.asyncio
+    async def test_concurrently_created_watermark_is_reused(self, tmp_path):
+        from src.core.database import Database, KeywordWatermark
+        from src.services.orchestrator import Orchestrator
+
+        orchestrator = Orchestrator({"api_key": "test"})
+        orchestrator._db = Database(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+        await orchestrator.initialize()
+
+        async with orchestrator.db.async_session() as session:
+            # 조회 직후 다른 작업이 같은 키워드의 기준점을 먼저 만든 상황
+            get = session.get
+
+            async def racing_get(model, key):
+                if not hasattr(racing_get, "raced"):
+                    racing_get.raced = True
+                    async with orchestrator.db.async_session() as other:
+                        other.add(KeywordWatermark(keyword=key, seen_ids=["a/1"]))
+                        await other.commit()
+                    return None
+                return await get(model, key)
+
+            session.get = racing_get
+            watermark = await orchestrator._load_watermark(session, "모니터")
+        await orchestrator.db.close()
+
+        assert watermark.seen_ids == ["a/1"]
+
+
+class TestBatchRun:
+    """다중 키워드 배치 실행 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_manifest_resume_skips_completed(self, tmp_path):
+        from datetime import datetime
+        from src.models import TaskResponse, TaskStatus
+        from src.services.batch import BatchManifest, run_batch
+
+        class StubOrchestrator:
+            def __init__(self):
+                self.ran = []
+
+            async def initialize(self):
+                pass
+
+            async def create_task(self, task_input):
+                return TaskResponse(id=f"task-{task_input.keyword}", status=TaskStatus.PENDING, keyword=task_input.keyword,
+                                    created_at=datetime.now())
+
+            async def run_task(self, task_id, crawl_content=True, analyze_content=True):
+                self.ran.append(task_id)
+                if task_id == "task-실패":
+                    raise RuntimeError("검색 실패")
+                return TaskResponse(id=task_id, status=TaskStatus.COMPLETED, keyword=task_id,
+                                    total_found=3, created_at=datetime.now())
+
+        path = str(tmp_path / "manifest.json")
+        first = StubOrchestrator()
+        counts = await run_batch(first, ["카페", "실패", "맛집"], parallel=2, manifest=BatchManifest(path))
+        assert counts == {"completed": 2, "failed": 1, "skipped": 0}
+
+        second = StubOrchestrator()
+        counts = await run_batch(second, ["카페", "실패", "맛집"], parallel=2, manifest=BatchManifest(path))
+        assert counts == {"completed": 0, "failed": 1, "skipped": 2}
+        assert second.ran == ["task-실패"]
+
+    @pytest.mark.asyncio
+    async def test_timeout_sets_deadline_per_keyword(self):
+        from datetime import datetime, timedelta
+        from src.models import TaskResponse, TaskStatus
+        from src.services.batch import run_batch
+
+        deadlines = []
+
+        class StubOrchestrator:
+            async def initialize(self):
+                pass
+
+            async def create_task(self, task_input):
+                deadlines.append(task_input.deadline)
+                return TaskResponse(id=f"task-{task_input.keyword}", status=TaskStatus.PENDING,
+                                    keyword=task_input.keyword, created_at=datetime.now())
+
+            async def run_task(self, task_id, crawl_content=True, analyze_content=True):
+                return TaskResponse(id=task_id, status=TaskStatus.COMPLETED, keyword=task_id, created_at=datetime.now())
+
+        started = datetime.now()
+        await run_batch(StubOrchestrator(), ["카페", "맛집"], timeout=60)
+
+        assert len(deadlines) == 2
+        assert all(started + timedelta(seconds=59) < d <= datetime.now() + timedelta(seconds=60) for d in deadlines)
+
+
+class TestApiResponses:
+    """응답 압축/ETag 테스트"""
+
+    def test_gzip_etag_revalidation(self):
+        from datetime import datetime
+        from fastapi import FastAPI, Request
+        from fastapi.testclient import TestClient
+        from src.api.caching import task_etag, etag_matches, not_modified, cached_json
+        from src.api.responses import CompressionMiddleware, ORJSONResponse
+        from src.models import TaskResponse, TaskStatus
+
+        app = FastAPI(default_response_class=ORJSONResponse)
+        app.add_middleware(CompressionMiddleware, minimum_size=100)
+        task = TaskResponse(id="t1", status=TaskStatus.COMPLETED, keyword="카페",
+                            created_at=datetime(2026, 1, 1), completed_at=datetime(2026, 1, 2))
+
+        @app.get("/posts")
+        async def posts(request: Request):
+            etag = task_etag(task, request)
+            if etag_matches(request, etag):
+                return not_modified(request, etag)
+            return cached_json({"posts": ["카페 후기"] * 50, "at": task.completed_at}, etag)
+
+        client = TestClient(app)
+        first = client.get("/posts", headers={"Accept-Encoding": "gzip"})
+        assert first.headers["content-encoding"] == "gzip"
+        assert first.headers["etag"].endswith('-gzip"')
+        assert first.json()["at"] == "2026-01-02T00:00:00"
+
+        second = client.get("/posts", headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]})
+        assert second.status_code == 304
+        assert second.headers["etag"] == first.headers["etag"]
+
+        # 완료 후 결과가 바뀌면(일괄 분석 등) ETag도 바뀜
+        task.result_version += 1
+        third = client.get("/posts", headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]})
+        assert third.status_code == 200
+        assert third.headers["etag"] != first.headers["etag"]
+
+
+class TestSingleFlight:
+    """동시 요청 합치기 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        from src.utils import SingleFlight
+
+        flight = SingleFlight(ttl=60)
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "결과"
+
+        results = await asyncio.gather(*(flight.do("url", work) for _ in range(5)))
+        assert results == ["결과"] * 5
+        assert len(calls) == 1
+
+        # 기억된 결과 재사용
+        assert await flight.do("url", work) == "결과"
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_memoized(self):
+        from src.utils import SingleFlight
+
+        flight = SingleFlight(ttl=60)
+        calls = []
+
+        async def fail():
+            calls.append(1)
+            raise RuntimeError("크롤링 실패")
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await flight.do("url", fail)
+        assert len(calls) == 2
+
+
+class TestAnalysisStream:
+    """일괄 분석 스트리밍 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_results_stream_in_completion_order(self):
+        from src.agents.base import AgentResult
+        from src.models import BlogContent, AnalysisResult, SentimentLabel, ContentType
+        from src.services.orchestrator import Orchestrator
+
+        orchestrator = Orchestrator({"api_key": "test"})
+        crawl_calls = []
+        crawl_done = []
+
+        async def crawl(urls, on_result=None):
+            crawl_calls.append(list(urls))
+            contents = [BlogContent(url=u, content="본문") for u in urls if "fail" not in u]
+            for content in contents:
+                on_result(content)
+                await asyncio.sleep(0.02)
+            crawl_done.append(True)
+            return AgentResult(success=True, data=contents)
+
+        async def analyze(content):
+            await asyncio.sleep(0.1 if "slow" in content.url else 0)
+            return AgentResult(success=True, data=AnalysisResult(
+                url=content.url, sentiment_score=0.0, sentiment_label=SentimentLabel.NEUTRAL,
+                summary="요약", content_type=ContentType.INFO, quality_score=5
+            ))
+
+        orchestrator.crawler_agent.crawl = crawl
+        orchestrator.analysis_agent.analyze = analyze
+
+        urls = ["https://blog.naver.com/a/1", "https://blog.naver.com/fail/2", "https://blog.naver.com/slow/3"]
+        items = []
+        async for item in orchestrator.analyze_urls_stream(urls):
+            items.append((item, bool(crawl_done)))
+
+        # 먼저 수집된 게시글은 수집이 끝나기 전에 결과가 나옴
+        assert [(item["url"], done) for item, done in items] == [
+            (urls[0], False), (urls[1], True), (urls[2], True)
+        ]
+        assert items[1][0]["error"] and items[1][0]["result"] is None
+        assert len(crawl_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_inflight_analysis(self):
+        from src.agents.base import AgentResult
+        from src.models import BlogContent
+        from src.services.orchestrator import Orchestrator
+
+        orchestrator = Orchestrator({"api_key": "test"})
+        cancelled = []
+
+        async def crawl(urls, on_result=None):
+            for url in urls:
+                on_result(BlogContent(url=url, content="본문"))
+            return AgentResult(success=True, data=[])
+
+        async def analyze(content):
+            if "slow" not in content.url:
+                return AgentResult(success=False, error="실패")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(content.url)
+                raise
+
+        orchestrator.crawler_agent.crawl = crawl
+        orchestrator.analysis_agent.analyze = analyze
+
+        stream = orchestrator.analyze_urls_stream(["https://blog.naver.com/a/1", "https://blog.naver.com/slow/2"])
+        first = await stream.__anext__()
+        await stream.aclose()
+        await asyncio.sleep(0.05)
+
+        assert first["url"] == "https://blog.naver.com/a/1"
+        assert cancelled == ["https://blog.naver.com/slow/2"]
+
+
+class TestContentReuse:
+    """작업 간 본문 재사용 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_second_task_crawls_only_new_urls(self, tmp_path):
+        from sqlalchemy import select, func
+        from src.agents.base import AgentResult
+        from src.core.database import Database, BlogPost, TaskPost
+        from src.models import BlogPostMeta, BlogContent, TaskCreate
+        from src.services.orchestrator import Orchestrator
+
+        orchestrator = Orchestrator({"api_key": "test"})
+        orchestrator._db = Database(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+        await orchestrator.initialize()
+        found, crawled = [], []
+
+        async def search(search_input):
+            return AgentResult(success=True, data=[
+                BlogPostMeta(title="제목", link=url, description="", bloggername="b", bloggerlink="", postdate="20260101")
+                for url in found
+            ])
+
+        async def crawl(urls, on_result=None):
+            crawled.append(list(urls))
+            contents = [BlogContent(url=u, content=f"{u} 본문") for u in urls]
+            for content in contents:
+                on_result(content)
+            return AgentResult(success=True, data=contents)
+
+        orchestrator.search_agent.run = search
+        orchestrator.crawler_agent.crawl = crawl
+
+        found[:] = ["https://blog.naver.com/a/1", "https://blog.naver.com/a/2"]
+        first = await orchestrator.create_task(TaskCreate(keyword="첫 작업"))
+        await orchestrator.run_task(first.id, analyze_content=False)
+
+        found[:] = ["https://blog.naver.com/a/2", "https://blog.naver.com/a/3"]
+        second = await orchestrator.create_task(TaskCreate(keyword="둘째 작업"))
+        result = await orchestrator.run_task(second.id, analyze_content=False)
+
+        async with orchestrator.db.async_session() as session:
+            post_count = (await session.execute(select(func.count()).select_from(BlogPost))).scalar_one()
+            links = (await session.execute(
+                select(TaskPost.post_id, TaskPost.reused).where(TaskPost.task_id == second.id)
+            )).all()
+
+        await orchestrator.db.close()
+
+        assert crawled[1] == ["https://blog.naver.com/a/3"]
+        assert result.total_crawled == 2
+        assert post_count == 3
+        assert sorted(reused for _, reused in links) == [False, True]
+
+
+    @pytest.mark.asyncio
+    async def test_backfill_task_posts_for_old_database(self, tmp_path):
+        from sqlalchemy import select, text
+        from src.core.database import Database, BlogPost, TaskPost
+
+        db = Database(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+        await db.init_db()
+        async with db.async_session() as session:
+            session.add(BlogPost(id="p1", task_id="t1", url="https://blog.naver.com/a/1"))
+            await session.commit()
+        # task_posts 도입 전 DB
+        async with db.engine.begin() as conn:
+            await conn.execute(text("DROP TABLE task_posts"))
+
+        await db.init_db()
+        async with db.async_session() as session:
+            links = (await session.execute(select(TaskPost.task_id, TaskPost.post_id, TaskPost.reused))).all()
+        await db.close()
+
+        assert links == [("t1", "p1", False)]
+
+
+class TestTaskCancellation:
+    """작업 취소/마감 테스트"""
+
+    async def _orchestrator(self, tmp_path):
+        from src.agents.base import AgentResult
+        from src.core.database import Database
+        from src.models import BlogPostMeta, BlogContent
+        from src.services.orchestrator import Orchestrator
+
+        orchestrator = Orchestrator({"api_key": "test"})
+        orchestrator._db = Database(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+        await orchestrator.initialize()
+
+        async def search(search_input):
+            return AgentResult(success=True, data=[
+                BlogPostMeta(title="제목", link=f"https://blog.naver.com/a/{i}", description="",
+                             bloggername="b", bloggerlink="", postdate="20260101")
+                for i in range(3)
+            ])
+
+        async def crawl(urls, on_result=None):
+            # 첫 게시글만 수집하고 나머지는 응답이 오지 않는 상황
+            on_result(BlogContent(url=urls[0], content="본문"))
+            await asyncio.sleep(60)
+
+        orchestrator.search_agent.run = search
+        orchestrator.crawler_agent.crawl = crawl
+        return orchestrator
+
+    @pytest.mark.asyncio
+    async def test_deadline_keeps_partial_results(self, tmp_path):
+        from datetime import datetime, timedelta
+        from sqlalchemy import select
+        from src.core.database import BlogPost
+        from src.models import TaskCreate, TaskStatus
+
+        orchestrator = await self._orchestrator(tmp_path)
+        task = await orchestrator.create_task(
+            TaskCreate(keyword="마감", deadline=datetime.now() + timedelta(seconds=0.3))
+        )
+        result = await asyncio.wait_for(orchestrator.run_task(task.id, analyze_content=False), timeout=5)
+
+        async with orchestrator.db.async_session() as session:
+            posts = (await session.execute(select(BlogPost))).scalars().all()
+        status = await orchestrator.get_task_status(task.id)
+        await orchestrator.db.close()
+
+        assert result.status == TaskStatus.TIMED_OUT
+        assert status.status == TaskStatus.TIMED_OUT
+        assert status.total_crawled == 1
+        assert [p.url for p in posts if p.has_content] == ["https://blog.naver.com/a/0"]
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_and_pending_tasks(self, tmp_path):
+        from src.models import TaskCreate, TaskStatus
+
+        orchestrator = await self._orchestrator(tmp_path)
+        running = await orchestrator.create_task(TaskCreate(keyword="실행 중"))
+        pending = await orchestrator.create_task(TaskCreate(keyword="대기 중"))
+
+        job = asyncio.create_task(orchestrator.run_task(running.id, analyze_content=False))
+        await asyncio.sleep(0.2)
+        await orchestrator.cancel_task(running.id)
+        result = await asyncio.wait_for(job, timeout=5)
+
+        cancelled = await orchestrator.cancel_task(pending.id)
+        await orchestrator.db.close()
+
+        assert result.status == TaskStatus.CANCELLED
+        assert cancelled.status == TaskStatus.CANCELLED
+
+
 class TestModels:
     """데이터 모델 테스트"""
 
@@ -74,6 +1428,26 @@ class TestModels:
         assert content.title == "테스트 제목"
         assert content.method == "httpx"  # 기본값
 
+    def test_records_convert_to_models(self):
+        from src.models import AnalysisInput, BlogContent, ContentRecord, PostMetaRecord
+
+        record = ContentRecord(url="https://blog.naver.com/test/123", content="본문", images=["a.jpg"])
+        assert not hasattr(record, "__dict__")
+        assert record.to_model() == BlogContent(
+            url=record.url, content="본문", images=["a.jpg"], crawled_at=record.crawled_at
+        )
+        # API 경계(에이전트 입력)에서는 레코드를 그대로 넘겨도 모델로 검증됨
+        assert isinstance(AnalysisInput(content=record).content, BlogContent)
+
+        meta = PostMetaRecord("제목", "link", "설명", "블로거", "", "20240101").to_model()
+        assert meta.postdate == "20240101"
+
+    def test_records_lighter_than_models(self):
+        from benchmarks.records import compare
+
+        for kinds in compare(2000).values():
+            assert kinds["record"]["bytes_per_item"] < kinds["pydantic"]["bytes_per_item"]
+
     def test_analysis_result_model(self):
         from src.models import AnalysisResult, SentimentLabel, ContentType
 
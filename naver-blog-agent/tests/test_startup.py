@@ -0,0 +1,26 @@
+import pytest
+
+from benchmarks.startup import (
+    heavy_modules_loaded,
+    measure_api_ready,
+    measure_cli_search,
+)
+
+
+class TestStartupImports:
+    """기동 경로 import 테스트 (시간 예산은 benchmarks/startup.py에서 확인)"""
+
+    def test_cli_search_cold_start(self):
+        result = measure_cli_search()
+
+        assert heavy_modules_loaded(result["modules"]) == []
+        assert "sqlalchemy" not in result["modules"]
+
+    def test_api_ready(self):
+        result = measure_api_ready()
+
+        assert heavy_modules_loaded(result["modules"]) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])